@@ -0,0 +1,67 @@
+"""
+Compares the serializer of the task system with `dill`, which it replaced.
+
+Run with `python benchmarks/serialization.py`.  Each payload is pickled and unpickled repeatedly, and the best time
+of a round trip is reported in milliseconds.
+"""
+
+from collections.abc import Callable
+from timeit import repeat
+from typing import Any
+
+from dill import dumps as dumps_dill
+from dill import loads as loads_dill
+from numpy import arange, uint8
+
+from foundry.core.serialization import dumps, loads
+from foundry.core.tasks import Task, WorkerTask
+
+
+def _render(rom: bytearray, level: int) -> int:
+    return rom[level]
+
+
+def _payloads() -> dict[str, Any]:
+    offset = 1
+
+    def closure(value: int) -> int:
+        return value + offset
+
+    rom = bytearray(range(256)) * 2048
+    return {
+        "small task": WorkerTask(Task(_render, 1), [bytearray(16), 3]),
+        "rom task": WorkerTask(Task(_render, 2), [rom, 3]),
+        "closure task": WorkerTask(Task(closure, 3), [5]),
+        "objects": [(index, str(index), [index, index + 1]) for index in range(10_000)],
+        "rgb buffer": arange(256 * 256 * 3, dtype=uint8).reshape((256, 256, 3)),
+    }
+
+
+def _time(dump: Callable[[Any], bytes], load: Callable[[bytes], Any], payload: Any, number: int) -> float:
+    return min(repeat(lambda: load(dump(payload)), number=number, repeat=5)) / number * 1000
+
+
+def benchmark(number: int = 20) -> str:
+    """
+    Times a round trip of each payload with `dill` and the serializer of the task system.
+
+    Parameters
+    ----------
+    number : int, optional
+        The amount of round trips timed at once, by default 20.
+
+    Returns
+    -------
+    str
+        A table with the time of a round trip of each payload in milliseconds.
+    """
+    lines = [f"{'payload':<14} {'dill ms':>10} {'task ms':>10} {'speed up':>10}"]
+    for name, payload in _payloads().items():
+        dill_time = _time(dumps_dill, loads_dill, payload, number)
+        task_time = _time(dumps, loads, payload, number)
+        lines.append(f"{name:<14} {dill_time:>10.3f} {task_time:>10.3f} {dill_time / task_time:>9.1f}x")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(benchmark())
@@ -1,12 +1,9 @@
 import json
-import urllib.error
-import urllib.request
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, Any, Union
 
-from pkg_resources import DistributionNotFound, require
-from PySide6.QtCore import QUrl
-from PySide6.QtGui import QDesktopServices, QIcon
+if TYPE_CHECKING:
+    from PySide6.QtCore import QUrl
 
 root_dir = Path(__file__).parent
 
@@ -21,6 +18,8 @@ file_settings_path.mkdir(parents=True, exist_ok=True)
 auto_save_path = home_dir / "auto_save"
 auto_save_path.mkdir(parents=True, exist_ok=True)
 
+definitions_cache_path = home_dir / "definitions_cache"
+
 auto_save_rom_path = auto_save_path / "auto_save.nes"
 auto_save_m3l_path = auto_save_path / "auto_save.m3l"
 auto_save_level_data_path = auto_save_path / "level_data.json"
@@ -45,21 +44,37 @@ github_link = "https://github.com/TheJoeSmo/Foundry"
 github_issue_link = "https://github.com/TheJoeSmo/Foundry/issues"
 discord_link = "https://discord.gg/pm87gm7"
 
-enemy_compat_link = QUrl.fromLocalFile(str(doc_dir.joinpath("SMB3 enemy compatibility.html")))
+# Qt and the network are only imported once required, so scripts and workers which parse a ROM do not pay for them.
+
+
+def __getattr__(name: str) -> Any:
+    if name == "enemy_compat_link":
+        from PySide6.QtCore import QUrl
+
+        return QUrl.fromLocalFile(str(doc_dir.joinpath("SMB3 enemy compatibility.html")))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def open_url(url: str | QUrl):
+def open_url(url: "str | QUrl"):
+    from PySide6.QtCore import QUrl
+    from PySide6.QtGui import QDesktopServices
+
     QDesktopServices.openUrl(QUrl(url))
 
 
 def get_current_version_name() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
-        return require("foundry_smb3")[0].version
-    except DistributionNotFound:
+        return version("foundry_smb3")
+    except PackageNotFoundError:
         return "Unknown"
 
 
 def get_latest_version_name(timeout: int = 10) -> str:
+    import urllib.error
+    import urllib.request
+
     owner = "TheJoeSmo"
     repo = "Foundry"
 
@@ -79,6 +94,8 @@ def get_latest_version_name(timeout: int = 10) -> str:
 
 
 def icon(icon_name: str):
+    from PySide6.QtGui import QIcon
+
     icon_path = icon_dir / icon_name
     data_path = data_dir / icon_name
 
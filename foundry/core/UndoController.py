@@ -1,6 +1,9 @@
 from collections import deque
+from collections.abc import Callable
 from typing import Generic, Protocol, TypeVar
 
+from attr import attrs
+
 T = TypeVar("T")
 
 
@@ -125,3 +128,228 @@ class UndoController(Generic[T]):
         self.undo_stack.append(self.state)
         self._state = self.redo_stack.pop()
         return self.state
+
+
+D = TypeVar("D")
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True)
+class ByteDelta:
+    """
+    The difference between two byte strings.  Only the bytes in between the longest common prefix and suffix of
+    both strings are stored, which is small for most edits.
+
+    Attributes
+    ----------
+    prefix: int
+        The amount of bytes at the start, which are shared by both strings.
+    suffix: int
+        The amount of bytes at the end, which are shared by both strings.
+    difference: bytes
+        The bytes of the target, in between the prefix and suffix.
+    """
+
+    prefix: int
+    suffix: int
+    difference: bytes
+
+    def __len__(self) -> int:
+        return len(self.difference)
+
+    @classmethod
+    def from_bytes(cls, source: bytes | bytearray, target: bytes | bytearray) -> "ByteDelta":
+        """
+        Generates the difference required to turn the source into the target.
+
+        Parameters
+        ----------
+        source : bytes | bytearray
+            The bytes the difference will be applied to.
+        target : bytes | bytearray
+            The bytes the difference should produce.
+
+        Returns
+        -------
+        ByteDelta
+            The difference between the source and the target.
+        """
+        shortest = min(len(source), len(target))
+
+        prefix = 0
+        while prefix < shortest and source[prefix] == target[prefix]:
+            prefix += 1
+
+        suffix = 0
+        while suffix < shortest - prefix and source[-suffix - 1] == target[-suffix - 1]:
+            suffix += 1
+
+        return cls(prefix, suffix, bytes(target[prefix : len(target) - suffix]))
+
+    def apply(self, source: bytes | bytearray) -> bytearray:
+        """
+        Applies the difference to the source it was generated from.
+
+        Parameters
+        ----------
+        source : bytes | bytearray
+            The bytes the difference was generated from.
+
+        Returns
+        -------
+        bytearray
+            The target the difference was generated for.
+        """
+        return bytearray(source[: self.prefix]) + self.difference + source[len(source) - self.suffix :]
+
+
+class DeltaUndoController(Generic[T, D]):
+    """
+    A controller for handling both undo and redo, which only stores the differences between neighbouring
+    states instead of the states themselves.  The memory used by the history can be limited, in which case the
+    oldest states are forgotten first.
+
+    Parameters
+    ----------
+    Generic : T
+        The state being stored by the DeltaUndoController.
+    Generic : D
+        The difference between two states.
+    """
+
+    def __init__(
+        self,
+        initial_state: T,
+        difference: Callable[[T, T], D],
+        apply: Callable[[T, D], T],
+        size: Callable[[D], int] = len,  # type: ignore
+        memory_budget: int | None = None,
+    ):
+        self._state: T = initial_state
+        self._difference = difference
+        self._apply = apply
+        self._size = size
+        self.memory_budget = memory_budget
+        self.undo_stack: deque[D] = deque()
+        self.redo_stack: deque[D] = deque()
+        self._history_size = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.state}, {self.undo_stack}, {self.redo_stack})"
+
+    def __eq__(self, other) -> bool:
+        return (
+            self.state == other.state and self.undo_stack == other.undo_stack and self.redo_stack == other.redo_stack
+            if isinstance(other, DeltaUndoController)
+            else False
+        )
+
+    @property
+    def state(self) -> T:
+        return self._state
+
+    @property
+    def history_size(self) -> int:
+        """
+        The size of all the differences currently stored inside the undo and redo stack.
+
+        Returns
+        -------
+        int
+            The size of the history, as measured by the size function provided.
+        """
+        return self._history_size
+
+    def _push(self, stack: deque[D], source: T, target: T):
+        delta = self._difference(source, target)
+        stack.append(delta)
+        self._history_size += self._size(delta)
+
+    def _pop(self, stack: deque[D]) -> D:
+        delta = stack.pop()
+        self._history_size -= self._size(delta)
+        return delta
+
+    def _enforce_memory_budget(self):
+        if self.memory_budget is None:
+            return
+
+        # the oldest states and the states furthest in the future are the least likely to be needed
+        for stack in (self.undo_stack, self.redo_stack):
+            while stack and self._history_size > self.memory_budget:
+                self._history_size -= self._size(stack.popleft())
+
+    def do(self, new_state: T) -> T:
+        """
+        Does an action through the controller, adding the difference to the undo stack and clearing the redo
+        stack, respectively.
+
+        Parameters
+        ----------
+        new_state : T
+            The new state to be stored.
+
+        Returns
+        -------
+        T
+            The new state that has been stored.
+        """
+        self._push(self.undo_stack, new_state, self.state)
+        self._history_size -= sum(self._size(delta) for delta in self.redo_stack)
+        self.redo_stack = deque()
+        self._state = new_state
+        self._enforce_memory_budget()
+        return self.state
+
+    @property
+    def can_undo(self) -> bool:
+        """
+        Determines if there is any states inside the undo stack.
+
+        Returns
+        -------
+        bool
+            If there is an undo state available.
+        """
+        return bool(len(self.undo_stack))
+
+    def undo(self) -> T:
+        """
+        Undoes the last state, bring the previous.
+
+        Returns
+        -------
+        T
+            The new state that has been stored.
+        """
+        previous_state = self._apply(self.state, self._pop(self.undo_stack))
+        self._push(self.redo_stack, previous_state, self.state)
+        self._state = previous_state
+        self._enforce_memory_budget()
+        return self.state
+
+    @property
+    def can_redo(self) -> bool:
+        """
+        Determines if there is any states inside the redo stack.
+
+        Returns
+        -------
+        bool
+            If there is an redo state available.
+        """
+        return bool(len(self.redo_stack))
+
+    def redo(self) -> T:
+        """
+        Redoes the previously undone state.
+
+        Returns
+        -------
+        T
+            The new state that has been stored.
+        """
+        next_state = self._apply(self.state, self._pop(self.redo_stack))
+        self._push(self.undo_stack, next_state, self.state)
+        self._state = next_state
+        self._enforce_memory_budget()
+        return self.state
@@ -1,15 +1,88 @@
 from __future__ import annotations
 
 import contextlib
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
 from reprlib import recursive_repr
 from typing import Any, TypeVar
+from weakref import WeakValueDictionary
 
-from attr import attrs
+from attr import attrs, field
 
 _CMV = TypeVar("_CMV", bound="ChainMapView")
 
 
+class VersionedDict(dict):
+    """
+    A dict which counts the changes made to it and notifies its observers, so a cache derived from its keys can be
+    invalidated once it changes.
+
+    Attributes
+    ----------
+    version: int
+        The number of changes made to the dict.
+    """
+
+    version: int = 0
+    _observers: WeakValueDictionary[int, ChainMap] | None = None
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._changed()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def observe(self, observer: ChainMap) -> None:
+        """
+        Invalidates an observer each time the dict changes, for as long as the observer exists.
+
+        Parameters
+        ----------
+        observer : ChainMap
+            The chain map which indexes the keys of the dict.
+        """
+        if self._observers is None:
+            self._observers = WeakValueDictionary()
+        self._observers[id(observer)] = observer  # Chain maps are unhashable.
+
+    def _changed(self) -> None:
+        self.version += 1
+        if self._observers:
+            for observer in list(self._observers.values()):
+                observer.invalidate()
+
+
 @attrs(slots=True, auto_attribs=True, init=False, frozen=True, hash=False)
 class ChainMap(Mapping):
     """
@@ -26,19 +99,66 @@ class ChainMap(Mapping):
     -----
     Lookups search the underlying mappings successively until a key is found.
 
+    To avoid walking every mapping on each lookup, nested chain maps are flattened into their underlying mappings.
+    If every underlying mapping can be observed, such as a `VersionedDict`, every key is indexed to the first mapping
+    that contains it, so lookups do not scale with the depth of the chain.  The mappings invalidate the index when
+    they change, so validating the index does not scale with the mappings either.  Any other mapping cannot notify
+    the chain map of its changes, so chains containing one search the underlying mappings successively.
+    Values are always read from the mapping which owns the key, so replacing a value is seen immediately.
+
     This is derived from the original collections ChainMap, but abbreviated to
     use attrs and be frozen.
     """
 
     maps: tuple[Mapping]
+    _leaves: tuple[Mapping, ...] = field(init=False, eq=False, repr=False)
+    _is_indexed: bool = field(init=False, eq=False, repr=False)
+    _index: dict[Any, Mapping] | None = field(init=False, eq=False, repr=False)
 
     def __init__(self, *maps: Mapping):
-        object.__setattr__(self, "maps", maps)  # get around the frozen attribute.
+        # get around the frozen attribute.
+        object.__setattr__(self, "maps", maps)
+        object.__setattr__(self, "_leaves", tuple(_flatten_maps(maps)))
+        object.__setattr__(self, "_is_indexed", all(hasattr(mapping, "observe") for mapping in self._leaves))
+        object.__setattr__(self, "_index", None)
+        if self._is_indexed:
+            for mapping in self._leaves:
+                mapping.observe(self)
+
+    def invalidate(self) -> None:
+        """
+        Discards the index of the keys, as an underlying mapping has changed.
+        """
+        object.__setattr__(self, "_index", None)
+
+    def _get_index(self) -> dict[Any, Mapping]:
+        """
+        Provides a map of every key to the mapping which owns it, rebuilding it if any mapping has changed.
+
+        Returns
+        -------
+        dict[Any, Mapping]
+            The mapping which owns each key.
+        """
+        index = self._index
+        if index is None:
+            index = {}
+            for mapping in reversed(self._leaves):
+                index |= dict.fromkeys(mapping, mapping)
+            object.__setattr__(self, "_index", index)
+        return index
 
     def __missing__(self, key):
         raise KeyError(key)
 
     def __getitem__(self, key):
+        if self._is_indexed:
+            mapping = self._get_index().get(key)
+            if mapping is not None:
+                try:
+                    return mapping[key]
+                except KeyError:
+                    pass
         for mapping in self.maps:
             with contextlib.suppress(KeyError):
                 return mapping[key]  # can't use 'key in mapping' with defaultdict
@@ -48,15 +168,21 @@ class ChainMap(Mapping):
         return self[key] if key in self else default
 
     def __len__(self):
+        if self._is_indexed:
+            return len(self._get_index())
         return len(set().union(*self.maps))  # reuses stored hash values if possible
 
     def __iter__(self):
+        if self._is_indexed:
+            return iter(self._get_index())
         d = {}
         for mapping in reversed(self.maps):
             d |= dict.fromkeys(mapping)
         return iter(d)
 
     def __contains__(self, key):
+        if self._is_indexed:
+            return key in self._get_index()
         return any(key in m for m in self.maps)
 
     def __bool__(self):
@@ -114,19 +240,21 @@ class ChainMapView(Mapping):
         The underlying chain map to hide keys of.
     keys: Any
         The keys of the set, if `valid_keys` is not set.
-    valid_keys: set | None
+    valid_keys: frozenset | None
         The set of a valid keys.  If None and there are no `keys`, it is assumed that all keys are valid.
     """
 
     chain_map: ChainMap | ChainMapView
-    valid_keys: set
+    valid_keys: frozenset
 
     def __init__(self, mapping: Mapping, *keys: Any, valid_keys: set | None = None):
         # get around the frozen attribute.
         chain_map = mapping if isinstance(mapping, (ChainMap, ChainMapView)) else ChainMap(mapping)
         object.__setattr__(self, "chain_map", chain_map)
         object.__setattr__(
-            self, "valid_keys", valid_keys if valid_keys is not None else set(keys) or set(chain_map.keys())
+            self,
+            "valid_keys",
+            frozenset(valid_keys) if valid_keys is not None else frozenset(keys) or frozenset(chain_map.keys()),
         )
 
     def __missing__(self, key):
@@ -202,6 +330,31 @@ class ChainMapView(Mapping):
         return self.chain_map.maps
 
 
+def _flatten_maps(maps: Sequence[Mapping]) -> Iterator[Mapping]:
+    """
+    Provides the underlying mappings of a series of mappings, expanding any chain maps.
+
+    Parameters
+    ----------
+    maps : Sequence[Mapping]
+        The mappings to flatten.
+
+    Returns
+    -------
+    Iterator[Mapping]
+        The mappings in lookup order.
+
+    Notes
+    -----
+    Subclasses of `ChainMap` may define `__missing__`, so only exact chain maps are expanded.
+    """
+    for mapping in maps:
+        if type(mapping) is ChainMap:
+            yield from mapping._leaves
+        else:
+            yield mapping
+
+
 def sequence_to_pretty_str(values: Sequence) -> str:
     """
     Makes a sequence into an English readable string.
@@ -1,12 +1,14 @@
+from __future__ import annotations
+
 from collections.abc import Generator, Sequence
 from functools import cache, lru_cache
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from attr import attrs
-from PySide6.QtCore import QPoint
-from PySide6.QtGui import QColor, QImage, QPainter, Qt
+from numpy import frombuffer, uint8, unpackbits
 
+from foundry.core import qt
 from foundry.core.file import FilePath
 from foundry.core.geometry import Point, Rect, Size
 from foundry.core.graphics_set.GraphicsSet import GraphicsSet
@@ -26,6 +28,10 @@ from foundry.core.namespace import (
 )
 from foundry.core.painter.Painter import Painter
 from foundry.core.palette import Color, Palette, PaletteGroup
+from foundry.game.File import ROM
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QImage
 
 PIXELS: int = 64
 BYTES_PER_TILE: int = 16
@@ -38,8 +44,9 @@ PATTERN_LOCATIONS: tuple[Point, Point, Point, Point] = (
     Point(0, 8),
     Point(8, 8),
 )
+BLOCKS_PER_TSA_TABLE: int = 0x100
 MASK_COLOR = Color(0xFF, 0x33, 0xFF)
-SELECTION_OVERLAY_COLOR = QColor(20, 87, 159, 80)
+SELECTION_OVERLAY_COLOR = Color(20, 87, 159, 80)
 PIXEL_OFFSET = 8
 
 Pattern = tuple[int, int, int, int]
@@ -99,16 +106,17 @@ class _Tile:
         bytes
             That represent an RGB tile image.
         """
-        pixels = bytearray()
         assert isinstance(self.palette, Palette)
 
-        for pixel_index in self.pixels_indexes:
-            if not self.use_background_color and pixel_index == 0:
-                pixels.extend(MASK_COLOR.to_rgb_bytes())
-            else:
-                pixels.extend(self.palette[pixel_index, Color].to_rgb_bytes())
+        data = frombuffer(bytes(self), dtype=uint8)
+        pixel_indexes = (unpackbits(data[PIXEL_OFFSET : 2 * PIXEL_OFFSET]) << 1) | unpackbits(data[:PIXEL_OFFSET])
+
+        colors = self.palette.lut[:, :3]
+        if not self.use_background_color:
+            colors = colors.copy()
+            colors[0] = (MASK_COLOR.red, MASK_COLOR.green, MASK_COLOR.blue)
 
-        return bytes(pixels)
+        return colors[pixel_indexes].tobytes()
 
 
 def _tile_to_image(tile: _Tile, scale_factor: int = 1) -> QImage:
@@ -127,7 +135,7 @@ def _tile_to_image(tile: _Tile, scale_factor: int = 1) -> QImage:
     QImage
         That represents the tile.
     """
-    image = QImage(tile.pixels, TILE_SIZE.width, TILE_SIZE.height, QImage.Format.Format_RGB888)
+    image = qt.QImage(tile.pixels, TILE_SIZE.width, TILE_SIZE.height, qt.QImage.Format.Format_RGB888)
     return image.scaled(TILE_SIZE.width * scale_factor, TILE_SIZE.height * scale_factor)
 
 
@@ -205,6 +213,8 @@ class Block(ConcreteValidator, KeywordValidator):
     do_not_render: bool = False
     index: int | None = None
     size: ClassVar[Size] = BLOCK_SIZE
+    _tsa_tables: ClassVar[dict[int, tuple[Block, ...]]] = {}
+    _tsa_tables_generation: ClassVar[int] = -1
 
     @classmethod
     def from_tsa(cls, point: Point, index: int, tsa: bytes, do_not_render: bool = False):
@@ -217,6 +227,38 @@ class Block(ConcreteValidator, KeywordValidator):
         )
         return block
 
+    @classmethod
+    def tsa_table(cls, tileset: int) -> tuple[Block, ...]:
+        """
+        Provides every block defined by the TSA table of a tileset.
+
+        Parameters
+        ----------
+        tileset : int
+            The index of the tileset.
+
+        Returns
+        -------
+        tuple[Block, ...]
+            The blocks of the tileset at the origin, where each block is at the position of its index.
+
+        Notes
+        -----
+        The blocks are cached until the ROM changes, such as when the TSA table is written to, so finding a block of
+        the table does not read the ROM.
+        """
+        if Block._tsa_tables_generation != ROM.generation:
+            Block._tsa_tables.clear()
+            Block._tsa_tables_generation = ROM.generation
+
+        if (blocks := Block._tsa_tables.get(tileset)) is None:
+            tsa_data = bytes(ROM.get_tsa_data(tileset))
+            origin = Point(0, 0)
+            blocks = Block._tsa_tables[tileset] = tuple(
+                Block.from_tsa(origin, index, tsa_data) for index in range(BLOCKS_PER_TSA_TABLE)
+            )
+        return blocks
+
     @classmethod
     @validate(
         point=Point,
@@ -296,8 +338,10 @@ class BlockGroup(ConcreteValidator, KeywordValidator):
         QImage
             Of the block group and its respective blocks.
         """
-        image = QImage(self.size.width * scale_factor, self.size.height * scale_factor, QImage.Format.Format_RGB888)
-        image.fill(QColor(*MASK_COLOR))
+        image = qt.QImage(
+            self.size.width * scale_factor, self.size.height * scale_factor, qt.QImage.Format.Format_RGB888
+        )
+        image.fill(qt.QColor(*MASK_COLOR))
 
         with Painter(image) as p:
             for block in self.blocks:
@@ -356,7 +400,7 @@ def _block_to_image(block: _Block, scale_factor: int = 1, use_background_color:
     QImage
         That represents the block.
     """
-    image = QImage(BLOCK_SIZE.width, BLOCK_SIZE.height, QImage.Format.Format_RGB888)
+    image = qt.QImage(BLOCK_SIZE.width, BLOCK_SIZE.height, qt.QImage.Format.Format_RGB888)
     if use_background_color:
         image.fill(block.palette_group.background_color)
     else:
@@ -372,7 +416,7 @@ def _block_to_image(block: _Block, scale_factor: int = 1, use_background_color:
     ]
     with Painter(image) as p:
         for (pattern, point) in zip(patterns, PATTERN_LOCATIONS):
-            p.drawImage(QPoint(point.x, point.y), pattern)
+            p.drawImage(qt.QPoint(point.x, point.y), pattern)
     return image.scaled(scale_factor, scale_factor)
 
 
@@ -486,8 +530,10 @@ class SpriteGroup:
         )
 
     def image(self, scale_factor: int = 1) -> QImage:
-        image = QImage(self.size.width * scale_factor, self.size.height * scale_factor, QImage.Format.Format_RGB888)
-        image.fill(QColor(*MASK_COLOR))
+        image = qt.QImage(
+            self.size.width * scale_factor, self.size.height * scale_factor, qt.QImage.Format.Format_RGB888
+        )
+        image.fill(qt.QColor(*MASK_COLOR))
 
         with Painter(image) as p:
             for sprite in self.sprites:
@@ -550,8 +596,8 @@ def _sprite_to_image(sprite: _Sprite, scale_factor: int = 1) -> QImage:
     QImage
         That represents the sprite.
     """
-    image: QImage = QImage(SPRITE_SIZE.width, SPRITE_SIZE.height, QImage.Format.Format_RGB888)
-    image.fill(QColor(*MASK_COLOR))
+    image: QImage = qt.QImage(SPRITE_SIZE.width, SPRITE_SIZE.height, qt.QImage.Format.Format_RGB888)
+    image.fill(qt.QColor(*MASK_COLOR))
 
     top_tile: QImage = tile_to_image(sprite.index, sprite.palette_group[sprite.palette_index], sprite.graphics_set)
     bottom_tile: QImage = tile_to_image(
@@ -562,9 +608,9 @@ def _sprite_to_image(sprite: _Sprite, scale_factor: int = 1) -> QImage:
         top_tile, bottom_tile = bottom_tile, top_tile
 
     with Painter(image) as p:
-        p.drawImage(QPoint(0, 0), top_tile.copy().mirrored(sprite.horizontal_mirror, sprite.vertical_mirror))
+        p.drawImage(qt.QPoint(0, 0), top_tile.copy().mirrored(sprite.horizontal_mirror, sprite.vertical_mirror))
         p.drawImage(
-            QPoint(0, TILE_SIZE.height),
+            qt.QPoint(0, TILE_SIZE.height),
             bottom_tile.copy().mirrored(sprite.horizontal_mirror, sprite.vertical_mirror),
         )
 
@@ -630,6 +676,17 @@ class Drawable(ConcreteValidator, KeywordValidator):
     base_image: QImage
     point_offset: Point = Point(0, 0)
 
+    def __reduce__(self):
+        image = self.base_image
+        return _drawable_from_bits, (
+            bytes(image.constBits()),
+            image.width(),
+            image.height(),
+            image.bytesPerLine(),
+            image.format(),
+            self.point_offset,
+        )
+
     @property
     def size(self) -> Size:
         return Size.from_qt(self.base_image.size())
@@ -657,7 +714,7 @@ class Drawable(ConcreteValidator, KeywordValidator):
         assert use_transparency
         image = image if image_offset is None else image.copy(image_offset.to_qt())
         if use_transparency:
-            mask: QImage = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
+            mask: QImage = image.createMaskFromColor(qt.QColor(*MASK_COLOR).rgb(), qt.Qt.MaskMode.MaskOutColor)
             image.setAlphaChannel(mask)
         return cls(image, point_offset)
 
@@ -669,7 +726,7 @@ class Drawable(ConcreteValidator, KeywordValidator):
         use_transparency: bool = True,
         point_offset: Point = Point(0, 0),
     ):
-        return cls.from_image(QImage(path), image_offset, use_transparency, point_offset)
+        return cls.from_image(qt.QImage(path), image_offset, use_transparency, point_offset)
 
     @classmethod
     @validate(
@@ -682,11 +739,20 @@ class Drawable(ConcreteValidator, KeywordValidator):
         return cls.from_file(path, image_offset, use_transparency, point_offset)
 
 
+def _drawable_from_bits(
+    bits: bytes, width: int, height: int, bytes_per_line: int, format: QImage.Format, point_offset: Point
+) -> Drawable:
+    """
+    Recreates a pickled drawable from the raw pixels of its image, which avoids decoding its image file again.
+    """
+    return Drawable(qt.QImage(bits, width, height, bytes_per_line, format).copy(), point_offset)
+
+
 def apply_selection_overlay(image: QImage, mask: QImage):
     overlay = image.copy()
-    overlay.fill(SELECTION_OVERLAY_COLOR)
+    overlay.fill(SELECTION_OVERLAY_COLOR.to_qt())
     overlay.setAlphaChannel(mask)
 
-    _painter = QPainter(image)
-    _painter.drawImage(QPoint(), overlay)
+    _painter = qt.QPainter(image)
+    _painter.drawImage(qt.QPoint(), overlay)
     _painter.end()
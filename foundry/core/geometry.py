@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 from math import sqrt
-from typing import Self
+from typing import TYPE_CHECKING, Self
 
 from attr import attrs, evolve, field
 from attr.validators import ge
-from PySide6.QtCore import QPoint, QPointF, QRect, QSize
 
+from foundry.core import qt
 from foundry.core.namespace import (
     ConcreteValidator,
     IntegerValidator,
@@ -17,6 +17,9 @@ from foundry.core.namespace import (
     validate,
 )
 
+if TYPE_CHECKING:
+    from PySide6.QtCore import QPoint, QPointF, QRect, QSize
+
 
 @attrs(slots=True, auto_attribs=True, eq=False, frozen=True, hash=False)
 class Vector2D:
@@ -253,7 +256,7 @@ class Point(ConcreteValidator, KeywordValidator, Vector2D, Bound):
         Self
             Of the QPoint represented inside Python.
         """
-        if isinstance(point, QPointF):
+        if isinstance(point, qt.QPointF):
             return cls(int(point.x()), int(point.y()))
         return cls(point.x(), point.y())
 
@@ -287,7 +290,7 @@ class Point(ConcreteValidator, KeywordValidator, Vector2D, Bound):
         QPoint
             The point in Qt's framework.
         """
-        return QPoint(self.x, self.y)
+        return qt.QPoint(self.x, self.y)
 
 
 @attrs(slots=True, auto_attribs=True, eq=True, frozen=True, hash=True)
@@ -485,7 +488,7 @@ class Size(ConcreteValidator, KeywordValidator, Vector2D):
         QSize
             The QSize derived from the Size.
         """
-        return QSize(self.width, self.height)
+        return qt.QSize(self.width, self.height)
 
 
 class SimpleBound(Bound):
@@ -678,4 +681,4 @@ class Rect(ConcreteValidator, KeywordValidator, SimpleBound):
             QRect
                 The QRect derived from the Rect.
         """
-        return QRect(self.point.x, self.point.y, self.size.width, self.size.height)
+        return qt.QRect(self.point.x, self.point.y, self.size.width, self.size.height)
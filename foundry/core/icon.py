@@ -22,7 +22,16 @@ class Icon(QIcon, ConcreteValidator, KeywordValidator):
     __names__ = ("__ICON_VALIDATOR__", "icon", "Icon", "ICON")
     __required_validators__ = (FilePath,)
 
+    def __reduce__(self):
+        return type(self).from_file, (self.path,)
+
+    @classmethod
+    def from_file(cls, path: str):
+        icon = cls(path)
+        icon.path = path
+        return icon
+
     @classmethod
     @validate(path=FilePath)
     def validate(cls, path: Path):
-        return cls(str(path))
+        return cls.from_file(str(path))
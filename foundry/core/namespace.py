@@ -1,15 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
-from contextlib import suppress
-from functools import partial
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from functools import partial, wraps
 from graphlib import CycleError, TopologicalSorter
+from hashlib import sha256
+from json import loads as load_json
+from os import replace, stat
+from pathlib import Path as SystemPath
+from pickle import HIGHEST_PROTOCOL, PicklingError, UnpicklingError, dumps, loads
 from re import findall, search
 from typing import Any, ClassVar, Generic, Literal, Self, TypeVar, overload
 
 from attr import Factory, attrs, evolve, field, validators
 
-from foundry.core import ChainMap, ChainMapView, sequence_to_pretty_str
+from foundry.core import ChainMap, ChainMapView, VersionedDict, sequence_to_pretty_str
 
 """
 Declare constant literals.
@@ -78,6 +84,12 @@ Values that should be excluded inside an exception.
 """
 
 
+NAMESPACE_CACHE_VERSION: int = 1
+"""
+The version of the namespace cache, which must be incremented whenever the validators change what they produce.
+"""
+
+
 """
 Declare private type hints.
 """
@@ -103,6 +115,80 @@ _ComplexValidatorArguments = tuple[Sequence, Mapping]
 Arguments required to decompose `ComplexValidatorCallable`, which have been validated.
 """
 
+_validator_class_cache: dict[tuple[Callable, type], Any] = {}
+"""
+The handlers and managers which were already generated for each validator class.
+"""
+
+
+_use_compiled_validators: ContextVar[bool] = ContextVar("_use_compiled_validators", default=False)
+"""
+If `validate_argument` should use the validators generated by `compile_validator`.
+"""
+
+_compiled_validators: dict[tuple[type, int], tuple[_TypeHandlerManager, Callable[[Any, Namespace], Any]]] = {}
+"""
+The compiled validators for each validator and the manager they were compiled for.
+"""
+
+
+def _cache_by_class(method: Callable[[type], _T]) -> Callable[[type], _T]:
+    """
+    Caches the result of a class level method for each class it is called from, such that the handlers of a
+    validator are only generated once instead of walking its bases every time it validates a value.
+
+    Parameters
+    ----------
+    method : Callable[[type], _T]
+        The method to cache, which is only dependent on the class.
+
+    Returns
+    -------
+    Callable[[type], _T]
+        The cached method.
+
+    Notes
+    -----
+    The cache is invalidated by `_invalidate_validator_class_cache` whenever the handler of a validator changes.
+    """
+
+    @wraps(method)
+    def cached_method(cls: type) -> _T:
+        key = (method, cls)
+        try:
+            return _validator_class_cache[key]
+        except KeyError:
+            result = _validator_class_cache[key] = method(cls)
+            return result
+
+    return cached_method
+
+
+def _invalidate_validator_class_cache():
+    """
+    Forgets every cached handler, manager and compiled validator, as a validator's handler was modified.
+    """
+    _validator_class_cache.clear()
+    _compiled_validators.clear()
+
+
+def _to_versioned_dict(elements: Mapping) -> Mapping:
+    """
+    Converts a dict to a versioned dict, so chain maps of it can cheaply validate their index.
+
+    Parameters
+    ----------
+    elements : Mapping
+        The elements to convert.
+
+    Returns
+    -------
+    Mapping
+        The versioned elements, or `elements` if it is not a dict.
+    """
+    return VersionedDict(elements) if type(elements) is dict else elements
+
+
 """
 Declare common data class structures for common use.
 """
@@ -1262,8 +1348,9 @@ class TypeHandlerManager(_TypeHandlerManager):
             The generated manager with the mutation or addition to `type_`.
         """
         if isinstance(self.types, ChainMap):
-            return self.__class__(ChainMap({type_: handler}, *self.types.maps))  # No need to make a new ChainMap.
-        return self.__class__(ChainMap({type_: handler}, self.types))
+            # No need to make a new ChainMap.
+            return self.__class__(ChainMap(VersionedDict({type_: handler}), *self.types.maps))
+        return self.__class__(ChainMap(VersionedDict({type_: handler}), self.types))
 
     def add_type_handler(self, type_: str, handler: _TypeHandler) -> Self:
         """
@@ -1285,7 +1372,8 @@ class TypeHandlerManager(_TypeHandlerManager):
         """
         if type_ not in self.types:
             return self.override_type_handler(type_, handler)  # Overrides nothing, as it is not there.
-        return self.__class__(ChainMap({type_: self.types[type_].overwrite_from_parent(handler)}, self.types))
+        handler = self.types[type_].overwrite_from_parent(handler)
+        return self.__class__(ChainMap(VersionedDict({type_: handler}), self.types))
 
     def from_select_types(self, *types: str) -> Self:
         """
@@ -1344,7 +1432,7 @@ class Namespace(Generic[_T]):
 
     parent: Namespace | None = field(eq=False, default=None)
     dependencies: Mapping[str, Namespace] = field(factory=dict)
-    elements: Mapping[str, _T] = field(factory=dict)
+    elements: Mapping[str, _T] = field(factory=VersionedDict, converter=_to_versioned_dict)
     children: Mapping[str, Namespace] = field(factory=dict)
     validators: _TypeHandlerManager = field(
         eq=False,
@@ -1353,6 +1441,11 @@ class Namespace(Generic[_T]):
             takes_self=True,  # type: ignore
         ),
     )
+    _root: Namespace | None = field(init=False, default=None, eq=False, hash=False)
+    _public_elements: ChainMap | None = field(init=False, default=None, eq=False, hash=False)
+    _namespaces_from_root: dict[tuple[str, ...], Namespace | None] = field(
+        init=False, factory=dict, eq=False, hash=False
+    )
 
     def __attrs_post_init__(self):
         # Get around frozen object to magically make children connect to parent.
@@ -1487,10 +1580,13 @@ class Namespace(Generic[_T]):
         ExtendedChildTree
             The namespace whose parent is None.
         """
-        parent = self
-        while parent.parent is not None:
-            parent = parent.parent
-        return parent
+        if self._root is None:
+            parent = self
+            while parent.parent is not None:
+                parent = parent.parent
+            # Get around frozen object, as the parent of a namespace never changes.
+            object.__setattr__(self, "_root", parent)
+        return self._root  # type: ignore
 
     @property
     def public_elements(self) -> ChainMap:
@@ -1502,7 +1598,12 @@ class Namespace(Generic[_T]):
         ChainMap
             A map containing the elements of this instance and any public facing elements from its dependencies.
         """
-        return ChainMap(self.elements, *[d.elements for d in self.dependencies.values()])
+        if self._public_elements is None:
+            # Get around frozen object to keep the lookup cache of the chain map.
+            object.__setattr__(
+                self, "_public_elements", ChainMap(self.elements, *[d.elements for d in self.dependencies.values()])
+            )
+        return self._public_elements  # type: ignore
 
     def evolve_child(self, name: str, child: Namespace) -> Namespace:
         """
@@ -1545,12 +1646,41 @@ class Namespace(Generic[_T]):
         bool
             If the namespace exists relative to this namespace and the path provided.
         """
-        namespace = self.root
-        for name in path:
-            if name not in namespace.children:
-                return False
+        return self._find_namespace(path) is not None
+
+    def _find_namespace(self, path: Path) -> Namespace | None:
+        """
+        Finds a namespace relative to the root by following the path provided.
+
+        Parameters
+        ----------
+        path : Path
+            The path the namespace is relative to.
+
+        Returns
+        -------
+        Namespace | None
+            The namespace at the path, if it exists.
+
+        Notes
+        -----
+        As a namespace is immutable, the namespace found for each path is kept by the root, so resolving a path
+        does not scale with its depth after the first time it is resolved.
+        """
+        root = self.root
+        key = tuple(path)
+        try:
+            return root._namespaces_from_root[key]
+        except KeyError:
+            pass
+        namespace: Namespace | None = root
+        for name in key:
+            if namespace is None or name not in namespace.children:
+                namespace = None
+                break
             namespace = namespace.children[name]
-        return True
+        root._namespaces_from_root[key] = namespace
+        return namespace
 
     def from_path(self, path: Path) -> Namespace:
         """
@@ -1573,10 +1703,8 @@ class Namespace(Generic[_T]):
             :func:~`foundry.core.namespace.Namespace.namespace_exists_at_path`_ is False.
             Thus, a namespace cannot be returned from the parameters provided.
         """
-        assert self.namespace_exists_at_path(path)
-        from_path = self.root
-        for element in path:
-            from_path = from_path.children[element]
+        from_path = self._find_namespace(path)
+        assert from_path is not None
         return from_path
 
 
@@ -1826,6 +1954,7 @@ class Validator(_ValidatorHelper):
 
     @classmethod
     @property
+    @_cache_by_class
     def type_handler(cls) -> TypeHandler[Self]:
         """
         Provides the type handler for this type.
@@ -1850,6 +1979,7 @@ class Validator(_ValidatorHelper):
 
     @classmethod
     @property
+    @_cache_by_class
     def type_manager(cls) -> TypeHandlerManager:
         """
         Provides the type manager for this type and all of its associated names.
@@ -2154,6 +2284,7 @@ def custom_validator(
         cls.__validator_handler__ = evolve(
             cls.__validator_handler__, types=cls.__validator_handler__.types | {validator_name: val}
         )
+        _invalidate_validator_class_cache()
         return cls
 
     return custom_validator
@@ -2350,6 +2481,7 @@ class ConcreteValidator(Validator):
 
     @classmethod
     @property
+    @_cache_by_class
     def type_handler(cls) -> TypeHandler[Self]:
         handler = super().type_handler
         return evolve(handler, default_type_suggestion=cls)  # type: ignore
@@ -2786,11 +2918,138 @@ def validate_argument(validator: type[_V], arg: Any, parent: Namespace) -> _V:
     _V
         The validated argument.
     """
+    if _use_compiled_validators.get() and parent is not None:
+        return compile_validator(validator, parent.validators)(arg, parent)
     return ComplexValidatorCallableInformation._validate_argument(
         validator, TypeValidator.from_validator(validator, parent), arg, parent
     )
 
 
+@contextmanager
+def compiled_validators() -> Iterator[None]:
+    """
+    Validates every argument inside the context with validators generated by `compile_validator`.
+    """
+    token = _use_compiled_validators.set(True)
+    try:
+        yield
+    finally:
+        _use_compiled_validators.reset(token)
+
+
+def compile_validator(validator: type[_V], validators: _TypeHandlerManager) -> Callable[[Any, Namespace], _V]:
+    """
+    Provides a validator which is specialized to validate arguments to `validator` from namespaces with
+    `validators`, which behaves like `validate_argument`.
+
+    The handler, default type and validator method are resolved once, when the validator is compiled.  Arguments
+    which use the default type of `validator` are then validated by calling its validator method directly.  Any
+    other argument, such as one which defines its own type, is validated by `validate_argument`, so errors are
+    reported identically.
+
+    Parameters
+    ----------
+    validator : type[_V]
+        The type to validate to.
+    validators : _TypeHandlerManager
+        The validators of the namespaces that arguments will be validated from.
+
+    Returns
+    -------
+    Callable[[Any, Namespace], _V]
+        The validator for an argument and its parent.
+    """
+    key = (validator, id(validators))
+    with suppress(KeyError):
+        manager, compiled_validator = _compiled_validators[key]
+        if manager is validators:
+            return compiled_validator
+    compiled_validator = _compile_validator(validator, validators)
+    _compiled_validators[key] = validators, compiled_validator
+    return compiled_validator
+
+
+def _compile_type_validator(handler: _TypeHandler, type: TypeInformation) -> Callable[[Any], Any]:
+    """
+    Provides a validator which is specialized to validate the elements of a namespace, which behaves like
+    `handler.validate_to_type` for `type`.
+
+    Parameters
+    ----------
+    handler : _TypeHandler
+        The handler of the type of the elements.
+    type : TypeInformation
+        The type of the elements, including their parent namespace.
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        The validator for an element.
+    """
+    validate_generically = partial(handler.validate_to_type, type)
+
+    parent = type.parent
+    default_type = handler.default_validator
+    if parent is None or default_type is None or default_type.type_suggestion not in handler.types:
+        return validate_generically
+    information = _Converters.convert_to_validator(handler.types[default_type.type_suggestion])
+    if not isinstance(information, ValidatorCallableInformation):
+        return validate_generically
+    type_suggestion = information.type_suggestion or handler.default_type_suggestion
+    if type_suggestion is None:
+        return validate_generically
+    validate_by_type, use_parent = information.validator, information.use_parent
+
+    def validate_compiled(values: Any) -> Any:
+        if not isinstance(values, dict):
+            return validate_generically(values)
+        for key in TYPE_INFO_ARGUMENTS:
+            if key in values:
+                return validate_generically(values)
+        values[TYPE_INFO_ARGUMENT] = None
+        if use_parent:
+            values = values | {PARENT_ARGUMENT: parent}
+        return validate_by_type(type_suggestion, values)
+
+    return validate_compiled
+
+
+def _compile_validator(validator: type[_V], validators: _TypeHandlerManager) -> Callable[[Any, Namespace], _V]:
+    def validate_generically(arg: Any, parent: Namespace) -> _V:
+        return ComplexValidatorCallableInformation._validate_argument(
+            validator, TypeValidator.from_validator(validator, parent), arg, parent
+        )
+
+    handler = validators.types.get(validator.default_name, None)
+    if handler is None:
+        return validate_generically
+    default_type = handler.default_validator or validator.__type_default__
+    if default_type is None or default_type.type_suggestion not in handler.types:
+        return validate_generically
+    type_name = default_type.type_suggestion
+    if type_name not in (validator_types := validator.type_handler.types):
+        return validate_generically
+    information = _Converters.convert_to_validator(validator_types[type_name])
+    if not isinstance(information, ValidatorCallableInformation):
+        return validate_generically
+    validate_by_type = information.validator
+
+    def validate_compiled(arg: Any, parent: Namespace) -> _V:
+        if not isinstance(arg, dict):
+            return validate_by_type(
+                validator, {DEFAULT_ARGUMENT: arg, PARENT_ARGUMENT: parent, TYPE_INFO_ARGUMENT: type_name}
+            )
+        for key in TYPE_INFO_ARGUMENTS:
+            if key in arg:
+                return validate_generically(arg, parent)
+        if parent is not None:
+            arg[PARENT_ARGUMENT] = parent
+        arg[TYPE_INFO_ARGUMENT] = type_name
+        return validate_by_type(validator, arg)
+
+    return validate_compiled
+
+
 def validate(**kwargs: type[Validator]) -> Callable[[Callable[..., _KV]], ValidatorCallable[_KV]]:
     """
     A decorator to automatically validate a series of keyword arguments with a series of validators.
@@ -2806,6 +3065,8 @@ def validate(**kwargs: type[Validator]) -> Callable[[Callable[..., _KV]], Valida
         A decorator which will take a classmethod and converts it to a validator.
     """
 
+    expected = [(k, isinstance(kwargs[k], (DefaultValidator, OptionalValidator))) for k in kwargs]
+
     def validate(_f: Callable[..., _KV]) -> ValidatorCallable[_KV]:
         def validate_arguments(cls, values: Any) -> _KV:
             """
@@ -2827,9 +3088,7 @@ def validate(**kwargs: type[Validator]) -> Callable[[Callable[..., _KV]], Valida
             KeyError
                 The parent namespace was not defined inside `values`.
             """
-            kwargs_ = cls.check_for_kwargs_only(
-                values, *[(k, isinstance(kwargs[k], (DefaultValidator, OptionalValidator))) for k in kwargs]
-            )
+            kwargs_ = cls.check_for_kwargs_only(values, *expected)
             parent = cls.get_parent_suggestion(values)
             if parent is None:
                 raise KeyError("Parent is required")
@@ -3017,24 +3276,55 @@ def validate_namespace(
     element_type = validate_namespace_type(namespace, v)
     handler = namespace.validators.types[element_type.type_suggestion]
 
+    namespace = _add_namespace_dependencies(namespace, v, parent)
+
+    validate_element = (
+        _compile_type_validator(handler, element_type)
+        if _use_compiled_validators.get()
+        else partial(handler.validate_to_type, element_type)
+    )
+    elements = {key: validate_element(value) for key, value in ({} if "elements" not in v else v["elements"]).items()}
+
+    namespace = evolve(namespace, elements=elements)
+
+    return namespace
+
+
+def _add_namespace_dependencies(namespace: Namespace, v: Mapping, parent: Namespace | None) -> Namespace:
+    """
+    Loads the dependencies of a namespace from its parent.
+
+    Parameters
+    ----------
+    namespace : Namespace
+        The namespace to add the dependencies to.
+    v : Mapping
+        The mapping to generate the namespace from.
+    parent : Optional[Namespace]
+        The parent of the namespace.
+
+    Returns
+    -------
+    Namespace
+        The namespace with its dependencies.
+
+    Raises
+    ------
+    ChildDoesNotExistException
+        A root node contains dependencies.
+    """
     dependencies: set[Path] = set() if "dependencies" not in v else {Path.from_string(d) for d in v["dependencies"]}
     if parent is None and dependencies:
         dependency = list(dependencies)[0]
         raise ChildDoesNotExistException(dependency, dependency.root)
     elif parent:
         namespace = evolve(namespace, dependencies={str(path): parent.from_path(path) for path in dependencies})
-
-    elements = {
-        key: handler.validate_to_type(element_type, value)
-        for key, value in ({} if "elements" not in v else v["elements"]).items()
-    }
-
-    namespace = evolve(namespace, elements=elements)
-
     return namespace
 
 
-def generate_namespace(v: Mapping, validators: _TypeHandlerManager | None = None) -> Namespace:
+def generate_namespace(
+    v: Mapping, validators: _TypeHandlerManager | None = None, compile_validators: bool = False
+) -> Namespace:
     """
     Generates the root namespace from a mapping, creating every aspect of the namespace, including its
     children.  This also includes validation of the namespace, its children, its elements, and its children's
@@ -3046,6 +3336,8 @@ def generate_namespace(v: Mapping, validators: _TypeHandlerManager | None = None
         The mapping to generate the namespace and its children from.
     validators: _TypeHandlerManager | None, optional.
         The possible validators that the namespace can possess, None by default.
+    compile_validators: bool, optional.
+        Validates the namespace with validators specialized by `compile_validator`, False by default.
 
     Returns
     -------
@@ -3063,25 +3355,205 @@ def generate_namespace(v: Mapping, validators: _TypeHandlerManager | None = None
     which can load the all the namespaces in an order which will not conflict with one another.  Once
     every namespace is iterated through in topographic order, the root should correctly define the map.
     """
+    if compile_validators:
+        with compiled_validators():
+            return generate_namespace(v, validators)
+    return _build_namespace(v, lambda _, node, parent: validate_namespace(node, parent, validators))
+
+
+def _build_namespace(v: Mapping, create: Callable[[Path, Mapping, Namespace | None], Namespace]) -> Namespace:
+    """
+    Generates the root namespace from a mapping by creating each namespace in topographic order, see
+    `generate_namespace`.
+
+    Parameters
+    ----------
+    v : Mapping
+        The mapping to generate the namespace and its children from.
+    create : Callable[[Path, Mapping, Namespace | None], Namespace]
+        Creates a namespace, without its children, from its path, its mapping and its parent.
+
+    Returns
+    -------
+    Namespace
+        The root namespace and its children derived from the map provided.
+    """
     order = iter(sort_topographically(dependency_graph := generate_dependency_graph("root", v)))
 
     try:
-        next(order)  # Skip the root node, as it needs a special construction.
+        root_path = next(order)  # The root node needs a special construction.
     except CycleError as e:
         raise CircularImportException(find_cycle(dependency_graph)) from e
 
-    root = validate_namespace(v, None, validators)
+    root = create(root_path, v, None)
     for dependency_path in order:
         dependency_parent_path = dependency_path.parent
         assert dependency_parent_path is not None  # This should be impossible because it must be descendent of root.
 
         dependency_parent = root.from_path(dependency_parent_path)
-        dependency = validate_namespace(get_namespace_dict_from_path(v, dependency_path), dependency_parent)
+        dependency = create(dependency_path, get_namespace_dict_from_path(v, dependency_path), dependency_parent)
         root = dependency_parent.evolve_child(dependency_path.name, dependency)  # Evolve the immutable root.
 
     return root
 
 
+def restore_namespace(
+    v: Mapping, elements: Mapping[str, Mapping[str, Any]], validators: _TypeHandlerManager | None = None
+) -> Namespace:
+    """
+    Generates the root namespace from a mapping like `generate_namespace`, but uses elements which were
+    already validated instead of validating the elements of the mapping.
+
+    Parameters
+    ----------
+    v : Mapping
+        The mapping to generate the namespace and its children from.
+    elements : Mapping[str, Mapping[str, Any]]
+        The validated elements of each namespace, keyed by the path of the namespace.
+    validators: _TypeHandlerManager | None, optional.
+        The possible validators that the namespace can possess, None by default.
+
+    Returns
+    -------
+    Namespace
+        The root namespace and its children derived from the map and elements provided.
+    """
+
+    def create(path: Path, node: Mapping, parent: Namespace | None) -> Namespace:
+        namespace = Namespace(parent) if validators is None else Namespace(parent, validators=validators)
+        namespace = _add_namespace_dependencies(namespace, node, parent)
+        return evolve(namespace, elements=elements.get(str(path), {}))
+
+    return _build_namespace(v, create)
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=False, repr=False)
+class _PickledElements(Mapping):
+    """
+    The elements of a namespace which are only unpickled once they are accessed.
+
+    Attributes
+    ----------
+    pickled_elements: Mapping[str, bytes]
+        The pickled elements.
+    elements: dict[str, Any]
+        The elements which were already unpickled.
+    """
+
+    pickled_elements: Mapping[str, bytes]
+    elements: dict[str, Any] = field(factory=dict)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({set(self.pickled_elements)})"
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self.elements[key]
+        except KeyError:
+            element = self.elements[key] = loads(self.pickled_elements[key])
+            return element
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.pickled_elements)
+
+    def __len__(self) -> int:
+        return len(self.pickled_elements)
+
+    def observe(self, observer: ChainMap) -> None:
+        """
+        Accepts a chain map indexing the keys, which never needs to be invalidated as the pickled elements are never
+        modified.
+
+        Parameters
+        ----------
+        observer : ChainMap
+            The chain map which indexes the keys.
+        """
+
+
+def _get_file_stamp(path: SystemPath) -> tuple[int, int] | None:
+    try:
+        result = stat(path)
+    except OSError:
+        return None
+    return result.st_mtime_ns, result.st_size
+
+
+def _get_namespace_tree(namespace: Namespace) -> Iterator[Namespace]:
+    yield namespace
+    for child in namespace.children.values():
+        yield from _get_namespace_tree(child)
+
+
+def generate_cached_namespace(
+    source: SystemPath,
+    cache_path: SystemPath,
+    validators: _TypeHandlerManager | None = None,
+    compile_validators: bool = False,
+) -> Namespace:
+    """
+    Generates the root namespace from a JSON file, like `generate_namespace`, while keeping its validated elements
+    inside a cache file.
+
+    The cache is keyed by the hash of the JSON file, `NAMESPACE_CACHE_VERSION` and the types of `validators`.  It is
+    also rebuilt when any file that is an element of the namespace changes.  Elements are pickled individually and
+    are only unpickled once they are accessed, so loading a namespace from the cache does not validate anything.
+
+    Parameters
+    ----------
+    source : SystemPath
+        The JSON file to generate the namespace from.
+    cache_path : SystemPath
+        The file to store the validated elements inside.
+    validators: _TypeHandlerManager | None, optional.
+        The possible validators that the namespace can possess, None by default.
+    compile_validators: bool, optional.
+        Validates the namespace with validators specialized by `compile_validator`, False by default.
+
+    Returns
+    -------
+    Namespace
+        The root namespace and its children derived from the JSON file.
+
+    Notes
+    -----
+    If an element cannot be pickled, the namespace is generated normally and the cache is not written.
+    """
+    data = source.read_bytes()
+    v = load_json(data)
+    types = sorted(set(validators.types.keys())) if validators is not None else []
+    key = sha256(data + repr((NAMESPACE_CACHE_VERSION, types)).encode()).digest()
+
+    with suppress(OSError, ValueError, TypeError, AttributeError, ImportError, EOFError, UnpicklingError):
+        cache_key, file_stamps, elements = loads(cache_path.read_bytes())
+        if cache_key == key and all(_get_file_stamp(path) == stamp for path, stamp in file_stamps.items()):
+            return restore_namespace(v, {path: _PickledElements(e) for path, e in elements.items()}, validators)
+
+    namespace = generate_namespace(v, validators, compile_validators)
+
+    file_stamps = {}
+    elements = {}
+    try:
+        for child in _get_namespace_tree(namespace):
+            elements[".".join(child.path)] = {
+                name: dumps(element, HIGHEST_PROTOCOL) for name, element in child.elements.items()
+            }
+            for element in child.elements.values():
+                if isinstance(element, SystemPath):
+                    file_stamps[element] = _get_file_stamp(element)
+    except (PicklingError, TypeError, AttributeError):
+        return namespace
+
+    # The cache is only an optimization, so failing to write it is not an error.
+    with suppress(OSError):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = cache_path.with_suffix(".tmp")
+        temporary_path.write_bytes(dumps((key, file_stamps, elements), HIGHEST_PROTOCOL))
+        replace(temporary_path, cache_path)
+
+    return namespace
+
+
 def validate_valid_name(name: str) -> str:
     """
     Validates that the name could be referenced inside any namespace.
@@ -3232,3 +3704,4 @@ def validate_path_name(path: Any) -> str:
 
 # Allow all types to be validated by reference natively.
 Validator.__validator_handler__ = TypeHandler({"FROM NAMESPACE": Validator.validate_from_namespace})  # type: ignore
+_invalidate_validator_class_cache()
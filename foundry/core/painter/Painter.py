@@ -1,5 +1,10 @@
-from PySide6.QtGui import QImage, QPainter
-from PySide6.QtWidgets import QWidget
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PySide6.QtGui import QImage, QPainter
+    from PySide6.QtWidgets import QWidget
 
 
 class Painter:
@@ -13,6 +18,8 @@ class Painter:
         self.image = image
 
     def __enter__(self) -> QPainter:
+        from PySide6.QtGui import QPainter
+
         self.painter = QPainter(self.image)
         return self.painter
 
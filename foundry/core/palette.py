@@ -5,13 +5,15 @@ from colorsys import hsv_to_rgb, rgb_to_hsv
 from functools import cache
 from json import loads
 from pathlib import Path
-from typing import ClassVar, Self, overload
+from sys import modules
+from typing import TYPE_CHECKING, ClassVar, Self, overload
 
 from attr import attrs, evolve, field, validators
-from PySide6.QtGui import QColor
+from numpy import array, uint8
+from numpy.typing import NDArray
 
 from foundry import data_dir
-from foundry.core import sequence_to_pretty_str
+from foundry.core import qt, sequence_to_pretty_str
 from foundry.core.file import FilePath
 from foundry.core.namespace import (
     ConcreteValidator,
@@ -25,6 +27,29 @@ from foundry.core.namespace import (
 from foundry.game.File import ROM
 from foundry.smb3parse.constants import BASE_OFFSET, Palette_By_Tileset, PalSet_Maps
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QColor
+
+
+class _LoadedQtGui:
+    """
+    Provides the types of QtGui, only if it was already imported.
+
+    A value cannot be an instance of a type from QtGui before QtGui is imported, so matching against these types does
+    not require importing Qt.  Until then, every type is replaced by a type which nothing is an instance of.
+    """
+
+    class _NotLoaded:
+        pass
+
+    def __getattr__(self, name: str) -> type:
+        qt_gui = modules.get("PySide6.QtGui")
+        return self._NotLoaded if qt_gui is None else getattr(qt_gui, name)
+
+
+_qt_gui = _LoadedQtGui()
+
+
 MAP_PALETTE_ADDRESS = PalSet_Maps
 PRG_SIZE = 0x2000
 PALETTE_PRG_NO = 22
@@ -279,7 +304,7 @@ class Color(ConcreteValidator, KeywordValidator):
         match color:
             case Color():
                 return color
-            case QColor():
+            case _qt_gui.QColor():
                 return cls.from_qt(color)
             case _:
                 return NotImplemented
@@ -310,7 +335,7 @@ class Color(ConcreteValidator, KeywordValidator):
         return cls(color.red(), color.green(), color.blue(), color.alpha())
 
     def to_qt(self) -> QColor:
-        return QColor(self.red, self.green, self.blue, self.alpha)
+        return qt.QColor(self.red, self.green, self.blue, self.alpha)
 
     def to_rgb_bytes(self) -> bytes:
         return self.red.to_bytes(1, "little") + self.green.to_bytes(1, "little") + self.blue.to_bytes(1, "little")
@@ -346,7 +371,7 @@ class ColorSequence(Sequence):
                 return self._list[index % len(self._list)]
             case Color():
                 return self._list.index(index)
-            case QColor():
+            case _qt_gui.QColor():
                 return self._list.index(Color.from_qt(index))
             case _:
                 return NotImplemented
@@ -360,7 +385,7 @@ class ColorSequence(Sequence):
                 return 0 <= value <= len(self._list)
             case Color():
                 return value in self._list
-            case QColor():
+            case _qt_gui.QColor():
                 return Color.from_qt(value) in self._list
             case _:
                 return NotImplemented
@@ -372,7 +397,7 @@ class ColorSequence(Sequence):
         match value:
             case Color():
                 return self._list.index(value, start, stop)  # type: ignore
-            case QColor():
+            case _qt_gui.QColor():
                 return self._list.index(Color.from_qt(value), start, stop)  # type: ignore
             case _:
                 return NotImplemented
@@ -381,7 +406,7 @@ class ColorSequence(Sequence):
         match value:
             case Color():
                 return self._list.count(value)
-            case QColor():
+            case _qt_gui.QColor():
                 return self._list.count(Color.from_qt(value))
             case _:
                 return NotImplemented
@@ -402,10 +427,27 @@ class ColorPalette(ConcreteValidator, KeywordValidator):
     _default: ClassVar[ColorPalette | None] = None
 
     colors: ColorSequence
+    _lut: NDArray[uint8] | None = field(default=None, init=False, eq=False, repr=False)
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.colors})"
 
+    @property
+    def lut(self) -> NDArray[uint8]:
+        """
+        Provides a lookup table of the colors, so many color indexes can be converted to colors at once.
+
+        Returns
+        -------
+        NDArray[uint8]
+            A read only array of shape (colors, 4), where each row is the red, green, blue, and alpha of a color.
+        """
+        if self._lut is None:
+            lut = array([(c.red, c.green, c.blue, c.alpha) for c in self.colors], dtype=uint8).reshape(-1, 4)
+            lut.flags.writeable = False
+            object.__setattr__(self, "_lut", lut)
+        return self._lut  # type: ignore
+
     @overload
     def __getitem__(self, item: int) -> Color:
         pass
@@ -474,10 +516,30 @@ class Palette(ConcreteValidator, KeywordValidator):
 
     color_indexes: tuple[int, ...]
     color_palette: ColorPalette = ColorPalette.from_default()
+    _lut: NDArray[uint8] | None = field(default=None, init=False, eq=False, repr=False)
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.color_indexes})"
 
+    @property
+    def lut(self) -> NDArray[uint8]:
+        """
+        Provides a lookup table of the colors of the palette, so an image of color indexes can be converted to
+        colors with a single gather.
+
+        Returns
+        -------
+        NDArray[uint8]
+            A read only array of shape (color indexes, 4), where each row is the red, green, blue, and alpha of the
+            color at that index.
+        """
+        if self._lut is None:
+            color_palette = self.color_palette.lut
+            lut = color_palette[array(self.color_indexes, dtype=int) % len(color_palette)]
+            lut.flags.writeable = False
+            object.__setattr__(self, "_lut", lut)
+        return self._lut  # type: ignore
+
     def __bytes__(self) -> bytes:
         return bytes(i & 0xFF for i in self.color_indexes)
 
@@ -504,11 +566,11 @@ class Palette(ConcreteValidator, KeywordValidator):
         match item:
             case int():
                 return self.color_indexes[item]
-            case Color() | QColor():
+            case Color() | _qt_gui.QColor():
                 return self.color_palette[item]
             case [i, t] if t == Color:
                 return self.color_palette[self.color_indexes[i]]
-            case [i, t] if t == QColor:
+            case [i, t] if t == _qt_gui.QColor:
                 return self.color_palette[self.color_indexes[i]].to_qt()
             case _:
                 return NotImplemented
@@ -526,7 +588,7 @@ class Palette(ConcreteValidator, KeywordValidator):
                 return value in self.color_indexes
             case Color():
                 return value in set(self)
-            case QColor():
+            case _qt_gui.QColor():
                 return Color.from_qt(value) in set(self)
             case _:
                 return NotImplemented
@@ -574,7 +636,7 @@ class Palette(ConcreteValidator, KeywordValidator):
         match value:
             case int():
                 return self.color_indexes.index(value)
-            case Color() | QColor():
+            case Color() | _qt_gui.QColor():
                 return self.color_palette.index(value)
             case _:
                 return NotImplemented
@@ -595,6 +657,9 @@ class PaletteGroup(ConcreteValidator, KeywordValidator):
     __names__ = ("__PALETTE_GROUP_VALIDATOR__", "palette group", "Palette Group", "PALETTE GROUP")
     __required_validators__ = (SequenceValidator, Palette)
 
+    _tileset_cache: ClassVar[dict[tuple[type, int, int], PaletteGroup]] = {}
+    _tileset_cache_generation: ClassVar[int] = -1
+
     palettes: tuple[Palette]
 
     def __str__(self) -> str:
@@ -632,14 +697,14 @@ class PaletteGroup(ConcreteValidator, KeywordValidator):
                 return self.palettes[palette_index][color_index]
             case [palette_index, color_index, t] if t == Color:
                 return self.palettes[palette_index][color_index, Color]
-            case [palette_index, color_index, t] if t == QColor:
-                return self.palettes[palette_index][color_index, QColor]
+            case [palette_index, color_index, t] if t == _qt_gui.QColor:
+                return self.palettes[palette_index][color_index, t]
             case _:
                 return NotImplemented
 
     @property
     def background_color(self) -> QColor:
-        return self.palettes[0][0, QColor]
+        return self.palettes[0][0, qt.QColor]
 
     @classmethod
     def as_empty(cls) -> Self:
@@ -691,9 +756,20 @@ class PaletteGroup(ConcreteValidator, KeywordValidator):
         -------
         PaletteGroup
             The PaletteGroup that represents the tileset's palette group at the provided offset.
+
+        Notes
+        -----
+        Palette groups are cached until the ROM changes, so the same palette group is shared between every call.
         """
-        offset = get_internal_palette_offset(tileset) + index * PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE
-        return cls.from_rom(offset)
+        if PaletteGroup._tileset_cache_generation != ROM.generation:
+            PaletteGroup._tileset_cache.clear()
+            PaletteGroup._tileset_cache_generation = ROM.generation
+
+        key = (cls, tileset, index)
+        if (palette_group := PaletteGroup._tileset_cache.get(key)) is None:
+            offset = get_internal_palette_offset(tileset) + index * PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE
+            palette_group = PaletteGroup._tileset_cache[key] = cls.from_rom(offset)
+        return palette_group  # type: ignore
 
     @classmethod
     @validate(palettes=SequenceValidator.generate_class(Palette))
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import builtins
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from importlib.util import resolve_name
+from sys import modules
+from time import perf_counter
+
+from attr import attrs, field
+
+
+@attrs(slots=True, auto_attribs=True, eq=False)
+class Timing:
+    """
+    The time spent inside a step of the start up, including the steps it took.
+
+    Attributes
+    ----------
+    name: str
+        The name of the step.
+    start: float
+        When the step started, in seconds.
+    end: float | None
+        When the step ended, in seconds, None if it has not ended.
+    children: list[Timing]
+        The steps which were taken during this step.
+    """
+
+    name: str
+    start: float = field(factory=perf_counter)
+    end: float | None = None
+    children: list[Timing] = field(factory=list)
+
+    @property
+    def duration(self) -> float:
+        """
+        The time spent inside the step, in seconds.
+
+        Returns
+        -------
+        float
+            The time spent, including the steps inside of it.
+        """
+        return (perf_counter() if self.end is None else self.end) - self.start
+
+    @property
+    def self_duration(self) -> float:
+        """
+        The time spent inside the step, excluding the steps inside of it.
+
+        Returns
+        -------
+        float
+            The time spent only by this step.
+        """
+        return self.duration - sum(child.duration for child in self.children)
+
+
+class StartupProfiler:
+    """
+    Records how long each import and phase of the start up takes as a tree.
+
+    Imports are recorded by replacing `builtins.__import__` while the profiler is installed, so only modules which
+    were not already imported are recorded.  Phases are recorded with `phase`.
+
+    Attributes
+    ----------
+    root: Timing
+        The timing of the entire start up.
+    """
+
+    def __init__(self, name: str = "startup"):
+        self.root = Timing(name)
+        self._stack: list[Timing] = [self.root]
+        self._import: Callable | None = None
+
+    @property
+    def is_installed(self) -> bool:
+        """
+        Determines if imports are being recorded.
+
+        Returns
+        -------
+        bool
+            If the profiler is installed.
+        """
+        return self._import is not None
+
+    def install(self) -> None:
+        """
+        Starts recording imports.
+        """
+        if self._import is not None:
+            return
+        self._import = original_import = builtins.__import__
+
+        def profiled_import(name, globals=None, locals=None, fromlist=(), level=0):
+            module_name = name if level == 0 else resolve_name("." * level + name, (globals or {}).get("__package__"))
+            if module_name in modules and not any(f"{module_name}.{item}" not in modules for item in fromlist or ()):
+                return original_import(name, globals, locals, fromlist, level)
+            with self.phase(module_name):
+                return original_import(name, globals, locals, fromlist, level)
+
+        builtins.__import__ = profiled_import
+
+    def uninstall(self) -> None:
+        """
+        Stops recording imports.
+        """
+        if self._import is not None:
+            builtins.__import__ = self._import
+            self._import = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[Timing]:
+        """
+        Records a step of the start up, such as loading the settings or creating a window.
+
+        Parameters
+        ----------
+        name : str
+            The name of the step.
+
+        Yields
+        ------
+        Timing
+            The timing of the step.
+        """
+        timing = Timing(name)
+        self._stack[-1].children.append(timing)
+        self._stack.append(timing)
+        try:
+            yield timing
+        finally:
+            timing.end = perf_counter()
+            self._stack.pop()
+
+    def finish(self) -> Timing:
+        """
+        Stops recording the start up.
+
+        Returns
+        -------
+        Timing
+            The timing of the entire start up.
+        """
+        self.uninstall()
+        self.root.end = perf_counter()
+        return self.root
+
+    def report(self, threshold: float = 0.001) -> str:
+        """
+        Generates a readable tree of the time spent by each step.
+
+        Parameters
+        ----------
+        threshold : float, optional
+            The duration, in seconds, that a step must take to be displayed, by default a millisecond.  Smaller
+            steps are summarized together.
+
+        Returns
+        -------
+        str
+            The tree, where each line contains the total and self time of a step in milliseconds.
+        """
+        lines = [f"{'total ms':>10} {'self ms':>10}  step"]
+
+        def add_lines(timing: Timing, depth: int) -> None:
+            total, self_total = timing.duration * 1000, timing.self_duration * 1000
+            lines.append(f"{total:>10.1f} {self_total:>10.1f}  {'  ' * depth}{timing.name}")
+            hidden = [child for child in timing.children if child.duration < threshold]
+            for child in timing.children:
+                if child.duration >= threshold:
+                    add_lines(child, depth + 1)
+            if hidden:
+                duration = sum(child.duration for child in hidden) * 1000
+                lines.append(f"{duration:>10.1f} {'':>10}  {'  ' * (depth + 1)}({len(hidden)} smaller steps)")
+
+        add_lines(self.root, 0)
+        return "\n".join(lines)
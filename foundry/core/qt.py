@@ -0,0 +1,29 @@
+"""
+Lazily provides the classes of Qt used to convert and render the model.
+
+Importing this module does not import Qt, so the model can be used without it.  A class is imported the first time it
+is accessed and is then stored as an attribute of this module, so later accesses are plain attribute lookups instead of
+imports, which are slow for Qt.
+"""
+
+from importlib import import_module
+
+_MODULES = {
+    "QColor": "PySide6.QtGui",
+    "QImage": "PySide6.QtGui",
+    "QPainter": "PySide6.QtGui",
+    "QPoint": "PySide6.QtCore",
+    "QPointF": "PySide6.QtCore",
+    "QRect": "PySide6.QtCore",
+    "QSize": "PySide6.QtCore",
+    "Qt": "PySide6.QtCore",
+}
+
+
+def __getattr__(name: str) -> type:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = getattr(import_module(module), name)
+    return value
@@ -0,0 +1,384 @@
+"""
+Serializes the objects sent between the processes of the task system.
+
+Objects are pickled by `pickle` with protocol 5, which is many times faster than `dill`.  Only objects `pickle` cannot
+handle, such as local classes and classes of the main module, fall back to `dill`.  Functions which cannot be pickled
+by reference, such as lambdas, closures, and functions of the main module, are pickled by `dill` once and the result
+is reused every time the same function is sent.
+
+Buffers which support out-of-band pickling, such as byte arrays, NumPy arrays, and images, are placed inside shared
+memory when they are large enough, see `foundry.core.shared_buffers`.  A process which only forwards an object to
+another process should send it as a `PickledCallable`, so its shared buffers are forwarded untouched.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from hashlib import blake2b
+from io import BytesIO
+from itertools import chain
+from pickle import HIGHEST_PROTOCOL, PickleBuffer, Pickler, PicklingError, Unpickler
+from pickle import dumps as dumps_pickle
+from pickle import loads as loads_pickle
+from struct import Struct
+from sys import modules
+from types import FunctionType
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from dill import Pickler as DillPickler
+from dill import Unpickler as DillUnpickler
+from dill import dumps as dumps_dill
+from dill import loads as loads_dill
+
+from foundry.core.shared_buffers import (
+    SHARED_MEMORY_THRESHOLD,
+    SharedBuffer,
+    discard,
+    receive,
+    share,
+)
+
+FUNCTION_CACHE_SIZE: int = 2**22
+"""
+The amount of bytes of pickled functions which are kept once they are received, so they are not unpickled again.
+"""
+
+_DILLED: int = 0b01
+"""
+Set inside the flags of a message when it was pickled by `dill`.
+"""
+
+_SHARES_BUFFERS: int = 0b10
+"""
+Set inside the flags of a message when it contains buffers placed inside shared memory.
+"""
+
+_TRAILER = Struct("<I")
+"""
+The size of the pickled shared buffers, placed at the end of a message.
+"""
+
+_pickled_functions: WeakKeyDictionary[FunctionType, bytes | None] = WeakKeyDictionary()
+"""
+The functions which were already sent, mapped to their pickled form or None if they are pickled by reference.
+
+Notes
+-----
+    Functions are assumed to not change once they are sent, so a closure that modifies its own variables will be sent
+with the values it had the first time it was sent.
+"""
+
+
+def _pickles_by_reference(function: FunctionType) -> bool:
+    """
+    Determines if `pickle` can pickle a function by its name, which is the case for every function defined at the top
+    level of a module or class, except for the main module.  The processes of the task system are forked, so they may
+    not contain functions added to the main module after they started.
+    """
+    if function.__module__ == "__main__":
+        return False
+    value: Any = modules.get(function.__module__)
+    for name in function.__qualname__.split("."):
+        value = getattr(value, name, None)
+    return value is function
+
+
+class _LoadedFunctions:
+    """
+    The functions pickled by `dill` which were already received, keyed by the digest of their pickled form.
+
+    A function pickled by value keeps every value it captured alive, so only functions pickled into fewer than
+    `SHARED_MEMORY_THRESHOLD` bytes are kept, and the least recently used functions are discarded once the kept
+    functions were pickled into more than `FUNCTION_CACHE_SIZE` bytes.
+    """
+
+    __slots__ = ("functions", "size")
+
+    def __init__(self) -> None:
+        self.functions: OrderedDict[bytes, tuple[FunctionType, int]] = OrderedDict()
+        self.size = 0
+
+    def load(self, data: bytes) -> FunctionType:
+        if len(data) >= SHARED_MEMORY_THRESHOLD:
+            return loads_dill(data)
+        key = blake2b(data).digest()
+        try:
+            function, _ = self.functions[key]
+        except KeyError:
+            function = loads_dill(data)
+            self.functions[key] = function, len(data)
+            self.size += len(data)
+            while self.size > FUNCTION_CACHE_SIZE:
+                _, (_, size) = self.functions.popitem(last=False)
+                self.size -= size
+        else:
+            self.functions.move_to_end(key)
+        return function
+
+    def clear(self) -> None:
+        self.functions.clear()
+        self.size = 0
+
+
+_loaded_functions = _LoadedFunctions()
+
+
+def _load_function(data: bytes) -> FunctionType:
+    """
+    Unpickles a function pickled by `dill`, reusing the function if it was already received.
+    """
+    return _loaded_functions.load(data)
+
+
+def _load_image(buffer: Any, width: int, height: int, bytes_per_line: int, format: int) -> Any:
+    from PySide6.QtGui import QImage
+
+    return QImage(buffer, width, height, bytes_per_line, QImage.Format(format)).copy()
+
+
+def _reduce_image(obj: Any) -> Any:
+    """
+    Reduces an image to an out-of-band buffer, or provides NotImplemented to use the normal reduction.
+    """
+    # Images can only be sent if Qt is already imported.
+    qt_gui = modules.get("PySide6.QtGui")
+    if qt_gui is not None and type(obj) is qt_gui.QImage:
+        bits = PickleBuffer(memoryview(obj.constBits())[: obj.sizeInBytes()])
+        return _load_image, (bits, obj.width(), obj.height(), obj.bytesPerLine(), obj.format().value)
+    return NotImplemented
+
+
+def _reduce(obj: Any) -> Any:
+    """
+    Reduces functions to their cached form and images to an out-of-band buffer, or provides NotImplemented to use the
+    normal reduction.
+    """
+    if type(obj) is FunctionType:
+        try:
+            data = _pickled_functions[obj]
+        except KeyError:
+            data = None if _pickles_by_reference(obj) else dumps_dill(obj, HIGHEST_PROTOCOL)
+            _pickled_functions[obj] = data
+        return NotImplemented if data is None else (_load_function, (data,))
+    if isinstance(obj, type) and obj.__module__ == "__main__":
+        # Like functions, the class may not exist inside the other process, so `dill` is required to pickle it.
+        raise PicklingError(f"{obj} is defined inside the main module")
+    return _reduce_image(obj)
+
+
+class _SharedBuffers:
+    """
+    Places the buffers of a message inside shared memory.
+
+    Out-of-band buffers are provided by `pickle` to `place_buffer`, and are sent in the trailer of the message.  The
+    pickler never provides bytes and byte arrays to `reducer_override`, so they are placed by `persistent_id` instead.
+    """
+
+    __slots__ = ("buffers", "persistent_buffers")
+
+    def __init__(self) -> None:
+        self.buffers: list[SharedBuffer] = []
+        self.persistent_buffers: list[SharedBuffer] = []
+
+    def place_buffer(self, buffer: PickleBuffer) -> bool:
+        shared_buffer = share(buffer.raw())
+        if shared_buffer is None:
+            return True
+        self.buffers.append(shared_buffer)
+        return False
+
+    def persistent_id(self, obj: Any) -> tuple[type, str, int] | None:
+        obj_type = type(obj)
+        if (obj_type is bytes or obj_type is bytearray) and len(obj) >= SHARED_MEMORY_THRESHOLD:
+            shared_buffer = share(memoryview(obj))
+            if shared_buffer is not None:
+                self.persistent_buffers.append(shared_buffer)
+                return obj_type, shared_buffer.name, shared_buffer.size
+        return None
+
+    def discard(self) -> None:
+        for buffer in chain(self.buffers, self.persistent_buffers):
+            discard(buffer)
+        self.buffers.clear()
+        self.persistent_buffers.clear()
+
+
+class _Pickler(Pickler):
+    reducer_override = staticmethod(_reduce)
+
+
+class _DillPickler(DillPickler):
+    # Functions are left to `dill`, which pickles them regardless.
+    reducer_override = staticmethod(_reduce_image)
+
+
+def _persistent_load(pid: tuple[type, str, int]) -> bytes | bytearray:
+    buffer_type, name, size = pid
+    return buffer_type(receive(SharedBuffer(name, size)))
+
+
+class _Unpickler(Unpickler):
+    persistent_load = staticmethod(_persistent_load)
+
+
+class _DillUnpickler(DillUnpickler):
+    persistent_load = staticmethod(_persistent_load)
+
+
+def _dump(pickler: type[Pickler], obj: Any, flags: int) -> bytes:
+    buffers = _SharedBuffers()
+    file = BytesIO()
+    file.write(b"\0")
+    try:
+        instance = pickler(file, 5, buffer_callback=buffers.place_buffer)
+        instance.persistent_id = buffers.persistent_id  # type: ignore
+        instance.dump(obj)
+    except BaseException:
+        buffers.discard()
+        raise
+
+    if buffers.buffers:
+        flags |= _SHARES_BUFFERS
+        trailer = dumps_pickle([(buffer.name, buffer.size) for buffer in buffers.buffers], HIGHEST_PROTOCOL)
+        file.write(trailer)
+        file.write(_TRAILER.pack(len(trailer)))
+    view = file.getbuffer()
+    view[0] = flags
+    del view
+    return file.getvalue()
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Pickles an object with `pickle`, falling back to `dill` if `pickle` cannot pickle it.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to be pickled.
+
+    Returns
+    -------
+    bytes
+        The pickled object, which must be unpickled by `loads` exactly once.
+
+    Raises
+    ------
+    PicklingError
+        The object cannot be pickled by `dill` either.
+    """
+    try:
+        return _dump(_Pickler, obj, 0)
+    except (PicklingError, AttributeError, TypeError):
+        pass
+    try:
+        return _dump(_DillPickler, obj, _DILLED)
+    except (PicklingError, AttributeError, TypeError) as e:
+        raise PicklingError(f"{obj} cannot be pickled: {e}") from e
+
+
+def loads(data: bytes | memoryview) -> Any:
+    """
+    Unpickles an object pickled by `dumps`.
+
+    Parameters
+    ----------
+    data : bytes | memoryview
+        The pickled object.
+
+    Returns
+    -------
+    Any
+        The object which was pickled.
+    """
+    data = memoryview(data)
+    flags, end = data[0], len(data)
+    buffers: list[Any] = []
+    if flags & _SHARES_BUFFERS:
+        (size,) = _TRAILER.unpack_from(data, end - _TRAILER.size)
+        end -= _TRAILER.size + size
+        buffers = [receive(SharedBuffer(*buffer)) for buffer in loads_pickle(data[end : end + size])]
+    unpickler = _DillUnpickler if flags & _DILLED else _Unpickler
+    return unpickler(BytesIO(data[1:end]), buffers=buffers).load()
+
+
+class PickledCallable:
+    """
+    A callable which is pickled once by the process which created it, and is only unpickled once it is called.
+
+    A process which only forwards the callable to another process, such as the task manager, never unpickles it, so
+    the buffers it placed inside shared memory are forwarded untouched instead of being received and placed again.
+
+    Attributes
+    ----------
+    data: bytes
+        The callable pickled by `dumps`.
+
+    Notes
+    -----
+        The shared buffers of the callable can only be received once, so it must be called or discarded by exactly
+    one process.
+    """
+
+    def __init__(self, data: bytes, name: str, qualname: str, module: str | None):
+        self.data = data
+        self.__name__ = name
+        self.__qualname__ = qualname
+        self.__module__ = module  # type: ignore
+        self._callable: Callable | None = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.__module__}.{self.__qualname__})"
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (self.data, self.__name__, self.__qualname__, self.__module__)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.load()(*args, **kwargs)
+
+    @classmethod
+    def from_callable(cls, function: Callable) -> PickledCallable:
+        """
+        Pickles a callable, keeping its name so it can be identified without unpickling it.
+
+        Parameters
+        ----------
+        function : Callable
+            The callable to be pickled.
+
+        Returns
+        -------
+        PickledCallable
+            The pickled callable.
+
+        Raises
+        ------
+        PicklingError
+            The callable cannot be pickled.
+        """
+        name: str = getattr(function, "__name__", type(function).__name__)
+        qualname: str = getattr(function, "__qualname__", name)
+        return cls(dumps(function), name, qualname, getattr(function, "__module__", None))
+
+    def load(self) -> Callable:
+        """
+        Unpickles the callable, receiving its shared buffers.
+
+        Returns
+        -------
+        Callable
+            The callable which was pickled.
+        """
+        if self._callable is None:
+            self._callable = loads(self.data)
+        return self._callable
+
+    def discard(self) -> None:
+        """
+        Receives the shared buffers of a callable which will never be called, so the process which sent them can
+        release them.
+        """
+        self.load()
+        self._callable = None
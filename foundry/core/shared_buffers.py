@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from atexit import register
+from contextlib import suppress
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from os import name as os_name
+from weakref import ReferenceType, ref
+
+from attr import attrs
+from numpy import frombuffer, ndarray, uint8
+
+SHARED_MEMORY_THRESHOLD: int = 2**18
+"""
+The minimum amount of bytes a buffer must contain to be placed inside shared memory instead of being pickled.
+"""
+
+_HEADER_SIZE: int = 8
+"""
+The amount of bytes before the buffer inside a shared memory block.  The first byte is set once the block is
+received, so the process which sent it can release it.
+"""
+
+_USES_POSIX: bool = os_name == "posix"
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class SharedBuffer:
+    """
+    A handle to a buffer placed inside a shared memory block, which is sent in place of the buffer.
+
+    Attributes
+    ----------
+    name: str
+        The name of the shared memory block.
+    size: int
+        The amount of bytes inside the buffer.
+    """
+
+    name: str
+    size: int
+
+
+_sent_blocks: list[SharedMemory] = []
+"""
+The shared memory blocks created by this process which may not have been received yet.
+"""
+
+_received_blocks: list[tuple[ReferenceType, SharedMemory]] = []
+"""
+The shared memory blocks used by buffers received by this process, which are released once the buffer is deleted.
+"""
+
+
+def release_shared_buffers() -> None:
+    """
+    Releases every shared memory block that was received by the other process or is no longer used by a buffer.
+
+    Notes
+    -----
+        Blocks are released every time a buffer is sent or received, so this only needs to be called to release
+    blocks sooner.
+    """
+    for block in _sent_blocks.copy():
+        if block.buf[0]:
+            block.close()
+            _sent_blocks.remove(block)
+    for buffer, block in _received_blocks.copy():
+        if buffer() is None:
+            block.close()
+            _received_blocks.remove((buffer, block))
+
+
+def _unlink(block: SharedMemory) -> None:
+    """
+    Removes a block created by this process which was never received.
+    """
+    if _USES_POSIX:
+        with suppress(FileNotFoundError):
+            block.unlink()
+
+
+def start_resource_tracker() -> None:
+    """
+    Starts the resource tracker of this process, so every process forked from it shares the same tracker.
+
+    Notes
+    -----
+        A block stays registered with the resource tracker until it is received, so the tracker removes every block
+    which was never received once the processes sharing it exit, even if a process exits without running its exit
+    handlers, such as a forked process.  The tracker must be shared for the receiver to unregister the block.
+    """
+    if _USES_POSIX:
+        resource_tracker.ensure_running()
+
+
+@register
+def _release_all_shared_buffers() -> None:
+    for block in _sent_blocks:
+        received: bool = bool(block.buf[0])
+        block.close()
+        if not received:
+            _unlink(block)
+    _sent_blocks.clear()
+    for _, block in _received_blocks:
+        with suppress(BufferError):
+            block.close()
+    _received_blocks.clear()
+
+
+def share(buffer: memoryview) -> SharedBuffer | None:
+    """
+    Places a large buffer inside a shared memory block.
+
+    Parameters
+    ----------
+    buffer : memoryview
+        A contiguous view of the buffer to be shared.
+
+    Returns
+    -------
+    SharedBuffer | None
+        A handle to the shared buffer or None if `buffer` is smaller than `SHARED_MEMORY_THRESHOLD` bytes.
+    """
+    if buffer.nbytes < SHARED_MEMORY_THRESHOLD:
+        return None
+    release_shared_buffers()
+    block = SharedMemory(create=True, size=_HEADER_SIZE + buffer.nbytes)
+    block.buf[_HEADER_SIZE : _HEADER_SIZE + buffer.nbytes] = buffer.cast("B")
+    # The receiver is responsible for unlinking the block, until then the resource tracker removes it if it leaks.
+    _sent_blocks.append(block)
+    return SharedBuffer(block.name, buffer.nbytes)
+
+
+def discard(buffer: SharedBuffer) -> None:
+    """
+    Releases a shared buffer which will never be received, such as when the message containing it failed to be sent.
+
+    Parameters
+    ----------
+    buffer : SharedBuffer
+        The handle to the shared buffer.
+    """
+    for block in _sent_blocks:
+        if block.name == buffer.name:
+            _sent_blocks.remove(block)
+            block.close()
+            _unlink(block)
+            return
+
+
+def receive(buffer: SharedBuffer) -> ndarray:
+    """
+    Receives a buffer placed inside a shared memory block by another process.
+
+    The buffer is not copied, instead it refers directly to the shared memory block, which is released once every
+    object using the buffer is deleted.
+
+    Parameters
+    ----------
+    buffer : SharedBuffer
+        The handle to the shared buffer.
+
+    Returns
+    -------
+    ndarray
+        The bytes of the buffer which was shared.
+    """
+    release_shared_buffers()
+    block = SharedMemory(buffer.name)
+    if _USES_POSIX:
+        # The name is no longer required, as the block remains until every process closes it.  Unlinking the block
+        # also unregisters it from the resource tracker shared with the sender.
+        block.unlink()
+    block.buf[0] = 1
+
+    value = frombuffer(block.buf, uint8, buffer.size, _HEADER_SIZE)
+    _received_blocks.append((ref(value), block))
+    return value
@@ -0,0 +1,629 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Sequence
+from itertools import chain
+from logging import DEBUG, Logger, NullHandler, getLogger
+from types import MethodType
+from typing import Generic, Literal, NoReturn, ParamSpec, TypeVar, overload
+from warnings import warn
+from weakref import ReferenceType, WeakMethod, finalize, ref
+
+from attr import attrs, field
+
+_T = TypeVar("_T")
+_U = TypeVar("_U")
+_P = ParamSpec("_P")
+
+
+SIGNAL_LOGGER_NAME: Literal["SIG"] = "SIG"
+
+
+signal_log: Logger = getLogger(SIGNAL_LOGGER_NAME)
+signal_log.addHandler(NullHandler())
+
+
+def _remove_garbage(func: Callable[_P, _T]) -> Callable[_P, _T]:
+    """
+    A decorator for a method that needs to remove garbage subscribers.
+
+    Parameters
+    ----------
+    func : Callable[_P, _T]
+        The method to be decorated.
+
+    Returns
+    -------
+    Callable[_P, _T]
+        The decorated method.
+
+    Notes
+    -----
+        `func` must be a method of `Signal` or a subclass.
+    """
+
+    def remove_garbage(*args: _P.args, **kwargs: _P.kwargs):
+        args[0]._remove_garbage_subscribers()  # type: ignore
+        return func(*args, **kwargs)
+
+    return remove_garbage
+
+
+@attrs(slots=True, auto_attribs=True)
+class _Connection(Generic[_T, _U]):
+    parent_signal_instance: SignalInstance[_T]
+    signal_instance: SignalInstance[_U]
+    converter: Callable[[_U], _T] | None = None
+    condition: Callable[[_U], bool] | None = None
+
+    def __str__(self) -> str:
+        return (
+            f"link<{self.signal_instance.instance}::{self.signal_instance.signal.name}, "
+            + f"{self.parent_signal_instance.instance}::{self.parent_signal_instance.signal.name}>"
+        )
+
+    def __call__(self, value: _U) -> None:
+        if self.condition is None or self.condition(value):
+            with SignalBlocker(self.signal_instance):
+                if not self.parent_signal_instance.is_silenced:
+                    signal_log.info(
+                        "%s is forwarding %s to %s", self.signal_instance, value, self.parent_signal_instance
+                    )
+                self.parent_signal_instance.emit(
+                    value if self.converter is None else self.converter(value)  # type: ignore
+                )
+
+
+@attrs(slots=True, auto_attribs=True, eq=False, repr=False)
+class _SignalElement(Generic[_T]):
+    """
+    A representation of a subscriber for a signal.
+
+    Parameters
+    ----------
+    Generic : _T
+        The type that the subscriber will receive from the signal.
+
+    Attributes
+    ----------
+    uid: int
+        The identity associated with the object which is subscribing.
+    subscriber: Callable[[_T], None]
+        The method to be called when the signal emits an event.
+    is_silenced: bool = False
+        If the subscriber should accept the incoming signal.
+    uses_left: int | None = None
+        The amount of uses that a signal can continued to be used for.
+    """
+
+    uid: int
+    subscriber: Callable[[_T], None] | ref
+    is_silenced: bool = False
+    uses_left: int | None = field(default=None)
+
+    @uses_left.validator  # type: ignore
+    def _check_uses_left(self, attribute, value) -> None:
+        if value is not None and value < 0:
+            signal_log.warning("%s was provided with a negative value: %s", self, value)
+            warn(RuntimeWarning(f"{self} does not permit {value} to be less than 0."))
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({hex(self.uid)}, {self._get_callable_name(self.subscriber_callable)},"
+            + f" {self.is_silenced}, {self.uses_left})"
+        )
+
+    def __str__(self) -> str:
+        return self._get_callable_name(self.subscriber_callable)
+
+    def __eq__(self, other) -> bool:
+        return (
+            self.uid == other.uid and self.subscriber_callable is other.subscriber_callable
+            if isinstance(other, _SignalElement)
+            else NotImplemented
+        )
+
+    def __call__(self, value: _T) -> None:
+        if self.uses_left:
+            self.uses_left -= 1
+        return self.subscriber_callable(value)
+
+    @property
+    def subscriber_callable(self) -> Callable[[_T], None]:
+        if isinstance(self.subscriber, (ref, WeakMethod)):
+            return self.subscriber()  # type: ignore
+        return self.subscriber
+
+    @staticmethod
+    def _get_callable_name(callable_) -> str:
+        if isinstance(callable_, (_SignalElement, _Connection)):
+            return f"{callable_}"
+        try:
+            return f"{callable_.__name__}"
+        except AttributeError:
+            return f"{callable_}"
+
+
+@attrs(slots=True, auto_attribs=True, init=False)
+class Signal(Generic[_T]):
+    """
+    A representation of an observable action which can be communicated.
+
+    Parameters
+    ----------
+    Generic : _T
+        The result of the action took.
+
+    Attributes
+    ----------
+    subscribers: list[_SignalElement]
+        A list of interested parties which will be called when the action of interest is taken.
+    name: str | None
+        The user friendly name of this signal, None by default.
+    _dead_subscribers: bool
+        If there exists a subscriber which needs to be collected by the garbage collector.
+    """
+
+    subscribers: list[_SignalElement]
+    name: str | None
+    _dead_subscribers: bool
+
+    @overload
+    def __init__(self, *, subscribers: None = None, name: str | None = None) -> None:
+        pass
+
+    @overload
+    def __init__(
+        self, *args: Sequence[_SignalElement], subscribers: Sequence[_SignalElement], name: str | None = None
+    ) -> None:
+        pass
+
+    @overload
+    def __init__(self, *args: _SignalElement, subscribers: None = None, name: str | None = None) -> None:
+        pass
+
+    def __init__(self, *args, subscribers: Sequence[_SignalElement] | None = None, name: str | None = None) -> None:
+        self.name = name
+        if len(args) > 1 and subscribers is None:
+            self.subscribers = list(args)
+        elif len(args) == 1:
+            self.subscribers = list(chain(args)) + list(subscribers) if subscribers else []
+        elif subscribers is not None:
+            self.subscribers = list(subscribers)
+        else:
+            self.subscribers = []
+        self._dead_subscribers = False
+
+    def __str__(self) -> str:
+        if self.name:
+            return f"{self.name}<{', '.join(str(s) for s in self)}>"
+        else:
+            return f"<{', '.join(str(s) for s in self)}>"
+
+    def __missing__(self, key) -> NoReturn:
+        raise KeyError(key)
+
+    def __getitem__(self, key) -> _SignalElement:
+        for value in self.subscribers:
+            if value == key:
+                return value
+        return self.__missing__(key)
+
+    def __contains__(self, value: _SignalElement) -> bool:
+        return any(v == value for v in self.subscribers)
+
+    def __len__(self) -> int:
+        return len(self.subscribers)
+
+    def __iter__(self) -> Iterator[_SignalElement[_T]]:
+        return iter(self.subscribers)
+
+    def __bool__(self):
+        return bool(self.subscribers)
+
+    @_remove_garbage
+    def clear(self, *instances: object) -> None:
+        """
+        Removes all subscribers for a signal.
+
+        Parameters
+        ----------
+        instances : object
+            The instances to remove subscribers from.
+        """
+        subscribers: list[_SignalElement[_T]] = []
+        if len(instances):
+            for element in self.subscribers:
+                if any(id(instance) == element.uid for instance in instances):
+                    signal_log.debug("%s removed %s from %s", self.__class__.__name__, element, self)
+                else:
+                    subscribers.append(element)
+        self.subscribers = subscribers
+
+    @_remove_garbage
+    def connect(
+        self, subscriber: Callable[[_T], None], instance: object, weak: bool = True, max_uses: int | None = None
+    ) -> None:
+        """
+        Associates a subscriber to this signal, to be called when this signal receives an action.
+
+        Parameters
+        ----------
+        subscriber : Callable[[_T], None]
+            The subscriber, which takes the result of the action from this signal.
+        instance : object
+            The object which is interested in `subscriber`.
+        weak : bool, optional
+            If the subscriber should automatically be removed when it is no longer required, by default True
+        max_uses : int | None, optional
+            Determines if the subscriber should be removed after a fixed number of uses, by default None or
+            infinite uses are permitted.
+
+        Notes:
+            For any given object, it can only be connected to a signal once.  This is done with the intention of
+        stopping unknown state, as it is indeterminate which will be called first.  If this is done, the second
+        call will be ignored and a warning will be provided.
+        """
+        if weak:
+            if isinstance(subscriber, MethodType):
+                finalize(subscriber.__self__, self._remove_subscriber)
+                subscriber = WeakMethod(subscriber)  # type: ignore
+            else:
+                finalize(subscriber, self._remove_subscriber)
+                subscriber = ref(subscriber)  # type: ignore
+        element: _SignalElement = _SignalElement(id(instance), subscriber, uses_left=max_uses)
+
+        if element not in self:
+            signal_log.debug("%s adding %s to %s", instance.__class__.__name__, element, self)
+            self.subscribers.append(element)
+        else:
+            signal_log.warning("%s failed to add %s to %s", instance.__class__.__name__, element, self)
+
+    @_remove_garbage
+    def disconnect(self, subscriber: Callable[[_T], None], instance: object | None) -> None:
+        """
+        Allows for a subscriber with or without respect to a given instance to no longer receive actions from
+        this signal.
+
+        Parameters
+        ----------
+        subscriber : Callable[[_T], None]
+            The subscriber, which took the result of the action from this signal.
+        instance : object | None
+            The object which was interested in `subscriber`.
+        """
+        element: _SignalElement = _SignalElement(id(instance), subscriber)
+        for idx, sub in enumerate(self.subscribers):
+            if sub == element:
+                del self.subscribers[idx]
+                signal_log.debug("%s removed %s from %s", self.__class__.__name__, element, self)
+                break
+
+    @_remove_garbage
+    def emit(self, value: _T, instance: object) -> None:
+        """
+        Emits an action to `subscribers`.
+
+        Parameters
+        ----------
+        value : _T
+            The result of an action taken.
+        instance : object
+            The object associated with this action.
+        """
+        for subscriber in self.subscribers:
+            if subscriber.uid == id(instance) and not subscriber.is_silenced:
+                signal_log.debug("%s notifying %s of %s", self.name, subscriber, value)
+                subscriber(value)
+                if subscriber.uses_left is not None and not subscriber.uses_left:
+                    self._remove_subscriber()
+
+    @_remove_garbage
+    def is_silenced(self, instance: object) -> bool:
+        """
+        Determines if `instance` has silenced their subscriber with respect to this signal.
+
+        Parameters
+        ----------
+        instance : object
+            The object which could have silenced their subscriber.
+
+        Returns
+        -------
+        bool
+            If `instance` has silenced their subscriber.
+        """
+        return not any(sub.uid == id(instance) and not sub.is_silenced for sub in self)
+
+    @_remove_garbage
+    def silence(self, instance: object, is_silenced: bool) -> None:
+        """
+        Sets the silence status for `instance`'s subscriber.
+
+        Parameters
+        ----------
+        instance : object
+            The object which is setting their subscriber's silence status.
+        is_silenced : bool
+            The new silence status to be set.
+        """
+        if DEBUG >= signal_log.level:
+            _prior_silenced = self.is_silenced(instance)
+        for idx, sub in enumerate(self.subscribers):
+            if sub.uid == id(instance):
+                self.subscribers[idx].is_silenced = is_silenced
+        if DEBUG >= signal_log.level and _prior_silenced != is_silenced:  # type: ignore
+            signal_log.debug(f"{instance}::{self.name} {'silenced' if is_silenced else 'unsilenced'}")
+
+    def _remove_garbage_subscribers(self) -> None:
+        """
+        Removes subscribers that need to be garbage collected.
+        """
+        if self._dead_subscribers:
+            self._dead_subscribers = False
+            self.subscribers = [
+                r
+                for r in self.subscribers
+                if (not isinstance(r.subscriber, ReferenceType) or r.subscriber() is not None)
+                and (r.uses_left is None or r.uses_left)
+            ]
+
+    def _remove_subscriber(self) -> None:
+        """
+        Notifies the signal that subscribers need to be cleaned before any action is taken.
+        """
+        signal_log.debug("%s queued garbage collection", self.name)
+        self._dead_subscribers = True
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class SignalInstance(Generic[_T]):
+    """
+    A representation of a signal with respect to a specific provided instance.
+
+    Parameters
+    ----------
+    Generic : _T
+        The value provided by the signal.
+
+    Attributes
+    ----------
+    instance: object
+        The instance of interest with respect to `signal`.
+    signal: Signal[_T]
+        The underlying signal.
+
+    Notes
+    -----
+    The primary purpose of this class is to encapsulate the signal with respect to the instance.
+    By doing this, it makes it much hard to mistakenly override other instance's signal-subscriber relationships.
+    It also provides a series of helper methods to ease use with the signal architecture.
+    """
+
+    instance: object
+    signal: Signal[_T]
+
+    def __attrs_post_init__(self) -> None:
+        if DEBUG >= signal_log.level and not isinstance(self.signal, Signal):
+            signal_log.warning("%s was initialized with a %s, not a Signal", self, type(self.signal))
+            warn(RuntimeWarning(f"{self.signal} is not a Signal"))
+
+    def __str__(self) -> str:
+        if self.signal.name is None:
+            for name in dir(self.instance):
+                if self.signal is getattr(self.instance, name):
+                    self.signal.name = name
+                    break
+            else:
+                signal_log.warning("%s could not find %s in %s", self.__class__.__name__, self.signal, self.instance)
+                return repr(self)
+        return f"{self.instance}::{self.signal.name}"
+
+    def __missing__(self, key) -> NoReturn:
+        raise KeyError(key)
+
+    def __getitem__(self, key) -> _SignalElement:
+        for value in filter(lambda v: v.uid == id(self.instance), self.signal):
+            if value == key:
+                return value
+        return self.__missing__(key)
+
+    def __contains__(self, value: _SignalElement) -> bool:
+        return any(v == value and v.uid == id(self.instance) for v in self.signal)
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    def __iter__(self) -> Iterator[_SignalElement[_T]]:
+        return iter(filter(lambda v: v.uid == id(self.instance), self.signal))
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    @property
+    def is_silenced(self) -> bool:
+        """
+        Determines if this has been silenced.
+
+        Returns
+        -------
+        bool
+            If this has been silenced.
+        """
+        return self.signal.is_silenced(self.instance)
+
+    def clear(self) -> None:
+        """
+        Removes all subscribers for a signal.
+        """
+        self.signal.clear(self.instance)
+
+    @overload
+    def link(
+        self,
+        signal_instance: SignalInstance[_T],
+        converter: None = None,
+        condition: Callable[[_T], bool] | None = None,
+    ) -> None:
+        ...
+
+    @overload
+    def link(
+        self,
+        signal_instance: SignalInstance[_U],
+        converter: Callable[[_U], _T],
+        condition: Callable[[_U], bool] | None = None,
+    ) -> None:
+        ...
+
+    def link(
+        self,
+        signal_instance: SignalInstance[_U],
+        converter: Callable[[_U], _T] | None = None,
+        condition: Callable[[_U], bool] | None = None,
+    ) -> None:
+        """
+        Links another signal instance to this signal instance.
+
+        Parameters
+        ----------
+        signal_instance : SignalInstance[_U]
+            The other signal instance which is interested in this signal instance.
+        converter : Callable[[_T], _U] | None, optional
+            The converter required to understand the actions of this signal in terms of the provided
+            signal instance, by default None
+        condition : Callable[[_T], bool] | None, optional
+            The conditions required to forward_action this signal instance's actions to the provided
+            signal instance , by default None
+        """
+        if not isinstance(signal_instance, SignalInstance):
+            signal_log.warning("%s can only link %s, not %s", self, self.__class__.__name__, signal_instance)
+        connection: _Connection[_T, _U] = _Connection(self, signal_instance, converter, condition)
+        signal_log.info("%s linking %s", self, connection)
+        signal_instance.connect(connection, False)
+
+    def connect(self, subscriber: Callable[[_T], None], weak: bool = True, max_uses: int | None = None) -> None:
+        """
+        Associates a subscriber to this signal, to be called when this signal instance receives an action.
+
+        Parameters
+        ----------
+        subscriber : Callable[[_T], None]
+            The subscriber, which takes the result of the action from this signal instance.
+        weak : bool, optional
+            If the subscriber should automatically be removed when it is no longer required, by default True
+        max_uses : int | None, optional
+            Determines if the subscriber should be removed after a fixed number of uses, by default None or
+            infinite uses are permitted.
+        """
+        signal_log.debug("%s adding %s", self, _SignalElement._get_callable_name(subscriber))
+        self.signal.connect(subscriber, self.instance, weak, max_uses)
+
+    def disconnect(self, subscriber: Callable[[_T], None]) -> None:
+        """
+        Allows for a subscriber to no longer receive actions from this signal instance.
+
+        Parameters
+        ----------
+        subscriber : Callable[[_T], None]
+            The subscriber, which took the result of the action from this signal instance.
+        """
+        signal_log.info("%s removing %s", self, _SignalElement._get_callable_name(subscriber))
+        self.signal.disconnect(subscriber, self.instance)
+
+    def emit(self, value: _T) -> None:
+        """
+        Emits an action to its subscribers.
+
+        Parameters
+        ----------
+        value : _T
+            The result of an action taken.
+        """
+        if not self.is_silenced:
+            signal_log.info("%s emitting %s to <%s>", self, value, ", ".join(str(v) for v in iter(self)))
+            self.signal.emit(value, self.instance)
+
+    def silence(self, silence: bool) -> None:
+        """
+        Sets the silence status for this signal instance.
+
+        Parameters
+        ----------
+        is_silenced : bool
+            The new silence status to be set.
+        """
+        self.signal.silence(self.instance, silence)
+
+
+@attrs(auto_attribs=True)
+class SignalTester:
+    """
+    A context manager for testing that a signal is emitted.
+
+    Attributes
+    ----------
+    signal: SignalInstance
+        The signal to under test.
+    count: int = 0
+        The amount of times the signal was called.
+    """
+
+    signal: SignalInstance
+    count: int = 0
+
+    def increment_counter(self, *_) -> None:
+        self.count += 1
+
+    def __enter__(self) -> SignalTester:
+        self.signal.connect(self.increment_counter, weak=False)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.signal.disconnect(self.increment_counter)
+
+
+@attrs(auto_attribs=True)
+class SignalBlocker:
+    """
+    A context manager for blocking specific signals.
+
+    Attributes
+    ----------
+    signal: SignalInstance | Sequence[SignalInstance]
+        The signals to be blocked temporarily.
+    _silenced: bool | Sequence[bool]
+        The prior state of the signals.
+
+    Notes
+    -----
+        This context manager ensures that signals will remain silenced if they were set prior.
+    """
+
+    signal: SignalInstance | Sequence[SignalInstance]
+
+    def _signal_names(self) -> str:
+        if isinstance(self.signal, SignalInstance):
+            return f"<{self.signal}>"
+        return f"<{', '.join(str(s) for s in self.signal)}>"
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}{self._signal_names()}"
+
+    def __enter__(self):
+        signal_log.debug("%s blocking %s", self.__class__.__name__, self._signal_names())
+        if isinstance(self.signal, SignalInstance):
+            self._silenced = self.signal.is_silenced
+            self.signal.silence(True)
+        else:
+            self._silenced = [signal.is_silenced for signal in self.signal]
+            for signal in self.signal:
+                signal.silence(True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        signal_log.debug("%s stop blocking %s", self.__class__.__name__, self._signal_names())
+        if isinstance(self.signal, Sequence):
+            for signal, silenced in zip(self.signal, self._silenced):  # type: ignore
+                signal.silence(silenced)
+        else:
+            self.signal.silence(self._silenced)  # type: ignore
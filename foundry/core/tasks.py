@@ -1,36 +1,68 @@
 from __future__ import annotations
 
 from asyncio import (
+    FIRST_COMPLETED,
+    AbstractEventLoop,
+    CancelledError,
+    Event,
+    Future,
     TimeoutError,
     ensure_future,
     gather,
     get_event_loop,
+    get_running_loop,
     run,
     sleep,
+    wait,
     wait_for,
+    wrap_future,
 )
 from atexit import register
-from collections.abc import Callable, Mapping, Sequence
+from bisect import insort
+from collections import deque
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from concurrent.futures import Future as ConcurrentFuture
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from copy import copy
-from enum import Enum
+from enum import Enum, IntEnum
 from itertools import chain
 from logging import DEBUG, WARNING, Logger, NullHandler, getLogger
 from multiprocessing import Pipe, Process, cpu_count, current_process
+from multiprocessing.connection import Connection as PipeConnection
 from multiprocessing.connection import _ConnectionBase as Connection
-from random import choice
-from signal import SIGINT, SIGTERM, signal
-from time import time
-from typing import Any, ClassVar, Generic, Literal, ParamSpec, TypeVar, overload
+from multiprocessing.connection import wait as wait_for_readable
+from multiprocessing.reduction import recv_handle, send_handle
+from operator import attrgetter
+from os import getppid
+from pickle import PicklingError
+from signal import SIG_DFL, SIGINT, SIGTERM, default_int_handler, signal
+from threading import local
+from time import perf_counter, time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generic,
+    Literal,
+    ParamSpec,
+    TypeVar,
+    overload,
+)
 from warnings import catch_warnings, simplefilter
+from weakref import WeakKeyDictionary
 
-from attr import attrs
-from dill import dumps, loads, pickles
+from attr import attrs, evolve, field
 from dill.detect import badtypes
 from func_timeout import FunctionTimedOut, func_timeout
 from nest_asyncio import apply as allow_nesting
 
-from foundry.core.gui import Signal, SignalInstance
+from foundry.core.serialization import PickledCallable, dumps, loads
+from foundry.core.shared_buffers import start_resource_tracker
+from foundry.core.signal import Signal, SignalInstance
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import QObject, QSocketNotifier
 
 LOGGER_NAME: Literal["TASK"] = "TASK"
 
@@ -46,6 +78,11 @@ ReplyValue = TypeVar("ReplyValue")
 FAST_CONNECTION_POLLING_RATE: float = 0.0001
 """
 The desired rate of polling for an real-time process.
+
+Notes
+-----
+    Connections are only polled when the event loop cannot watch their file descriptors, such as the proactor event
+loop on Windows.  Otherwise, processes sleep until a connection becomes readable, see `wait_for_connections`.
 """
 
 SLOW_CONNECTION_POLLING_RATE: float = FAST_CONNECTION_POLLING_RATE * 10
@@ -63,10 +100,10 @@ WORKER_SLEEP_DURATION: float = SLOW_CONNECTION_POLLING_RATE
 The desired rate of polling for a worker process of the task manager.
 """
 
-AUTOMATED_REMOVAL_DURATION: float = 5
+AUTOMATED_REMOVAL_DURATION: float = 300
 """
 The amount of seconds the task manager will wait without any response from the parent process until it will
-automatically stop itself and terminate gracefully.
+automatically stop itself and terminate gracefully, by default.  See `KeepAlivePolicy`.
 
 Notes
 -----
@@ -76,6 +113,18 @@ processes finish, so testing does not require a SEGKILL signal to end the testin
 redundancy in killing the process.
 """
 
+WORKER_REMOVAL_DURATION: float = 30
+"""
+The amount of seconds a worker may be idle before the task manager stops it, by default.  Workers are only stopped
+while the task manager has more than its minimum amount of workers.  See `KeepAlivePolicy`.
+"""
+
+MINIMUM_WORKER_COUNT: int = 1
+"""
+The amount of workers started alongside the task manager and kept alive while it runs, by default.  See
+`KeepAlivePolicy`.
+"""
+
 FORCE_TERMINATION_TIMEOUT: float = 0.5
 """
 The amount of time a terminating task manager is willing to wait on its workers to terminate.
@@ -91,14 +140,49 @@ RESPONSIVE_TIMEOUT: float = 0.1
 The maximum amount of time a responsive task should take without getting timed out.
 """
 
+WORKER_THREAD_COUNT: int = 2
+"""
+The amount of threads each worker performs tasks on, which allows tasks waiting on I/O to overlap.
+"""
+
+MAXIMUM_WORKER_TASKS: int = WORKER_THREAD_COUNT + 1
+"""
+The maximum amount of tasks a worker is sent at once.  Additional tasks wait inside the task manager, so they can be
+given to whichever worker becomes available first.
+
+Notes
+-----
+    A worker is sent one more task than it has threads, so a thread can begin its next task without waiting on the
+task manager.
+"""
+
+DEFAULT_TASK_COST: float = 0.01
+"""
+The estimated amount of seconds a task takes before any task of its kind has finished.
+"""
+
+TASK_COST_SMOOTHING: float = 0.25
+"""
+The weight of the latest duration of a task when estimating how long tasks of its kind take.
+"""
+
 
 class NotAPickleException(ValueError):
     pass
 
 
+class WorkerDiedException(RuntimeError):
+    """
+    Raised for a task which was being performed each time its worker died, so it is not sent to another worker again.
+    """
+
+
 class DilledConnection(Connection):
     """
-    Decorates a connection object to use `dill` instead of `pickle` so we can serialize additional objects.
+    Decorates a connection object to fall back to `dill` when `pickle` cannot serialize an object.
+
+    Large buffers, such as the ROM or rendered images, are placed inside shared memory instead of being sent through
+    the connection, see `foundry.core.serialization`.
     """
 
     def __init__(self, connection: Connection):
@@ -168,6 +252,107 @@ def dill_connection(con1: Connection, con2: Connection) -> tuple[DilledConnectio
     return DilledConnection(con1), DilledConnection(con2)
 
 
+_readers: WeakKeyDictionary[AbstractEventLoop, dict[int, set[Future[None]]]] = WeakKeyDictionary()
+"""
+The futures of each event loop which are waiting for a file descriptor to become readable.
+
+Notes
+-----
+    An event loop can only have a single reader for each file descriptor, so every coroutine waiting on the same
+connection shares a single reader, which wakes all of them.
+"""
+
+
+def _wake_readers(loop: AbstractEventLoop, fd: int) -> None:
+    """
+    Wakes every coroutine waiting for a file descriptor to become readable and stops watching it.
+
+    Parameters
+    ----------
+    loop : AbstractEventLoop
+        The event loop watching the file descriptor.
+    fd : int
+        The file descriptor.
+    """
+    futures: set[Future[None]] = _readers.get(loop, {}).pop(fd, set())
+    loop.remove_reader(fd)
+    for future in futures:
+        if not future.done():
+            future.set_result(None)
+
+
+async def _poll_connections(
+    connections: Sequence[Connection], timeout: float | None, wakeup: Event | None, polling_rate: float
+) -> bool:
+    start: float = time()
+    while timeout is None or time() - start < timeout:
+        await sleep(polling_rate)
+        if any(connection.poll() for connection in connections) or (wakeup is not None and wakeup.is_set()):
+            return True
+    return False
+
+
+async def wait_for_connections(
+    connections: Sequence[Connection],
+    timeout: float | None = None,
+    wakeup: Event | None = None,
+    polling_rate: float = FAST_CONNECTION_POLLING_RATE,
+) -> bool:
+    """
+    Waits until any of the connections can be received from, without polling them.
+
+    The event loop watches the file descriptors of the connections, so the process does not use any processing while
+    it waits.  If the event loop cannot watch the connections, they are polled every `polling_rate` seconds instead.
+
+    Parameters
+    ----------
+    connections : Sequence[Connection]
+        The connections to wait on.
+    timeout : float | None, optional
+        The maximum amount of time to wait, by default None or infinite.
+    wakeup : Event | None, optional
+        An event which also ends the wait when it is set, by default None.
+    polling_rate : float, optional
+        The rate of polling if the event loop cannot watch the connections, by default FAST_CONNECTION_POLLING_RATE.
+
+    Returns
+    -------
+    bool
+        If a connection can be received from or `wakeup` was set before the wait timed out.
+    """
+    if any(connection.poll() for connection in connections) or (wakeup is not None and wakeup.is_set()):
+        return True
+
+    loop: AbstractEventLoop = get_running_loop()
+    readers: dict[int, set[Future[None]]] = _readers.setdefault(loop, {})
+    readable: Future[None] = loop.create_future()
+    waiters: list[Future] = [readable]
+    fds: list[int] = [connection.fileno() for connection in connections]
+    try:
+        for fd in fds:
+            if fd not in readers:
+                loop.add_reader(fd, _wake_readers, loop, fd)
+                readers[fd] = set()
+            readers[fd].add(readable)
+        if wakeup is not None:
+            waiters.append(ensure_future(wakeup.wait()))
+        finished, _ = await wait(waiters, timeout=timeout, return_when=FIRST_COMPLETED)
+        return bool(finished)
+    except NotImplementedError:
+        # The proactor event loop on Windows cannot watch pipes.
+        return await _poll_connections(connections, timeout, wakeup, polling_rate)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+        for fd in fds:
+            futures: set[Future[None]] | None = readers.get(fd)
+            if futures is not None:
+                futures.discard(readable)
+                if not futures:
+                    del readers[fd]
+                    loop.remove_reader(fd)
+
+
 class Requests(Enum):
     """
     The types of requests that can be sent between a requester and receiver.
@@ -249,6 +434,26 @@ class Status(Enum):
     FAILURE = 6
 
 
+class Priority(IntEnum):
+    """
+    How urgently a task must be performed.  Queued tasks are always started in order of their priority, so work the
+    user is waiting on is never delayed by speculative work.
+
+    Attributes
+    ----------
+    INTERACTIVE
+        A task the user is waiting on, such as drawing the part of a level inside the viewport.
+    PREFETCH
+        A task which will likely be required soon, such as drawing the levels next to the current level.
+    BATCH
+        A task performed in the background, such as finding the warnings of every level.
+    """
+
+    INTERACTIVE = 0
+    PREFETCH = 1
+    BATCH = 2
+
+
 @attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
 class Task(Generic[_P, _T]):
     """
@@ -262,16 +467,45 @@ class Task(Generic[_P, _T]):
         The identity of the task.
     required_tasks: Sequence[int] = []
         Tasks which are required to be complete prior to execution of this task.
+    is_required: bool = False
+        If another task requires the result of this task, so its result must be sent to the task manager.
+    priority: Priority = Priority.INTERACTIVE
+        How urgently the task must be performed.
+    key: Hashable | None = None
+        A key shared by tasks which supersede one another, such that a task cancels any unfinished task with the same
+        key, by default None.
     """
 
     _last_identity: ClassVar[int] = 0
     task: Callable[_P, _T]
     identity: int
     required_tasks: Sequence[int] = []
+    is_required: bool = False
+    priority: Priority = Priority.INTERACTIVE
+    key: Hashable | None = None
 
     def __str__(self) -> str:
         return f"<{self.task.__name__}, 0x{self.identity:02X}>"
 
+    @property
+    def name(self) -> str:
+        """
+        The name of the function of the task, which is shared by every task of its kind.
+
+        Returns
+        -------
+        str
+            The module and name of the function.
+        """
+        return f"{self.task.__module__}.{self.task.__name__}"
+
+    def discard(self) -> None:
+        """
+        Releases the shared buffers of a task which will never be performed.
+        """
+        if isinstance(self.task, PickledCallable):
+            self.task.discard()
+
     @classmethod
     def generate_identity(cls) -> int:
         """
@@ -374,11 +608,18 @@ class TaskCallback(Generic[_P, _T]):
         A function that will receive the result of the task.
     exception_handler: Callable[[Exception], None] | None = None
         A handler that resolves exceptions inside the task provided.
+    priority: Priority = Priority.INTERACTIVE
+        How urgently the task must be performed.
+    key: Hashable | None = None
+        A key shared by tasks which supersede one another, such as the level a thumbnail is drawn for, by default
+        None.
     """
 
     start_task: Callable[_P, _T]
     return_task: Callable[[_T], None]
     exception_handler: Callable[[Exception], None] | None = None
+    priority: Priority = Priority.INTERACTIVE
+    key: Hashable | None = None
 
     def __str__(self) -> str:
         return (
@@ -396,7 +637,7 @@ class TaskCallback(Generic[_P, _T]):
         Task[_P, _T]
             The internal task.
         """
-        return Task(self.start_task, Task.generate_identity())
+        return Task(self.start_task, Task.generate_identity(), priority=self.priority, key=self.key)
 
 
 @attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
@@ -412,11 +653,14 @@ class FinishedTask(Generic[_T]):
         The result of the task completed.  If None is returned, it is implied an exception occurred.
     exception: Exception | None = None
         An exception that was raised during the completion of a task, None if there does not exist.
+    duration: float = 0
+        The amount of seconds the worker spent performing the task.
     """
 
     identity: int
     result: _T | None
     exception: Exception | None = None
+    duration: float = 0
 
     def __str__(self) -> str:
         if self.result is not None:
@@ -425,7 +669,7 @@ class FinishedTask(Generic[_T]):
             return f"<0x{self.identity:02X}, failure:{self.exception}>"
 
     @classmethod
-    def as_exception(cls, identity: int, exception: Exception):
+    def as_exception(cls, identity: int, exception: Exception, duration: float = 0):
         """
         Generates a finished task for an exception.
 
@@ -435,13 +679,198 @@ class FinishedTask(Generic[_T]):
             The identity of the task completely.
         exception: Exception | None = None
             An exception that was raised during the completion of a task.
+        duration: float = 0
+            The amount of seconds the worker spent performing the task.
 
         Returns
         -------
         Self
             The finished task that raised an exception.
         """
-        return cls(identity, None, exception)
+        return cls(identity, None, exception, duration)
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class ResultPipe:
+    """
+    A notice to the main process that a worker was started, which is directly followed by the reading end of the pipe
+    the worker sends its finished tasks through.
+
+    Attributes
+    ----------
+    worker: str
+        The name of the worker.
+    """
+
+    worker: str
+
+    def __str__(self) -> str:
+        return f"<result pipe of {self.worker}>"
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class TaskNotice(Generic[_T]):
+    """
+    A notice to the task manager that a worker finished a task.  The finished task itself is sent directly to the
+    main process, so the task manager does not receive large results it does not need.
+
+    Attributes
+    ----------
+    identity: int
+        The identity of the task completed.
+    duration: float
+        The amount of seconds the worker spent performing the task.
+    result: _T | None = None
+        The result of the task, only provided if another task requires it.
+    is_cancelled: bool = False
+        If the task was cancelled, so it does not have a result.
+    """
+
+    identity: int
+    duration: float
+    result: _T | None = None
+    is_cancelled: bool = False
+
+    def __str__(self) -> str:
+        return f"<0x{self.identity:02X}, {self.duration:.4f}s>"
+
+    @classmethod
+    def from_finished_task(cls, task: Task, finished_task: FinishedTask[_T]):
+        """
+        Generates a notice for a finished task.
+
+        Parameters
+        ----------
+        task : Task
+            The task which was finished.
+        finished_task : FinishedTask[_T]
+            The receipt of the task.
+
+        Returns
+        -------
+        Self
+            The notice of the finished task, which only contains its result if it is required by another task.
+        """
+        return cls(finished_task.identity, finished_task.duration, finished_task.result if task.is_required else None)
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class TaskCancellation:
+    """
+    A notice to cancel a task which has not finished, which is sent in order with the tasks themselves.
+
+    Attributes
+    ----------
+    identity: int
+        The identity of the task to cancel.
+    """
+
+    identity: int
+
+    def __str__(self) -> str:
+        return f"<cancel 0x{self.identity:02X}>"
+
+
+@attrs(slots=True, auto_attribs=True, eq=False)
+class CancellationToken:
+    """
+    A handle to a scheduled task, which can cancel the task.
+
+    Attributes
+    ----------
+    identity: int
+        The identity of the task.
+    manager: TaskManagerProxy
+        The task manager the task was scheduled on.
+    is_cancelled: bool = False
+        If the task was cancelled or superseded, so its result will not be handled.
+    """
+
+    identity: int
+    manager: TaskManagerProxy
+    is_cancelled: bool = False
+
+    def __str__(self) -> str:
+        return f"<0x{self.identity:02X}{', cancelled' if self.is_cancelled else ''}>"
+
+    def cancel(self) -> None:
+        """
+        Cancels the task.  A task which was not started is dropped, while a task which is being performed is notified
+        through `is_task_cancelled` and its result is discarded.  Every task which requires the task is cancelled as
+        well.
+        """
+        self.manager.cancel_task(self)
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class AssignedTask:
+    """
+    A task which was assigned to a worker and has not finished.
+
+    Attributes
+    ----------
+    task: WorkerTask
+        The task assigned.
+    cost: float
+        The estimated amount of seconds the task will take.
+    """
+
+    task: WorkerTask
+    cost: float
+
+    def __str__(self) -> str:
+        return f"<{self.task}, {self.cost:.4f}s>"
+
+    @property
+    def identity(self) -> int:
+        return self.task.identity
+
+    @property
+    def priority(self) -> Priority:
+        return self.task.task.priority
+
+
+WorkerInitializer = Callable[[], object]
+"""
+A function which is called once inside each worker process before it performs any tasks, such as to preload data
+shared by many tasks.
+"""
+
+
+@attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
+class KeepAlivePolicy:
+    """
+    Determines how many workers a task manager keeps and how long it keeps them.
+
+    Workers are expensive to start, as each must run its initializers, so a task manager keeps a minimum amount of
+    workers warm.  Additional workers are only started while every worker is busy and are stopped after being idle.
+
+    Attributes
+    ----------
+    manager_duration: float | None = AUTOMATED_REMOVAL_DURATION
+        The amount of seconds without any tasks until the task manager stops itself, None if it should run until it
+        is stopped.
+    worker_duration: float | None = WORKER_REMOVAL_DURATION
+        The amount of seconds an additional worker may be idle until it is stopped, None if it should never be stopped.
+    minimum_workers: int = MINIMUM_WORKER_COUNT
+        The amount of workers started alongside the task manager and kept alive while it runs.
+    maximum_workers: int = cpu_count()
+        The maximum amount of workers the task manager may have at once.
+
+    Raises
+    ------
+    ValueError
+        The amount of workers is not possible.
+    """
+
+    manager_duration: float | None = AUTOMATED_REMOVAL_DURATION
+    worker_duration: float | None = WORKER_REMOVAL_DURATION
+    minimum_workers: int = MINIMUM_WORKER_COUNT
+    maximum_workers: int = field(factory=cpu_count)
+
+    def __attrs_post_init__(self) -> None:
+        if not 0 <= self.minimum_workers <= self.maximum_workers or self.maximum_workers < 1:
+            raise ValueError(f"{self} must allow at least one worker and at most its maximum as its minimum")
 
 
 @attrs(slots=True, auto_attribs=True, frozen=True, eq=True, hash=True)
@@ -654,16 +1083,21 @@ class Requester(Generic[RequestValue, ReplyValue]):
         ReplyValue
             The reply value.
         """
+        pipe: Connection = self.request.parent_recv_from_child_pipe
         while True:
             value: ReplyValue | None = await self.check_received(identity)
             if value is not None:
                 return value
-            if self.request.parent_recv_from_child_pipe.poll():
-                reply: Reply = self.request.parent_recv_from_child_pipe.recv()
+            if pipe.poll():
+                reply: Reply = pipe.recv()
                 if identity == reply.identity:
                     return reply.value
                 self._unhandled_requests.append(reply)
-            await sleep(FAST_CONNECTION_POLLING_RATE)
+
+                # The reply may belong to another request waiting on the pipe, which will not become readable for it.
+                _wake_readers(get_running_loop(), pipe.fileno())
+            else:
+                await wait_for_connections([pipe])
 
     async def get_answer(self, request: RequestValue) -> ReplyValue:
         """
@@ -775,11 +1209,17 @@ class TaskManagerProxy:
     outgoing_pipe: Connection
         A pipe to send tasks to worker processes.
     incoming_pipe: Connection
-        A pipe to receive tasks from worker processes.
+        A pipe to receive the result pipes of new workers and the tasks which failed as their worker died.
     requester: Requester[Requests, Status]
         A requester object to receive simple commands to workers.
     name: str = "manager"
         The name of the task manager, used for debugging.
+    keyed_tokens: dict[Hashable, CancellationToken]
+        A mapping of the keys of unfinished tasks and the token of the most recent task scheduled with each key.
+    result_pipes: list[Connection]
+        The pipes of every worker to receive finished tasks from, which are closed once their worker exits.
+    notifier: QSocketNotifier | None
+        The notifier created by `create_notifier`, which also owns a notifier for each result pipe.
     """
 
     _task_finished: ClassVar[Signal] = Signal(name="task_finished")
@@ -788,6 +1228,9 @@ class TaskManagerProxy:
     incoming_pipe: Connection
     requester: Requester[Requests, Status]
     name: str = "manager"
+    keyed_tokens: dict[Hashable, CancellationToken] = field(factory=dict)
+    result_pipes: list[Connection] = field(factory=list)
+    notifier: QSocketNotifier | None = None
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}({self.name})"
@@ -804,20 +1247,34 @@ class TaskManagerProxy:
         """
         return SignalInstance(self, self._task_finished)
 
-    def start(self, outgoing_pipe: Connection, incoming_pipe: Connection, replier: Replier) -> None:
+    def start(
+        self,
+        outgoing_pipe: Connection,
+        incoming_pipe: Connection,
+        replier: Replier,
+        policy: KeepAlivePolicy | None = None,
+        initializers: Sequence[WorkerInitializer] = (),
+    ) -> None:
         """
         Begins running the task manager in another process.
 
         Parameters
         ----------
         outgoing_pipe : Connection
-            The pipe for the task manager process to send results to this process.
+            The pipe for the task manager process to send the result pipes of its workers to this process.
         incoming_pipe : Connection
             The pipe for the task manager process to receive tasks from this process.
         replier : Replier
             A network of pipes to receive simple requests from the parent process.
+        policy : KeepAlivePolicy | None, optional
+            Determines how many workers are kept and for how long, by default `KeepAlivePolicy()`.
+        initializers : Sequence[WorkerInitializer], optional
+            The functions called inside each worker process before it performs any tasks, by default none.
         """
-        run(TaskManager(self.name, outgoing_pipe, incoming_pipe, replier).update())
+        # A forked process inherits the handlers which terminate the task manager from the parent process.
+        signal(SIGTERM, SIG_DFL)
+        signal(SIGINT, default_int_handler)
+        run(TaskManager(self.name, outgoing_pipe, incoming_pipe, replier, policy, initializers).update())
 
     def make_request(self, request: Requests, timeout: float | None = None) -> Status:
         """
@@ -882,6 +1339,8 @@ class TaskManagerProxy:
         if self.process is not None:
             self.process.terminate()
             self.process = None
+        for pipe in self.result_pipes.copy():
+            self.remove_result_pipe(pipe)
         log.info(f"{self} is terminated")
 
     def kill(self) -> None:
@@ -894,9 +1353,13 @@ class TaskManagerProxy:
             exit_after(synchronize(self.requester.get_answer), FORCE_KILL_TIMEOUT)(Requests.STOP)
             self.process.kill()
             self.process = None
+        for pipe in self.result_pipes.copy():
+            self.remove_result_pipe(pipe)
         log.info(f"{self} is killed")
 
-    def check_if_child_task_finished(self, task: TaskCallback, internal_task: Task) -> Callable[[FinishedTask], None]:
+    def check_if_child_task_finished(
+        self, task: TaskCallback, internal_task: Task, token: CancellationToken
+    ) -> Callable[[FinishedTask], None]:
         """
         Checks if a task is finished from a receiver and performs the appropriate action depending if the task
         successfully completely.
@@ -907,6 +1370,8 @@ class TaskManagerProxy:
             The task callback.
         internal_task : Task
             The task containing its unique identity.
+        token : CancellationToken
+            The token of the task, which determines if its result should be ignored.
 
         Returns
         -------
@@ -924,32 +1389,50 @@ class TaskManagerProxy:
             result : FinishedTask
                 The finished task.
             """
-            if internal_task.identity == result.identity:
-                if result.exception and task.exception_handler is not None:
-                    task.exception_handler(result.exception)
-                elif result.exception:
-                    log.warning(f"{self} received unhandled exception {result.exception} from {task}")
-                else:
-                    task.return_task(result.result)
+            if internal_task.identity != result.identity:
+                return
+            if internal_task.key is not None and self.keyed_tokens.get(internal_task.key) is token:
+                del self.keyed_tokens[internal_task.key]
+            if token.is_cancelled:
+                log.debug(f"{self} ignored cancelled task {task}")
+            elif result.exception and task.exception_handler is not None:
+                task.exception_handler(result.exception)
+            elif result.exception:
+                log.warning(f"{self} received unhandled exception {result.exception} from {task}")
+            else:
+                task.return_task(result.result)
 
         return check_if_child_task_finished
 
-    def _schedule_task(self, task: TaskCallback, internal_task: Task) -> None:
+    def _schedule_task(self, task: TaskCallback, internal_task: Task) -> CancellationToken:
         if DEBUG >= log.level:
             status = self.make_request(Requests.GET_STATUS, 1)
             if status != Status.RUNNING:
                 log.warning(f"{self} scheduling tasks when status is not running")
                 assert status == Status.RUNNING  # A task was scheduled in an invalid state.
 
-            # Make sure the user provided a task that can be pickled, otherwise we won't be able to send it.
-            if not pickles(internal_task):
-                log.critical(f"{internal_task} is not a pickle with bad types: {badtypes(internal_task)}")
-                raise NotAPickleException(f"{internal_task} is not a pickle!")
+        # The task is only serialized once, so a task that cannot be pickled is found when it is sent.  The task manager
+        # only forwards the function, so its shared buffers are received by the worker instead of being placed again.
+        try:
+            self.outgoing_pipe.send(evolve(internal_task, task=PickledCallable.from_callable(internal_task.task)))
+        except PicklingError as e:
+            log.critical(f"{internal_task} is not a pickle with bad types: {badtypes(internal_task)}")
+            raise NotAPickleException(f"{internal_task} is not a pickle!") from e
+
+        token: CancellationToken = CancellationToken(internal_task.identity, self)
+        if internal_task.key is not None:
+            superseded_token: CancellationToken | None = self.keyed_tokens.get(internal_task.key)
+            if superseded_token is not None:
+                # The task manager cancels the superseded task itself once it receives the new task.
+                superseded_token.is_cancelled = True
+            self.keyed_tokens[internal_task.key] = token
 
         # We cannot garbage collect tasks easily, so we only keep the last 100 tasks sent.
-        self.task_finished.connect(self.check_if_child_task_finished(task, internal_task), weak=False, max_uses=100)
-        self.outgoing_pipe.send(internal_task)
+        self.task_finished.connect(
+            self.check_if_child_task_finished(task, internal_task, token), weak=False, max_uses=100
+        )
         log.debug(f"{self} started task {task}")
+        return token
 
     def _limit(self, limit: bool) -> bool:
         # We will keep setting limit until it provides the correct value or we timeout.
@@ -957,7 +1440,7 @@ class TaskManagerProxy:
             Requests.LIMIT
         )
 
-    def schedule_task(self, task: TaskCallback) -> None:
+    def schedule_task(self, task: TaskCallback) -> CancellationToken:
         """
         Schedules a single task.
 
@@ -965,10 +1448,15 @@ class TaskManagerProxy:
         ----------
         task : TaskCallback
             The task to be scheduled.
+
+        Returns
+        -------
+        CancellationToken
+            A token to cancel the task.
         """
-        self._schedule_task(task, task.internal_task)
+        return self._schedule_task(task, task.internal_task)
 
-    def schedule_tasks(self, tasks: Mapping[str, tuple[TaskCallback, set[str]]]) -> None:
+    def schedule_tasks(self, tasks: Mapping[str, tuple[TaskCallback, set[str]]]) -> dict[str, CancellationToken]:
         """
         Schedules a series of tasks.
 
@@ -977,21 +1465,52 @@ class TaskManagerProxy:
         tasks : Mapping[str, tuple[TaskCallback, set[str]]]
             A mapping of a task name, task, and a set of required tasks.
 
+        Returns
+        -------
+        dict[str, CancellationToken]
+            A mapping of each task name and a token to cancel the task.
+
         Notes
         -----
             Only the tasks and their associated identities inside `tasks` are ensured to exist.
         """
         name_to_identity: dict[str, int] = {task_name: Task.generate_identity() for task_name in tasks.keys()}
+        required_task_names: set[str] = set(chain.from_iterable(required_tasks for _, required_tasks in tasks.values()))
 
         # Temporarily stop tasks from finishing, to ensure that tasks don't get garbage collected too quickly.
         self._limit(True)
 
+        tokens: dict[str, CancellationToken] = {}
         for task_name, (task, required_tasks) in tasks.items():
-            self._schedule_task(
-                task, Task(task.start_task, name_to_identity[task_name], [name_to_identity[n] for n in required_tasks])
+            tokens[task_name] = self._schedule_task(
+                task,
+                Task(
+                    task.start_task,
+                    name_to_identity[task_name],
+                    [name_to_identity[n] for n in required_tasks],
+                    task_name in required_task_names,
+                    task.priority,
+                    task.key,
+                ),
             )
 
         self._limit(False)
+        return tokens
+
+    def cancel_task(self, token: CancellationToken) -> None:
+        """
+        Cancels a task, along with every task which requires it.
+
+        Parameters
+        ----------
+        token : CancellationToken
+            The token of the task to cancel.
+        """
+        if token.is_cancelled:
+            return
+        token.is_cancelled = True
+        self.outgoing_pipe.send(TaskCancellation(token.identity))
+        log.debug(f"{self} cancelled task {token}")
 
     def poll_tasks(self) -> int:
         """
@@ -1006,12 +1525,120 @@ class TaskManagerProxy:
             log.warning(f"{self} polled a process which is not alive")
         tasks_completed = 0
         while self.incoming_pipe.poll():
-            finished_task: FinishedTask = self.incoming_pipe.recv()
-            log.debug(f"{self} finished task {finished_task}")
-            self.task_finished.emit(finished_task)
+            message: FinishedTask | ResultPipe = self.incoming_pipe.recv()
+            if isinstance(message, ResultPipe):
+                self.add_result_pipe(PipeConnection(recv_handle(self.incoming_pipe), writable=False))
+                log.debug(f"{self} received {message}")
+                continue
+            log.debug(f"{self} finished task {message}")
+            self.task_finished.emit(message)
             tasks_completed += 1
+        for pipe in self.result_pipes.copy():
+            try:
+                while pipe.poll():
+                    finished_task: FinishedTask = pipe.recv()
+                    log.debug(f"{self} finished task {finished_task}")
+                    self.task_finished.emit(finished_task)
+                    tasks_completed += 1
+            except (EOFError, OSError):
+                # The worker exited, so the task manager sends its unfinished tasks to another worker.
+                self.remove_result_pipe(pipe)
         return tasks_completed
 
+    def add_result_pipe(self, pipe: PipeConnection) -> None:
+        """
+        Adds the pipe of a worker to receive finished tasks from.
+
+        Parameters
+        ----------
+        pipe : PipeConnection
+            The reading end of the pipe, which is only written to by the worker.
+        """
+        self.result_pipes.append(DilledConnection(pipe))
+        if self.notifier is not None:
+            self._watch_result_pipe(self.result_pipes[-1])
+
+    def remove_result_pipe(self, pipe: Connection) -> None:
+        """
+        Stops receiving finished tasks from the pipe of a worker which exited and closes it.
+
+        Parameters
+        ----------
+        pipe : Connection
+            The result pipe of the worker.
+        """
+        self.result_pipes.remove(pipe)
+        if self.notifier is not None:
+            self._unwatch_result_pipe(pipe)
+        pipe.close()
+
+    def _watch_result_pipe(self, pipe: Connection) -> None:
+        from PySide6.QtCore import QSocketNotifier
+        from shiboken6 import isValid
+
+        if isValid(self.notifier):
+            notifier = QSocketNotifier(pipe.fileno(), QSocketNotifier.Type.Read, self.notifier)
+            notifier.activated.connect(lambda *_: self.poll_tasks())
+
+    def _unwatch_result_pipe(self, pipe: Connection) -> None:
+        from PySide6.QtCore import QSocketNotifier
+        from shiboken6 import isValid
+
+        if isValid(self.notifier):
+            for notifier in self.notifier.findChildren(QSocketNotifier):  # type: ignore
+                if notifier.socket() == pipe.fileno():
+                    notifier.setEnabled(False)
+                    notifier.deleteLater()
+
+    def wait_for_tasks(self, timeout: float | None = None) -> int:
+        """
+        Blocks until a task finishes, then handles all the newly finished tasks.
+
+        Parameters
+        ----------
+        timeout : float | None, optional
+            The maximum amount of time to wait for a task to finish, by default None or infinite.
+
+        Returns
+        -------
+        int
+            The amount of tasks completed, zero if the wait timed out.
+        """
+        wait_for_readable([self.incoming_pipe, *self.result_pipes], timeout)
+        return self.poll_tasks()
+
+    def create_notifier(self, parent: QObject | None = None) -> QSocketNotifier:
+        """
+        Creates a notifier which handles finished tasks inside the Qt event loop as soon as they arrive, instead of
+        periodically calling `poll_tasks`.
+
+        Parameters
+        ----------
+        parent : QObject | None, optional
+            The parent of the notifier, by default None.
+
+        Returns
+        -------
+        QSocketNotifier
+            The notifier, which must be kept alive for as long as tasks should be handled.
+
+        Notes
+        -----
+            Qt can only watch pipes on Unix, as pipes are not sockets on Windows.  On Windows, `poll_tasks` should
+        be called by a timer instead.
+
+            The result pipe of each worker is watched by a child of the notifier, which is added and removed as
+        workers are started and exit.
+        """
+        from PySide6.QtCore import QSocketNotifier
+
+        notifier = QSocketNotifier(self.incoming_pipe.fileno(), QSocketNotifier.Type.Read, parent)
+        notifier.activated.connect(lambda *_: self.poll_tasks())
+        self.notifier = notifier
+        for pipe in self.result_pipes:
+            self._watch_result_pipe(pipe)
+        return notifier
+
 
 class TaskManager:
     """
@@ -1022,21 +1649,44 @@ class TaskManager:
     name: str
         The name of the underlying process.
     outgoing_pipe: Connection
-        A pipe to send finished tasks to the parent process.
+        A pipe to send the result pipes of new workers and the tasks which failed as their worker died to the parent
+        process.
     incoming_pipe: Connection
         A pipe to receive tasks from the parent process.
     replier: Replier
         A network of pipes to easily reply to simple status requests from the parent process.
     recent_returned_values: dict[int, Any]
-        A mapping of finished tasks identities and their associated values.
+        A mapping of finished tasks identities and their associated values, which are kept until every queued task
+        which requires them has started.
+    consumers: dict[int, int]
+        A mapping of tasks identities and the amount of queued tasks which require their return value.
     queued_tasks: dict[int, Task]
         A mapping of tasks identities and their associated task that have not started.
+    dependents: dict[int, list[int]]
+        A mapping of tasks identities and the identities of the queued tasks which are waiting on them to finish.
+    remaining_dependencies: dict[int, int]
+        A mapping of queued tasks identities and the amount of required tasks which have not finished.
+    keyed_tasks: dict[Hashable, int]
+        A mapping of the keys of unfinished tasks and the identity of the most recent task received with each key.
+    lost_tasks: set[int]
+        The identities of the tasks which were being performed by a worker which died.
     workers: list[TaskWorkerProxy]
         A series of workers that can perform tasks.
+    task_costs: dict[str, float]
+        A mapping of the names of tasks and the estimated amount of seconds tasks of its kind take.
+    policy: KeepAlivePolicy
+        Determines how many workers are kept and for how long.
+    initializers: Sequence[WorkerInitializer]
+        The functions called inside each worker process before it performs any tasks.
+    started_workers: int
+        The amount of workers started by the task manager, used to name workers.
     status: Status
         The current status of the manager processes.
     last_event: float
         The last time stamp that an event was sent to the task manager.
+    wakeup: Event
+        An event which wakes the task manager after a request was handled, as the request may change which
+        connections it must wait on.
     """
 
     name: str
@@ -1044,26 +1694,40 @@ class TaskManager:
     incoming_pipe: Connection
     replier: Replier
     recent_returned_values: dict[int, Any]
+    consumers: dict[int, int]
     queued_tasks: dict[int, Task]
+    dependents: dict[int, list[int]]
+    remaining_dependencies: dict[int, int]
+    keyed_tasks: dict[Hashable, int]
+    lost_tasks: set[int]
     is_limited: bool
     workers: list[TaskWorkerProxy]
+    task_costs: dict[str, float]
+    policy: KeepAlivePolicy
+    initializers: Sequence[WorkerInitializer]
+    started_workers: int
     status: Status
     last_event: float
+    wakeup: Event
 
-    def __init__(self, name: str, outgoing_pipe: Connection, incoming_pipe: Connection, replier: Replier) -> None:
+    def __init__(
+        self,
+        name: str,
+        outgoing_pipe: Connection,
+        incoming_pipe: Connection,
+        replier: Replier,
+        policy: KeepAlivePolicy | None = None,
+        initializers: Sequence[WorkerInitializer] = (),
+    ) -> None:
         self.name = name
-        self.status = Status.STARTUP
         log.info(f"Starting {self}")
         self.outgoing_pipe = outgoing_pipe
         self.incoming_pipe = incoming_pipe
         self.replier = replier
         self.replier.received_request.connect(self.handle_request)
-        self.queued_tasks = {}
-        self.recent_returned_values = {}
-        self.is_limited = False
-        self.last_event = time()
-        self.workers = []
-        for _ in range(cpu_count()):
+        self.initialize_state(policy, initializers)
+        # Workers are started before any tasks are received, so their initializers do not delay the first tasks.
+        for _ in range(self.policy.minimum_workers):
             synchronize(self.add_worker)()
         run(self.update())
         current_process().terminate()  # Terminate the active process.
@@ -1074,83 +1738,263 @@ class TaskManager:
     def __str__(self) -> str:
         return f"<{self.name}>"
 
+    def initialize_state(
+        self, policy: KeepAlivePolicy | None = None, initializers: Sequence[WorkerInitializer] = ()
+    ) -> None:
+        """
+        Initializes the state used to schedule tasks, without any workers.
+
+        Parameters
+        ----------
+        policy : KeepAlivePolicy | None, optional
+            Determines how many workers are kept and for how long, by default `KeepAlivePolicy()`.
+        initializers : Sequence[WorkerInitializer], optional
+            The functions called inside each worker process before it performs any tasks, by default none.
+        """
+        self.status = Status.STARTUP
+        self.queued_tasks = {}
+        self.dependents = {}
+        self.remaining_dependencies = {}
+        self.keyed_tasks = {}
+        self.lost_tasks = set()
+        self.recent_returned_values = {}
+        self.consumers = {}
+        self.is_limited = False
+        self.last_event = time()
+        self.wakeup = Event()
+        self.task_costs = {}
+        self.policy = KeepAlivePolicy() if policy is None else policy
+        self.initializers = initializers
+        self.started_workers = 0
+        self.workers = []
+
+    def next_deadline(self) -> float | None:
+        """
+        Determines when the task manager must next check if it or any of its workers are inactive.
+
+        Returns
+        -------
+        float | None
+            The time stamp of the next check, None if no check is required.
+        """
+        deadlines: list[float] = []
+        if self.policy.manager_duration is not None:
+            deadlines.append(self.last_event + self.policy.manager_duration)
+        if self.policy.worker_duration is not None and len(self.workers) > self.policy.minimum_workers:
+            deadlines.extend(
+                worker.last_active + self.policy.worker_duration for worker in self.workers if worker.is_idle
+            )
+        return min(deadlines, default=None)
+
+    async def remove_idle_workers(self) -> None:
+        """
+        Stops the workers which have been idle for longer than the policy permits, while keeping the minimum amount
+        of workers.
+        """
+        if self.policy.worker_duration is None:
+            return
+        expired: float = time() - self.policy.worker_duration
+        # The workers which were idle for the longest are removed first.
+        for worker in sorted(self.workers, key=lambda worker: worker.last_active):
+            if len(self.workers) <= self.policy.minimum_workers:
+                return
+            if worker.is_idle and worker.last_active <= expired:
+                log.info(f"stopping worker from inactivity {worker}")
+                self.workers.remove(worker)
+                await worker.terminate()
+
     async def check_time(self) -> None:
         """
         Checks if the task manager is not actively being used.  If the task manager is not being used, it will end
-        itself.
+        itself.  Otherwise, it will stop any additional workers which are not being used.
         """
-        if time() - self.last_event >= AUTOMATED_REMOVAL_DURATION:
-            # We will stop running the task manager if nothing has occurred in five seconds.
-            log.info(f"{self} has begun stopping from inactivity")
+        if self.policy.manager_duration is None or time() - self.last_event < self.policy.manager_duration:
+            await self.remove_idle_workers()
+            return
 
-            self.status = Status.STOPPED
+        log.info(f"{self} has begun stopping from inactivity")
 
-            for worker in self.workers:
-                log.info(f"stopping worker from inactivity {worker}")
-                await worker.join(1)
-                await worker.kill()  # Force kill a worker if it did not respond.
+        self.status = Status.STOPPED
+
+        for worker in self.workers:
+            log.info(f"stopping worker from inactivity {worker}")
+            await worker.join(1)
+            await worker.kill()  # Force kill a worker if it did not respond.
 
-            self.workers.clear()
+        self.workers.clear()
 
-            log.info(f"{self} has stopped from inactivity")
+        log.info(f"{self} has stopped from inactivity")
 
-            current_process().terminate()
+        current_process().terminate()
 
-    async def add_worker(self) -> None:
+    async def add_worker(self) -> TaskWorkerProxy:
         """
         Adds an additional worker process to perform tasks.
+
+        Returns
+        -------
+        TaskWorkerProxy
+            The worker added.
         """
         parent_outgoing_pipe, child_incoming_pipe = dill_connection(*Pipe())
         child_outgoing_pipe, parent_incoming_pipe = dill_connection(*Pipe())
+        result_receiver, result_sender = Pipe(duplex=False)
         request_pipe = RequestPipe.generate()
         worker: TaskWorkerProxy = TaskWorkerProxy(
-            None, parent_outgoing_pipe, parent_incoming_pipe, request_pipe.requester, f"worker_{len(self.workers)}"
+            None, parent_outgoing_pipe, parent_incoming_pipe, request_pipe.requester, f"worker_{self.started_workers}"
         )
         process: Process = Process(
-            target=worker.start, args=(child_outgoing_pipe, child_incoming_pipe, request_pipe.replier)
+            target=worker.start,
+            args=(
+                child_outgoing_pipe,
+                child_incoming_pipe,
+                request_pipe.replier,
+                DilledConnection(result_sender),
+                self.initializers,
+            ),
         )
         worker.process = process
         process.start()
+        # Only the worker may hold the other ends, so the pipes are closed once it dies.
+        child_outgoing_pipe.close()
+        child_incoming_pipe.close()
+        result_sender.close()
+        # The main process receives its own copy of the reading end of the result pipe.
+        self.outgoing_pipe.send(ResultPipe(worker.name))
+        send_handle(self.outgoing_pipe, result_receiver.fileno(), getppid())
+        result_receiver.close()
+        self.started_workers += 1
         self.workers.append(worker)
+        log.info(f"{self} started {worker}")
+        return worker
+
+    def estimate_cost(self, task: Task) -> float:
+        """
+        Estimates the amount of seconds a task will take from the previous tasks of its kind.
+
+        Parameters
+        ----------
+        task : Task
+            The task to estimate.
+
+        Returns
+        -------
+        float
+            The estimated amount of seconds.
+        """
+        return self.task_costs.get(task.name, DEFAULT_TASK_COST)
+
+    def record_cost(self, task: Task, duration: float) -> None:
+        """
+        Updates the estimated cost of the kind of a task after it finished.
+
+        Parameters
+        ----------
+        task : Task
+            The task which finished.
+        duration : float
+            The amount of seconds the task took.
+        """
+        cost: float | None = self.task_costs.get(task.name)
+        self.task_costs[task.name] = duration if cost is None else cost + (duration - cost) * TASK_COST_SMOOTHING
 
     async def send_task_to_worker(self, task: Task, *args: Any) -> None:
         """
-        Sends a task to one of the workers to be performed.
+        Assigns a task to the worker with the least amount of work to be performed before the task.  If every worker
+        is busy, an additional worker is started if the policy permits it.
 
         Parameters
         ----------
         task : Task
             The task to be sent and completed.
         """
-        assigned_worker = choice(self.workers)
-        worker_task = WorkerTask.from_task(task, *args)
-        assigned_worker.outgoing_pipe.send(worker_task)
-        log.debug(f"{self} sent {worker_task} to {assigned_worker}")
+        assigned_worker: TaskWorkerProxy | None = min(
+            self.workers, key=lambda worker: worker.load_before(task.priority), default=None
+        )
+        if (assigned_worker is None or not assigned_worker.is_idle) and len(self.workers) < self.policy.maximum_workers:
+            assigned_worker = await self.add_worker()
+        assert assigned_worker is not None
+        assigned_task = AssignedTask(WorkerTask.from_task(task, *args), self.estimate_cost(task))
+        assigned_worker.queue_task(assigned_task)
+        log.debug(f"{self} assigned {assigned_task} to {assigned_worker}")
+        await self.feed_worker(assigned_worker)
 
-    async def get_important_return_values(self) -> set[int]:
+    def take_task(self, worker: TaskWorkerProxy) -> AssignedTask | None:
         """
-        Acquires all return value identities that are required for queued tasks.
+        Takes the next task for a worker to perform.  If the worker does not have any queued tasks, it will steal
+        a task from the worker with the most urgent queued task, preferring the worker with the most queued tasks.
+        The most urgent task is stolen, or the most recently queued task if every task is equally urgent.
+
+        Parameters
+        ----------
+        worker : TaskWorkerProxy
+            The worker to take a task for.
 
         Returns
         -------
-        set[int]
-            The set of all return value identities that should not be removed.
+        AssignedTask | None
+            The task to be sent to the worker, None if no worker has any queued tasks.
         """
-        return set(chain.from_iterable(q.required_tasks for q in self.queued_tasks.values()))
+        if worker.queued_tasks:
+            return worker.queued_tasks.popleft()
+        busy_workers: list[TaskWorkerProxy] = [other for other in self.workers if other.queued_tasks]
+        if not busy_workers:
+            return None
+        busiest_worker: TaskWorkerProxy = min(
+            busy_workers, key=lambda other: (other.queued_tasks[0].priority, -len(other.queued_tasks))
+        )
+        log.debug(f"{worker} stole a task from {busiest_worker}")
+        if busiest_worker.queued_tasks[0].priority < busiest_worker.queued_tasks[-1].priority:
+            return busiest_worker.queued_tasks.popleft()
+        return busiest_worker.queued_tasks.pop()
 
-    async def remove_stale_return_values(self) -> None:
+    async def feed_worker(self, worker: TaskWorkerProxy) -> None:
         """
-        Removes return values that are no longer required by any queued task.
+        Sends tasks to a worker until it is performing the maximum amount of tasks or no tasks are queued.
+
+        Parameters
+        ----------
+        worker : TaskWorkerProxy
+            The worker to send tasks to.
         """
-        stale_return_values: set[int] = set(self.recent_returned_values.keys()).difference(
-            await self.get_important_return_values()
-        )
-        for stale_return_value in stale_return_values:
-            del self.recent_returned_values[stale_return_value]
+        while len(worker.active_tasks) < MAXIMUM_WORKER_TASKS:
+            task: AssignedTask | None = self.take_task(worker)
+            if task is None:
+                return
+            worker.send_task(task)
+
+    async def flush_queued_tasks(self) -> None:
+        """
+        Sends every task queued inside the task manager to the workers it is assigned to.
+        """
+        for worker in self.workers:
+            while worker.queued_tasks:
+                worker.send_task(worker.queued_tasks.popleft())
+
+    async def queue_task(self, task: Task) -> None:
+        """
+        Queues a task until every task it requires has finished, or sends it to a worker if they already finished.
+
+        Parameters
+        ----------
+        task : Task
+            The task to be queued.
+        """
+        remaining_dependencies: int = 0
+        for required_task in task.required_tasks:
+            self.consumers[required_task] = self.consumers.get(required_task, 0) + 1
+            if required_task not in self.recent_returned_values:
+                self.dependents.setdefault(required_task, []).append(task.identity)
+                remaining_dependencies += 1
+        self.queued_tasks[task.identity] = task
+        self.remaining_dependencies[task.identity] = remaining_dependencies
+        if not remaining_dependencies:
+            await self.start_queued_task(task.identity)
 
     async def get_arguments_of_task(self, identity: int) -> list[Any]:
         """
-        Acquires the arguments for a task which depends on other tasks.
+        Acquires the arguments for a task which depends on other tasks, releasing every return value which is no
+        longer required by any other queued task.
 
         Parameters
         ----------
@@ -1166,11 +2010,28 @@ class TaskManager:
         -----
             We assume that every return value exists.
         """
-        return [self.recent_returned_values[r] for r in self.queued_tasks[identity].required_tasks]
+        arguments: list[Any] = []
+        for required_task in self.queued_tasks[identity].required_tasks:
+            arguments.append(self.recent_returned_values[required_task])
+            self.release_return_value(required_task)
+        return arguments
+
+    async def start_queued_task(self, identity: int) -> None:
+        """
+        Sends a queued task whose required tasks have all finished to a worker.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the queued task.
+        """
+        arguments: list[Any] = await self.get_arguments_of_task(identity)
+        del self.remaining_dependencies[identity]
+        await self.send_task_to_worker(self.queued_tasks.pop(identity), *arguments)
 
     async def poll_queued_tasks(self, identity: int, return_value: Any) -> None:
         """
-        Checks if any tasks that are queued are able to be started.
+        Starts the queued tasks which were only waiting on a task which finished.
 
         Parameters
         ----------
@@ -1181,18 +2042,106 @@ class TaskManager:
 
         Notes
         -----
-            This should be called after each task is completed, so its data can be added and referenced later.
-        """
-        newly_queued_tasks: set[int] = set()
-        self.recent_returned_values |= {identity: return_value}
-        await self.remove_stale_return_values()
-        finished_tasks: set[int] = set(self.recent_returned_values.keys())
-        for identity, queued_task in self.queued_tasks.items():
-            if finished_tasks.issuperset(queued_task.required_tasks):
-                await self.send_task_to_worker(queued_task, *await self.get_arguments_of_task(identity))
-                newly_queued_tasks.add(identity)
-        for queued_task in newly_queued_tasks:
-            del self.queued_tasks[queued_task]
+            This should be called after each task is completed, so its data can be added and referenced later.  Only
+        the tasks which require the completed task are checked, so completing a task does not depend on the amount
+        of queued tasks.
+        """
+        dependents: list[int] = self.dependents.pop(identity, [])
+        if identity in self.consumers:
+            self.recent_returned_values[identity] = return_value
+        for dependent in dependents:
+            if dependent not in self.remaining_dependencies:
+                continue  # The dependent was cancelled.
+            self.remaining_dependencies[dependent] -= 1
+            if not self.remaining_dependencies[dependent]:
+                await self.start_queued_task(dependent)
+
+    def release_return_value(self, identity: int) -> None:
+        """
+        Removes a consumer of the return value of a task, releasing the return value if nothing else requires it.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the task which returned the value.
+        """
+        self.consumers[identity] -= 1
+        if not self.consumers[identity]:
+            del self.consumers[identity]
+            self.recent_returned_values.pop(identity, None)
+
+    def release_key(self, task: Task) -> None:
+        """
+        Removes the key of a task which finished or was cancelled, unless another task superseded it.
+
+        Parameters
+        ----------
+        task : Task
+            The task which finished or was cancelled.
+        """
+        if task.key is not None and self.keyed_tasks.get(task.key) == task.identity:
+            del self.keyed_tasks[task.key]
+
+    async def cancel_task(self, identity: int) -> None:
+        """
+        Cancels a task which has not finished, along with every queued task which requires it.  A task which has not
+        been sent to a worker is dropped, otherwise the worker is notified to cancel it.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the task to cancel.
+        """
+        cancelled_tasks: list[int] = [identity]
+        while cancelled_tasks:
+            identity = cancelled_tasks.pop()
+            cancelled_tasks.extend(self.dependents.pop(identity, []))
+            if identity in self.queued_tasks:
+                task: Task = self.queued_tasks.pop(identity)
+                del self.remaining_dependencies[identity]
+                for required_task in task.required_tasks:
+                    self.release_return_value(required_task)
+                self.release_key(task)
+                task.discard()
+                log.debug(f"{self} cancelled queued {task}")
+                continue
+            for worker in self.workers:
+                if identity in worker.active_tasks:
+                    worker.outgoing_pipe.send(TaskCancellation(identity))
+                    log.debug(f"{self} cancelled {worker.active_tasks[identity]} on {worker}")
+                    break
+                assigned_task: AssignedTask | None = worker.remove_queued_task(identity)
+                if assigned_task is not None:
+                    self.release_key(assigned_task.task.task)
+                    assigned_task.task.task.discard()
+                    log.debug(f"{self} cancelled {assigned_task} queued for {worker}")
+                    break
+
+    async def replace_dead_workers(self) -> None:
+        """
+        Removes the workers whose process died, such as from a crash inside a task or an initializer, starting
+        replacements to keep the minimum amount of workers.  The tasks assigned to a dead worker are sent to the other
+        workers, unless a task was already being performed by a worker which died, in which case it fails.
+        """
+        for worker in [worker for worker in self.workers if not await worker.is_alive()]:
+            log.error(f"{self} lost {worker}, which exited with {worker.process and worker.process.exitcode}")
+            self.workers.remove(worker)
+            while len(self.workers) < self.policy.minimum_workers:
+                await self.add_worker()
+
+            for assigned_task in [*worker.active_tasks.values(), *worker.queued_tasks]:
+                task: Task = assigned_task.task.task
+                if task.identity not in worker.active_tasks:
+                    await self.send_task_to_worker(task, *assigned_task.task.arguments)
+                elif task.identity not in self.lost_tasks:
+                    self.lost_tasks.add(task.identity)
+                    await self.send_task_to_worker(task, *assigned_task.task.arguments)
+                else:
+                    self.lost_tasks.discard(task.identity)
+                    self.release_key(task)
+                    exception = WorkerDiedException(f"{worker} died performing {task}")
+                    self.outgoing_pipe.send(FinishedTask.as_exception(task.identity, exception))
+                    await self.poll_queued_tasks(task.identity, None)
 
     async def poll_workers(self) -> None:
         """
@@ -1200,30 +2149,74 @@ class TaskManager:
         send any finished tasks back to the main process.
         """
         for worker in self.workers:
-            if worker.incoming_pipe.poll():
-                log.debug(f"{self} receiving task result from {worker}")
-                try:
-                    value: FinishedTask = worker.incoming_pipe.recv()
-                except EOFError:
-                    # Something went wrong, so we log and ignore it.
-                    log.warning(f"{self} dropped task from worker {worker}")
-                    return
-                self.outgoing_pipe.send(value)
-                await self.poll_queued_tasks(value.identity, value.result)
-                self.last_event = time()  # Add additional time to the process if work is actively getting done.
+            if worker.incoming_pipe.poll() and not await self.receive_finished_task(worker):
+                return
+
+    async def receive_finished_task(self, worker: TaskWorkerProxy) -> bool:
+        """
+        Receives a notice of a finished task from a worker and starts the tasks which were waiting on it.
+
+        Parameters
+        ----------
+        worker : TaskWorkerProxy
+            The worker which finished the task.
+
+        Returns
+        -------
+        bool
+            If the notice was received.
+        """
+        log.debug(f"{self} receiving task notice from {worker}")
+        try:
+            value: TaskNotice = worker.incoming_pipe.recv()
+        except EOFError:
+            # Something went wrong, so we log and ignore it.
+            log.warning(f"{self} dropped task from worker {worker}")
+            return False
+        assigned_task: AssignedTask | None = worker.active_tasks.pop(value.identity, None)
+        worker.last_active = time()
+        self.lost_tasks.discard(value.identity)
+        if assigned_task is not None:
+            self.release_key(assigned_task.task.task)
+            if not value.is_cancelled:
+                self.record_cost(assigned_task.task.task, value.duration)
+        await self.poll_queued_tasks(value.identity, value.result)
+        await self.feed_worker(worker)
+        self.last_event = time()  # Add additional time to the process if work is actively getting done.
+        return True
 
     async def poll_tasks(self) -> None:
         """
         Checks if the main process has sent any additional tasks to be performed.
         """
         while self.incoming_pipe.poll():
-            task: Task = self.incoming_pipe.recv()
-            log.debug(f"{self} received {task}")
-            if task.required_tasks:
-                self.queued_tasks |= {task.identity: task}
-            else:
-                ensure_future(self.send_task_to_worker(task))
+            message: Task | TaskCancellation = self.incoming_pipe.recv()
+            log.debug(f"{self} received {message}")
             self.last_event = time()  # Update last event time.
+            if isinstance(message, TaskCancellation):
+                await self.cancel_task(message.identity)
+                continue
+            if message.key is not None:
+                await self.supersede_task(message)
+            if message.required_tasks:
+                await self.queue_task(message)
+            else:
+                await self.send_task_to_worker(message)
+
+    async def supersede_task(self, task: Task) -> None:
+        """
+        Cancels the unfinished task with the same key as a task which was received.
+
+        Parameters
+        ----------
+        task : Task
+            The task which supersedes the previous task with its key.
+        """
+        superseded_task: int | None = self.keyed_tasks.get(task.key)
+        self.keyed_tasks[task.key] = task.identity
+        if superseded_task is not None:
+            log.debug(f"{self} superseded 0x{superseded_task:02X} with {task}")
+            await self.cancel_task(superseded_task)
 
     async def update(self) -> None:
         """
@@ -1232,16 +2225,34 @@ class TaskManager:
         self.status = Status.RUNNING
         log.info(f"{self} is running")
         while self.status != Status.STOPPED:
-            await self.replier.handle_requests()
+            # Tasks are received before requests, so requests apply to every task sent before them.
             if self.status == Status.RUNNING:
                 await self.poll_tasks()
-                if not self.is_limited:
-                    await self.poll_workers()
+            await self.replier.handle_requests()
+            if self.status == Status.RUNNING and not self.is_limited:
+                await self.replace_dead_workers()
+                await self.poll_workers()
             await self.check_time()
-            await sleep(MANAGER_SLEEP_DURATION)
+            await self.wait_for_events()
         self.status = Status.ZOMBIE
         log.info(f"{self} is a zombie")
 
+    async def wait_for_events(self) -> None:
+        """
+        Sleeps until a request, task, or finished task is received, a request is handled, or the task manager should
+        check if it or any of its workers are inactive.
+        """
+        self.wakeup.clear()
+        connections: list[Connection] = [self.replier.request.child_recv_from_parent_pipe]
+        if self.status == Status.RUNNING:
+            connections.append(self.incoming_pipe)
+            if not self.is_limited:
+                connections.extend(worker.incoming_pipe for worker in self.workers)
+        deadline: float | None = self.next_deadline()
+        await wait_for_connections(
+            connections, None if deadline is None else max(0, deadline - time()), self.wakeup, MANAGER_SLEEP_DURATION
+        )
+
     def handle_request(self, request: Request[Requests]) -> None:
         """
         Determines how to handle a simple request from the main process.
@@ -1253,19 +2264,20 @@ class TaskManager:
         """
         match request.value:
             case Requests.GET_STATUS:
-                ensure_future(self.get_status(request.identity))
+                handler = self.get_status
             case Requests.START_SLEEPING:
-                ensure_future(self.start_sleeping(request.identity))
+                handler = self.start_sleeping
             case Requests.STOP_SLEEPING:
-                ensure_future(self.stop_sleeping(request.identity))
+                handler = self.stop_sleeping
             case Requests.STOP:
-                ensure_future(self.stop(request.identity))
+                handler = self.stop
             case Requests.JOIN:
-                ensure_future(self.join(request.identity))
+                handler = self.join
             case Requests.LIMIT:
-                ensure_future(self.limit(request.identity))
+                handler = self.limit
             case _:
-                ensure_future(self.default(request.identity))
+                handler = self.default
+        ensure_future(handler(request.identity)).add_done_callback(lambda _: self.wakeup.set())
 
     async def get_status(self, identity: int) -> None:
         """
@@ -1306,6 +2318,7 @@ class TaskManager:
         if self.status == Status.SLEEPING:
             self.status = Status.RUNNING
             self.is_limited = False
+            self.wakeup.set()  # Start receiving finished tasks while the workers are woken.
             for worker in self.workers:
                 await worker.make_request(Requests.STOP_SLEEPING)
             log.info(f"{self} is running")
@@ -1349,6 +2362,9 @@ class TaskManager:
         if self.status == Status.RUNNING:
             self.status = Status.SLEEPING
 
+            # The workers can only finish the tasks which were sent to them.
+            await self.flush_queued_tasks()
+
             async def join_worker(worker: TaskWorkerProxy) -> None:
                 # Force kill a worker if it did not respond.
                 if not await worker.join(10000):
@@ -1360,6 +2376,11 @@ class TaskManager:
                     *[await join_worker(worker) for worker in self.workers], return_exceptions=True  # type: ignore
                 )
 
+            # Send the results of the joined tasks, so the main process can receive them once it is replied to.
+            for worker in self.workers:
+                while worker.incoming_pipe.poll() and await self.receive_finished_task(worker):
+                    pass
+
         await self.replier.reply(Reply(self.status, identity))
 
     async def limit(self, identity: int) -> None:
@@ -1395,6 +2416,30 @@ class TaskManager:
         await self.replier.reply(Reply(Status.NOT_DEFINED, identity))
 
 
+_running_task = local()
+"""
+The identity of the task each thread of a worker is performing.
+"""
+
+_cancelled_tasks: set[int] = set()
+"""
+The identities of the tasks which were cancelled while a worker was performing them.
+"""
+
+
+def is_task_cancelled() -> bool:
+    """
+    Determines if the task being performed by the current thread was cancelled or superseded, so a long task can
+    stop early.  Its result is discarded either way.
+
+    Returns
+    -------
+    bool
+        If the task being performed was cancelled.
+    """
+    return getattr(_running_task, "identity", None) in _cancelled_tasks
+
+
 @attrs(slots=True, auto_attribs=True)
 class TaskWorkerProxy:
     """
@@ -1412,6 +2457,12 @@ class TaskWorkerProxy:
         A requester object to receive simple commands.
     name: str = "worker"
         The name of the worker, used for debugging.
+    active_tasks: dict[int, AssignedTask]
+        A mapping of the identities of tasks sent to the worker which have not finished and their tasks.
+    queued_tasks: deque[AssignedTask]
+        The tasks assigned to the worker which have not been sent to it yet.
+    last_active: float
+        The last time stamp that the worker was sent a task or finished a task.
     """
 
     process: Process | None
@@ -1419,28 +2470,139 @@ class TaskWorkerProxy:
     incoming_pipe: Connection
     requester: Requester[Requests, Status]
     name: str = "worker"
+    active_tasks: dict[int, AssignedTask] = field(factory=dict)
+    queued_tasks: deque[AssignedTask] = field(factory=deque)
+    last_active: float = field(factory=time)
 
     def __str__(self) -> str:
         return f"<{self.name}>"
 
+    @property
+    def is_idle(self) -> bool:
+        """
+        Determines if the worker does not have any tasks to perform.
+
+        Returns
+        -------
+        bool
+            If the worker does not have any active or queued tasks.
+        """
+        return not self.active_tasks and not self.queued_tasks
+
+    @property
+    def load(self) -> float:
+        """
+        The estimated amount of seconds the worker needs to finish every task assigned to it.
+
+        Returns
+        -------
+        float
+            The estimated cost of the active and queued tasks.
+        """
+        return sum(task.cost for task in self.active_tasks.values()) + sum(task.cost for task in self.queued_tasks)
+
+    def load_before(self, priority: Priority) -> float:
+        """
+        The estimated amount of seconds before the worker would start a task of a given priority.
+
+        Parameters
+        ----------
+        priority : Priority
+            The priority of the task.
+
+        Returns
+        -------
+        float
+            The estimated cost of the active tasks and the queued tasks which are at least as urgent.
+        """
+        return sum(task.cost for task in self.active_tasks.values()) + sum(
+            task.cost for task in self.queued_tasks if task.priority <= priority
+        )
+
+    def queue_task(self, task: AssignedTask) -> None:
+        """
+        Queues a task to be sent to the worker after every queued task which is at least as urgent.
+
+        Parameters
+        ----------
+        task : AssignedTask
+            The task to be queued.
+        """
+        if not self.queued_tasks or self.queued_tasks[-1].priority <= task.priority:
+            self.queued_tasks.append(task)
+        else:
+            insort(self.queued_tasks, task, key=attrgetter("priority"))
+
+    def remove_queued_task(self, identity: int) -> AssignedTask | None:
+        """
+        Removes a task which was queued for the worker.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the task.
+
+        Returns
+        -------
+        AssignedTask | None
+            The task removed, None if the task was not queued for the worker.
+        """
+        for task in self.queued_tasks:
+            if task.identity == identity:
+                self.queued_tasks.remove(task)
+                return task
+        return None
+
+    def send_task(self, task: AssignedTask) -> None:
+        """
+        Sends a task to the worker process to be performed.
+
+        Parameters
+        ----------
+        task : AssignedTask
+            The task to be sent.
+        """
+        self.outgoing_pipe.send(task.task)
+        self.active_tasks[task.identity] = task
+        self.last_active = time()
+        log.debug(f"sent {task} to {self}")
+
     def __del__(self) -> None:
         synchronize(self.kill)()
 
-    def start(self, outgoing_pipe: Connection, incoming_pipe: Connection, replier: Replier) -> None:
+    def start(
+        self,
+        outgoing_pipe: Connection,
+        incoming_pipe: Connection,
+        replier: Replier,
+        result_pipe: Connection,
+        initializers: Sequence[WorkerInitializer] = (),
+    ) -> None:
         """
         Begins running the worker in another process.
 
         Parameters
         ----------
         outgoing_pipe : Connection
-            The pipe for the worker process to send results to this process.
+            The pipe for the worker process to send notices of finished tasks to this process.
         incoming_pipe : Connection
             The pipe for the worker process to receive tasks from this process.
         replier : Replier
             A network of pipes to receive simple requests from the task manager.
+        result_pipe : Connection
+            The pipe for the worker process to send finished tasks to the main process.
+        initializers : Sequence[WorkerInitializer], optional
+            The functions called before the worker performs any tasks, by default none.
         """
+        for initializer in initializers:
+            try:
+                initializer()
+            except Exception:
+                # The worker can still perform tasks, as the data is only preloaded.
+                log.exception(f"{self} failed to run initializer {initializer}")
+
         # We copy name to not have references
-        run(TaskWorker(copy(self.name), outgoing_pipe, incoming_pipe, replier).update())
+        run(TaskWorker(copy(self.name), outgoing_pipe, incoming_pipe, replier, result_pipe).update())
 
     async def make_request(self, request: Requests, timeout: float | None = None) -> Status:
         """
@@ -1525,32 +2687,62 @@ class TaskWorker:
     name: str
         The name of the underlying process.
     outgoing_pipe: Connection
-        A pipe to send finished tasks to the manager process.
+        A pipe to send notices of finished tasks to the manager process.
     incoming_pipe: Connection
         A pipe to receive tasks from the manager process.
     replier: Replier
         A network of pipes to easily reply to simple status requests from the manager process.
+    result_pipe: Connection
+        A pipe only written to by this worker to send finished tasks directly to the main process.
     status: Status
         The current status of the worker processes.
     task_count: int
         The number of tasks that this process is actively working on.
+    idle: Event
+        An event which is set while the worker is not working on any tasks.
+    wakeup: Event
+        An event which wakes the worker after a request was handled, as the request may change which connections it
+        must wait on.
+    executor: ThreadPoolExecutor
+        The threads which perform the tasks, so the worker can respond to requests while tasks are performed.
+    futures: dict[int, ConcurrentFuture]
+        A mapping of the identities of the tasks received which have not finished and their futures.
     """
 
     name: str
     outgoing_pipe: Connection
     incoming_pipe: Connection
     replier: Replier
+    result_pipe: Connection
     status: Status
     task_count: int
+    idle: Event
+    wakeup: Event
+    executor: ThreadPoolExecutor
+    futures: dict[int, ConcurrentFuture]
 
-    def __init__(self, name: str, outgoing_pipe: Connection, incoming_pipe: Connection, replier: Replier) -> None:
+    def __init__(
+        self,
+        name: str,
+        outgoing_pipe: Connection,
+        incoming_pipe: Connection,
+        replier: Replier,
+        result_pipe: Connection,
+        threads: int = WORKER_THREAD_COUNT,
+    ) -> None:
         self.name = name
         self.task_count = 0
+        self.executor = ThreadPoolExecutor(threads, thread_name_prefix=name)
+        self.futures = {}
+        self.idle = Event()
+        self.idle.set()
+        self.wakeup = Event()
         log.info(f"{self} entering startup")
         self.status = Status.STARTUP
         self.outgoing_pipe = outgoing_pipe
         self.incoming_pipe = incoming_pipe
         self.replier = replier
+        self.result_pipe = result_pipe
         self.replier.received_request.connect(self.handle_request)
 
     def __repr__(self) -> str:
@@ -1559,9 +2751,34 @@ class TaskWorker:
     def __str__(self) -> str:
         return f"<{self.name}>"
 
+    @staticmethod
+    def perform_task(task: WorkerTask) -> FinishedTask:
+        """
+        Performs a task on the current thread.
+
+        Parameters
+        ----------
+        task : WorkerTask
+            The task to be performed.
+
+        Returns
+        -------
+        FinishedTask
+            The receipt of the task, containing its result or the exception it raised.
+        """
+        start: float = perf_counter()
+        _running_task.identity = task.identity
+        try:
+            result = task.begin_task()
+        except Exception as e:
+            return FinishedTask.as_exception(task.identity, e, perf_counter() - start)
+        finally:
+            _running_task.identity = None
+        return FinishedTask(task.identity, result, duration=perf_counter() - start)
+
     async def execute_task(self, task: WorkerTask) -> None:
         """
-        Begins actively working on a task.
+        Begins actively working on a task inside one of the threads of the worker.
 
         Parameters
         ----------
@@ -1569,25 +2786,77 @@ class TaskWorker:
             The task to be performed.
         """
         log.debug(f"{self} begun executing {task.task} with arguments {task.arguments}")
+        future: ConcurrentFuture = self.executor.submit(self.perform_task, task)
+        self.futures[task.identity] = future
         try:
-            finished_task = FinishedTask(task.identity, task.begin_task())
-        except Exception as e:
-            finished_task = FinishedTask.as_exception(task.identity, e)
-        if DEBUG >= log.level and not pickles(finished_task):
-            log.critical(f"{finished_task} is not a pickle with bad types: {badtypes(finished_task)}")
-            raise NotAPickleException(f"{finished_task} is not a pickle!")
-        self.outgoing_pipe.send(finished_task)
+            finished_task: FinishedTask = await wrap_future(future)
+        except CancelledError:
+            if not future.cancelled():
+                raise  # The worker is stopping, rather than the task being cancelled.
+            finished_task = FinishedTask(task.identity, None)
+        finally:
+            del self.futures[task.identity]
+
+        if future.cancelled() or task.identity in _cancelled_tasks:
+            if future.cancelled():
+                task.task.discard()  # The task never started, so its shared buffers were never received.
+            _cancelled_tasks.discard(task.identity)
+            log.debug(f"{self} cancelled {task.task}")
+            self.outgoing_pipe.send(TaskNotice(task.identity, finished_task.duration, is_cancelled=True))
+        else:
+            await self.send_finished_task(task, finished_task)
         self.task_count -= 1
+        if self.task_count == 0:
+            self.idle.set()
+
+    async def send_finished_task(self, task: WorkerTask, finished_task: FinishedTask) -> None:
+        """
+        Sends a finished task to the main process and a notice of it to the manager process.
+
+        Parameters
+        ----------
+        task : WorkerTask
+            The task which was performed.
+        finished_task : FinishedTask
+            The receipt of the task.
+        """
+        try:
+            self.result_pipe.send(finished_task)
+        except PicklingError:
+            log.critical(f"{finished_task} is not a pickle with bad types: {badtypes(finished_task)}")
+            finished_task = FinishedTask.as_exception(
+                task.identity, NotAPickleException(f"{finished_task} is not a pickle!"), finished_task.duration
+            )
+            self.result_pipe.send(finished_task)
+        self.outgoing_pipe.send(TaskNotice.from_finished_task(task.task, finished_task))
+
+    def cancel_task(self, identity: int) -> None:
+        """
+        Cancels a task which was received.  A task which has not started is dropped, while a running task is notified
+        through `is_task_cancelled` and its result is discarded.
+
+        Parameters
+        ----------
+        identity : int
+            The identity of the task to cancel.
+        """
+        future: ConcurrentFuture | None = self.futures.get(identity)
+        if future is not None and not future.cancel():
+            _cancelled_tasks.add(identity)
 
     async def poll_tasks(self) -> None:
         """
-        Checks if the manager process has assigned the worker additional tasks.
+        Checks if the manager process has assigned the worker additional tasks or cancelled any tasks.
         """
         while self.incoming_pipe.poll():
-            task: WorkerTask = self.incoming_pipe.recv()
-            log.debug(f"{self} received {task}")
-            ensure_future(self.execute_task(task))
+            message: WorkerTask | TaskCancellation = self.incoming_pipe.recv()
+            log.debug(f"{self} received {message}")
+            if isinstance(message, TaskCancellation):
+                self.cancel_task(message.identity)
+                continue
+            ensure_future(self.execute_task(message))
             self.task_count += 1
+            self.idle.clear()
 
     async def update(self) -> None:
         """
@@ -1596,13 +2865,25 @@ class TaskWorker:
         self.status = Status.RUNNING
         log.info(f"{self} is running")
         while self.status != Status.STOPPED:
-            await self.replier.handle_requests()
+            # Tasks are received before requests, so requests apply to every task sent before them.
             if self.status == Status.RUNNING:
                 await self.poll_tasks()
-            await sleep(WORKER_SLEEP_DURATION)
+            await self.replier.handle_requests()
+            await self.wait_for_events()
+        self.executor.shutdown(wait=False, cancel_futures=True)
         self.status = Status.ZOMBIE
         log.debug(f"{self} is a zombie")
 
+    async def wait_for_events(self) -> None:
+        """
+        Sleeps until a request or task is received or a request is handled.
+        """
+        self.wakeup.clear()
+        connections: list[Connection] = [self.replier.request.child_recv_from_parent_pipe]
+        if self.status == Status.RUNNING:
+            connections.append(self.incoming_pipe)
+        await wait_for_connections(connections, wakeup=self.wakeup, polling_rate=WORKER_SLEEP_DURATION)
+
     def handle_request(self, request: Request[Requests]) -> None:
         """
         Determines how to handle a simple request from the main process.
@@ -1614,17 +2895,18 @@ class TaskWorker:
         """
         match request.value:
             case Requests.GET_STATUS:
-                ensure_future(self.get_status(request.identity))
+                handler = self.get_status
             case Requests.START_SLEEPING:
-                ensure_future(self.start_sleeping(request.identity))
+                handler = self.start_sleeping
             case Requests.STOP_SLEEPING:
-                ensure_future(self.stop_sleeping(request.identity))
+                handler = self.stop_sleeping
             case Requests.STOP:
-                ensure_future(self.stop(request.identity))
+                handler = self.stop
             case Requests.JOIN:
-                ensure_future(self.join(request.identity))
+                handler = self.join
             case _:
-                ensure_future(self.default(request.identity))
+                handler = self.default
+        ensure_future(handler(request.identity)).add_done_callback(lambda _: self.wakeup.set())
 
     async def get_status(self, identity: int) -> None:
         """
@@ -1690,8 +2972,7 @@ class TaskWorker:
         if self.status == Status.RUNNING:
             self.status = Status.SLEEPING
             log.debug(f"{self} is sleeping")
-            while self.task_count > 0:
-                await sleep(WORKER_SLEEP_DURATION)
+            await self.idle.wait()
         await self.replier.reply(Reply(self.status, identity))
 
     async def default(self, identity: int) -> None:
@@ -1707,7 +2988,9 @@ class TaskWorker:
         await self.replier.reply(Reply(Status.NOT_DEFINED, identity))
 
 
-def start_task_manager(name: str | None = None) -> TaskManagerProxy:
+def start_task_manager(
+    name: str | None = None, policy: KeepAlivePolicy | None = None, initializers: Sequence[WorkerInitializer] = ()
+) -> TaskManagerProxy:
     """
     Provides and starts a task manager to begin receiving and executing tasks.
 
@@ -1715,6 +2998,10 @@ def start_task_manager(name: str | None = None) -> TaskManagerProxy:
     ----------
     name : str | None, optional
         The name of the task manager process.
+    policy : KeepAlivePolicy | None, optional
+        Determines how many workers are kept and for how long, by default `KeepAlivePolicy()`.
+    initializers : Sequence[WorkerInitializer], optional
+        The functions called inside each worker process before it performs any tasks, by default none.
 
     Returns
     -------
@@ -1722,15 +3009,20 @@ def start_task_manager(name: str | None = None) -> TaskManagerProxy:
         An interface to communicate to the task manager process.
     """
     parent_outgoing_pipe, child_incoming_pipe = dill_connection(*Pipe())
+    # The workers of the task manager send finished tasks directly to this process, each through its own pipe, whose
+    # reading end is sent through this socket.
     child_outgoing_pipe, parent_incoming_pipe = dill_connection(*Pipe())
     request_pipe = RequestPipe.generate()
     manager: TaskManagerProxy = TaskManagerProxy(
         None, parent_outgoing_pipe, parent_incoming_pipe, request_pipe.requester, name or "manager"
     )
     process: Process = Process(
-        target=manager.start, args=(child_outgoing_pipe, child_incoming_pipe, request_pipe.replier), name=manager.name
+        target=manager.start,
+        args=(child_outgoing_pipe, child_incoming_pipe, request_pipe.replier, policy, initializers),
+        name=manager.name,
     )
     manager.process = process
+    start_resource_tracker()
 
     def handle_exit(*_):
         with suppress(AttributeError):
@@ -1837,31 +3129,81 @@ class _TaskManager:
 
     _task_manager: TaskManagerProxy | None
     _last_event: float
+    policy: KeepAlivePolicy
+    initializers: Sequence[WorkerInitializer]
 
     def __init__(self, is_alive: bool = False):
-        self._task_manager = start_task_manager("task manager") if is_alive else None
+        self.policy = KeepAlivePolicy()
+        self.initializers = ()
+        self._task_manager = self._start() if is_alive else None
         self._last_event = time()
 
     def __get__(self, instance, owner) -> TaskManagerProxy:
         if (
             self._task_manager is not None
-            and time() - AUTOMATED_REMOVAL_DURATION > self._last_event
+            and self.policy.manager_duration is not None
+            and time() - self.policy.manager_duration > self._last_event
             and not self._task_manager.is_alive()
         ):
             self._task_manager = None
 
         if self._task_manager is None:
-            self._task_manager = start_task_manager("task manager")
+            self._task_manager = self._start()
 
         return self._task_manager
 
     def __call__(self) -> TaskManagerProxy:
         return self.__get__(self, None)
 
+    def _start(self) -> TaskManagerProxy:
+        self._last_event = time()
+        return start_task_manager("task manager", self.policy, self.initializers)
+
+    def configure(
+        self, policy: KeepAlivePolicy | None = None, initializers: Sequence[WorkerInitializer] | None = None
+    ) -> None:
+        """
+        Changes how the task manager keeps its workers and prepares them, then restarts it so its workers are
+        prepared before the next task is scheduled.
+
+        Parameters
+        ----------
+        policy : KeepAlivePolicy | None, optional
+            Determines how many workers are kept and for how long, by default the current policy.
+        initializers : Sequence[WorkerInitializer] | None, optional
+            The functions called inside each worker process before it performs any tasks, by default the current
+            initializers.
+        """
+        if policy is not None:
+            self.policy = policy
+        if initializers is not None:
+            self.initializers = tuple(initializers)
+        if self._task_manager is not None:
+            self._task_manager.terminate()
+        self._task_manager = self._start()
+
 
 _task_manager: _TaskManager = _TaskManager()
 
 
+def configure_task_manager(
+    policy: KeepAlivePolicy | None = None, initializers: Sequence[WorkerInitializer] | None = None
+) -> None:
+    """
+    Changes how the shared task manager keeps its workers and prepares them, such as to preload the ROM after it was
+    opened.  The task manager is restarted, so its minimum amount of workers are warm before the next task.
+
+    Parameters
+    ----------
+    policy : KeepAlivePolicy | None, optional
+        Determines how many workers are kept and for how long, by default the current policy.
+    initializers : Sequence[WorkerInitializer] | None, optional
+        The functions called inside each worker process before it performs any tasks, by default the current
+        initializers.
+    """
+    _task_manager.configure(policy, initializers)
+
+
 class TaskMethod(Generic[_P, _T]):
     """
     A method which will be executed and paralyzed.
@@ -1918,12 +3260,8 @@ class TaskMethod(Generic[_P, _T]):
         )
 
     def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> None:
-        def _inner(*args, **kwargs):
-            return self.fstart(*args, **kwargs)  # type: ignore
-
-        _inner.__name__ = self.fstart.__name__
-
-        _task_manager().schedule_task(TaskCallback(_inner, self.freturn(args[0]), self.ehandler))
+        # The function is sent directly, so it is only serialized the first time the method is called.
+        _task_manager().schedule_task(TaskCallback(self.fstart, self.freturn(args[0]), self.ehandler))
 
     def freturn(self, instance: object) -> Callable[[_T], None]:
         """
@@ -1,14 +1,166 @@
-from pydantic import BaseModel
+from collections.abc import Callable, Iterator
+from enum import Enum
+from hashlib import sha256
+from json import loads
+from os import replace
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dumps
+from pickle import loads as loads_pickle
+from struct import Struct
+from struct import error as StructError
+from typing import Any, Generic, TypeVar
 
+from pydantic import BaseModel, root_validator
+
+from foundry import definitions_cache_path
 from foundry.core.drawable import Drawable
 from foundry.core.warnings.Warning import Warning
 from foundry.core.warnings.WarningCreator import WarningCreator
 
+DEFINITIONS_CACHE_VERSION = 2
+"""
+The version of the binary definition cache, which must be incremented whenever the definition models change.
+"""
+
+_CACHE_MAGIC = b"SMB3FDEF"
+_CACHE_HEADER = Struct(f"<{len(_CACHE_MAGIC)}s32sI")
+_CACHE_ENTRY = Struct("<QI")
+
+_T = TypeVar("_T", bound=BaseModel)
+
+
+class OverlayType(int, Enum):
+    """
+    The kinds of overlays the level drawer draws on top of an object to show what the object does.
+    """
+
+    NONE = 0
+    PIPE_UP = 1
+    PIPE_DOWN = 2
+    PIPE_LEFT = 3
+    PIPE_RIGHT = 4
+    DOOR = 5
+    NOTE = 6
+    ITEM_BLOCK = 7
+    INVISIBLE_ITEM = 8
+    SILVER_COINS = 9
+
+
+class OverlayItem(int, Enum):
+    """
+    The item shown by an overlay of a block with an item inside of it or an invisible item.
+    """
+
+    NONE = 0
+    FIRE_FLOWER = 1
+    LEAF = 2
+    CONTINUOUS_STAR = 3
+    STAR = 4
+    MULTI_COIN = 5
+    COIN = 6
+    ONE_UP = 7
+    VINE = 8
+    P_SWITCH = 9
+
+
+def classify_overlay(description: str) -> tuple[OverlayType, OverlayItem]:
+    """
+    Determines the overlay of an object from its description.
+
+    Parameters
+    ----------
+    description : str
+        The description of the object.
+
+    Returns
+    -------
+    tuple[OverlayType, OverlayItem]
+        The kind of overlay and the item it shows.
+    """
+    name = description.lower()
+
+    if "pipe" in name and "can go" in name:
+        if "left" in name:
+            return OverlayType.PIPE_LEFT, OverlayItem.NONE
+        elif "right" in name:
+            return OverlayType.PIPE_RIGHT, OverlayItem.NONE
+        elif "down" in name:
+            return OverlayType.PIPE_DOWN, OverlayItem.NONE
+        return OverlayType.PIPE_UP, OverlayItem.NONE
+
+    if "door" == name or "door (can go" in name or "invisible door" in name or "red invisible note" in name:
+        return OverlayType.NOTE if "note" in name else OverlayType.DOOR, OverlayItem.NONE
+
+    if "'?' with" in name or "brick with" in name or "bricks with" in name or "block with" in name:
+        if "flower" in name:
+            item = OverlayItem.FIRE_FLOWER
+        elif "leaf" in name:
+            item = OverlayItem.LEAF
+        elif "continuous star" in name:
+            item = OverlayItem.CONTINUOUS_STAR
+        elif "star" in name:
+            item = OverlayItem.STAR
+        elif "multi-coin" in name:
+            item = OverlayItem.MULTI_COIN
+        elif "coin" in name:
+            item = OverlayItem.COIN
+        elif "1-up" in name:
+            item = OverlayItem.ONE_UP
+        elif "vine" in name:
+            item = OverlayItem.VINE
+        elif "p-switch" in name:
+            item = OverlayItem.P_SWITCH
+        else:
+            item = OverlayItem.NONE
+        return OverlayType.ITEM_BLOCK, item
+
+    if "invisible" in name:
+        if "coin" in name:
+            item = OverlayItem.COIN
+        elif "1-up" in name:
+            item = OverlayItem.ONE_UP
+        else:
+            item = OverlayItem.NONE
+        return OverlayType.INVISIBLE_ITEM, item
+
+    if "silver coins" in name:
+        return OverlayType.SILVER_COINS, OverlayItem.NONE
+
+    return OverlayType.NONE, OverlayItem.NONE
+
 
 class Definition(BaseModel):
     description: str = ""
     warnings: list[WarningCreator] = []
     overlays: list[Drawable] = []
+    overlay_type: OverlayType | None = None
+    overlay_item: OverlayItem | None = None
+
+    @classmethod
+    def classify_overlay(cls, description: str) -> tuple[OverlayType, OverlayItem]:
+        """
+        Determines the overlay of a definition from its description, if it was not defined explicitly.
+
+        Parameters
+        ----------
+        description : str
+            The description of the definition.
+
+        Returns
+        -------
+        tuple[OverlayType, OverlayItem]
+            The kind of overlay and the item it shows.
+        """
+        return classify_overlay(description)
+
+    @root_validator(skip_on_failure=True)
+    def _classify_overlay(cls, values: dict[str, Any]) -> dict[str, Any]:
+        overlay_type, overlay_item = cls.classify_overlay(values.get("description", ""))
+        if values.get("overlay_type") is None:
+            values["overlay_type"] = overlay_type
+        if values.get("overlay_item") is None:
+            values["overlay_item"] = overlay_item
+        return values
 
     def get_warnings(self) -> list[Warning]:
         return self.warnings.copy()  # type: ignore
@@ -18,3 +170,126 @@ class Definition(BaseModel):
 
     class Config:
         use_enum_values = True
+
+
+class DefinitionCache(Generic[_T]):
+    """
+    A binary cache of the definitions inside a JSON file.
+
+    The JSON file must contain a list, where every entry is validated into a model by `parse`.  The validated models
+    are pickled individually into a cache file, which is keyed by the hash of the JSON file and is rebuilt whenever
+    the JSON file changes.  When the cache is valid, entries are only unpickled once they are requested, so
+    validating the definitions is only paid for the first time a JSON file is seen.
+
+    Attributes
+    ----------
+    source: Path
+        The JSON file containing the definitions.
+    parse: Callable[[Any], _T]
+        Validates an entry of the JSON file into its model.
+    cache_path: Path
+        The file the binary cache is stored in.
+    """
+
+    def __init__(self, source: Path, parse: Callable[[Any], _T], cache_directory: Path = definitions_cache_path):
+        self.source = source
+        self.parse = parse
+        self.cache_path = cache_directory / f"{source.stem}.bin"
+
+        self._data: bytes = b""
+        self._entries: list[tuple[int, int]] = []
+        self._definitions: list[_T | None] = []
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._definitions)
+
+    def __getitem__(self, index: int) -> _T:
+        definition = self._definitions[index]
+        if definition is None:
+            offset, length = self._entries[index]
+            definition = loads_pickle(self._data[offset : offset + length])
+            self._definitions[index] = definition
+        return definition
+
+    def __iter__(self) -> Iterator[_T]:
+        return (self[index] for index in range(len(self)))
+
+    def _load(self):
+        source = self.source.read_bytes()
+        key = sha256(source + DEFINITIONS_CACHE_VERSION.to_bytes(4, "little")).digest()
+
+        if not self._read_cache(key):
+            self._build_cache(key, source)
+
+    def _read_cache(self, key: bytes) -> bool:
+        """
+        Loads the index of the cache file, if it exists and belongs to the current JSON file.
+
+        Parameters
+        ----------
+        key : bytes
+            The key of the current JSON file.
+
+        Returns
+        -------
+        bool
+            If the cache could be used.
+        """
+        try:
+            data = self.cache_path.read_bytes()
+            magic, cache_key, count = _CACHE_HEADER.unpack_from(data)
+            if magic != _CACHE_MAGIC or cache_key != key:
+                return False
+            entries = [
+                _CACHE_ENTRY.unpack_from(data, _CACHE_HEADER.size + index * _CACHE_ENTRY.size) for index in range(count)
+            ]
+        except (OSError, StructError):
+            return False
+
+        if any(offset + length > len(data) for offset, length in entries):
+            return False
+
+        self._data = data
+        self._entries = entries
+        self._definitions = [None] * count
+        return True
+
+    def _build_cache(self, key: bytes, source: bytes):
+        """
+        Validates every definition of the JSON file and tries to store them inside the cache file.
+
+        Parameters
+        ----------
+        key : bytes
+            The key of the current JSON file.
+        source : bytes
+            The contents of the JSON file.
+        """
+        definitions = [self.parse(entry) for entry in loads(source)]
+        blobs = [dumps(definition, HIGHEST_PROTOCOL) for definition in definitions]
+
+        offset = _CACHE_HEADER.size + len(blobs) * _CACHE_ENTRY.size
+        entries = []
+        for blob in blobs:
+            entries.append((offset, len(blob)))
+            offset += len(blob)
+
+        self._definitions = list(definitions)
+
+        data = b"".join(
+            [
+                _CACHE_HEADER.pack(_CACHE_MAGIC, key, len(blobs)),
+                *(_CACHE_ENTRY.pack(*entry) for entry in entries),
+                *blobs,
+            ]
+        )
+
+        # The cache is only an optimization, so failing to write it is not an error.
+        temporary_path = self.cache_path.with_suffix(".tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temporary_path.write_bytes(data)
+            replace(temporary_path, self.cache_path)
+        except OSError:
+            return
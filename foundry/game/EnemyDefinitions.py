@@ -1,12 +1,17 @@
 from enum import Enum
 from functools import cache
-from json import loads
 
 from pydantic import BaseModel, Field
 
 from foundry import enemy_definitions
 from foundry.core.warnings.Warning import Warning
-from foundry.game.Definitions import Definition
+from foundry.game.Definitions import (
+    Definition,
+    DefinitionCache,
+    OverlayItem,
+    OverlayType,
+    classify_overlay,
+)
 
 
 class GeneratorType(int, Enum):
@@ -50,6 +55,13 @@ class EnemyDefinition(Definition):
     check_level_bounds: bool = True
     check_compatibility: bool = True
 
+    @classmethod
+    def classify_overlay(cls, description: str) -> tuple[OverlayType, OverlayItem]:
+        # Invisible doors are the only enemies and items that currently have an overlay.
+        if "invisible door" not in description.lower():
+            return OverlayType.NONE, OverlayItem.NONE
+        return classify_overlay(description)
+
     @property
     def suggested_icon_width(self) -> int:
         """
@@ -139,5 +151,4 @@ class EnemyDefinitions(BaseModel):
 
 @cache
 def get_enemy_metadata() -> EnemyDefinitions:
-    with open(enemy_definitions) as f:
-        return EnemyDefinitions(__root__=loads(f.read()))
+    return EnemyDefinitions.construct(__root__=list(DefinitionCache(enemy_definitions, EnemyDefinition.parse_obj)))
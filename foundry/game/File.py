@@ -232,6 +232,10 @@ class ROM(Rom):
     MARKER_VALUE: ClassVar[bytes] = bytes("SMB3FOUNDRY", "ascii")
 
     rom_data = bytearray()
+    generation: ClassVar[int] = 0
+    """
+    Incremented whenever the data of the ROM changes, so values derived from the data can determine if they are stale.
+    """
 
     path: str = ""
     name: str = ""
@@ -364,6 +368,7 @@ class ROM(Rom):
             data = bytearray(rom.read())
 
         ROM.rom_data = data
+        ROM.generation += 1
         ROM.path = path
         ROM.name = basename(path)
         ROM._id = ROM().get_id()
@@ -411,3 +416,8 @@ class ROM(Rom):
     def bulk_write(self, data: bytearray, position: int):
         position = self.header.normalized_address(position)
         self.rom_data[position : position + len(data)] = data
+        ROM.generation += 1
+
+    def write(self, offset: int, data: bytes):
+        super().write(offset, data)
+        ROM.generation += 1
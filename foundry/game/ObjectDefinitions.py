@@ -1,13 +1,12 @@
 from enum import Enum
 from functools import cache
-from json import loads
 
 from pydantic import BaseModel
 
 from foundry import tileset_definitions
 from foundry.core.warnings.OutsideLevelBoundsWarning import OutsideLevelBoundsWarning
 from foundry.core.warnings.Warning import Warning
-from foundry.game.Definitions import Definition
+from foundry.game.Definitions import Definition, DefinitionCache
 from foundry.smb3parse.objects.tileset import (
     AIR_SHIP_OBJECT_SET,
     CLOUDY_OBJECT_SET,
@@ -101,10 +100,31 @@ class Tilesets(BaseModel):
     __root__: list[Tileset]
 
 
+@cache
+def _get_definition_cache() -> DefinitionCache[Tileset]:
+    return DefinitionCache(tileset_definitions, lambda definitions: Tileset(__root__=definitions))
+
+
+def get_tileset_metadata(index: int) -> Tileset:
+    """
+    Provides the object definitions of a single tileset, without loading the definitions of the other tilesets.
+
+    Parameters
+    ----------
+    index : int
+        The index of the definitions, see `tileset_to_definition_index`.
+
+    Returns
+    -------
+    Tileset
+        The object definitions of the tileset.
+    """
+    return _get_definition_cache()[index]
+
+
 @cache
 def get_object_metadata() -> Tilesets:
-    with open(tileset_definitions) as f:
-        return Tilesets(__root__=loads(f.read()))
+    return Tilesets.construct(__root__=list(_get_definition_cache()))
 
 
 tileset_to_definition_index = {
@@ -1,20 +1,59 @@
+from functools import cache
+
 from foundry.game.ObjectDefinitions import (
+    EndType,
+    GeneratorType,
     TilesetDefinition,
-    get_object_metadata,
+    get_tileset_metadata,
     tileset_to_definition_index,
 )
 from foundry.smb3parse.constants import TILESET_ENDINGS, TILESET_NAMES
 
 
 class Tileset:
+    """
+    The object definitions of a tileset.
+
+    The attributes of every definition are flattened into tuples indexed by object type when the tileset is
+    created, so resolving an attribute of a level object is a single index instead of a walk through the
+    definition models.  Use `get_tileset` to share a single instance between every object of a tileset.
+
+    Attributes
+    ----------
+    number: int
+        The index of the tileset.
+    name: str
+        The name of the tileset.
+    definitions: ObjectDefinitions.Tileset
+        The object definitions of the tileset.
+    orientations: tuple[GeneratorType, ...]
+        The generator type of each object type.
+    endings: tuple[EndType, ...]
+        The ending of each object type.
+    names: tuple[str, ...]
+        The description of each object type.
+    blocks: tuple[list[int], ...]
+        The block design of each object type.
+    sizes: tuple[int, ...]
+        The amount of bytes each object type takes inside a level.
+    """
+
     def __init__(self, tileset: int):
         self.number = tileset
 
         self.name = TILESET_NAMES[self.number]
 
-        self.definitions = get_object_metadata().__root__[tileset_to_definition_index[self.number]]
+        self.definitions = get_tileset_metadata(tileset_to_definition_index[self.number])
+
+        definitions = self.definitions.__root__
+        self.orientations: tuple[GeneratorType, ...] = tuple(GeneratorType(d.orientation) for d in definitions)
+        self.endings: tuple[EndType, ...] = tuple(EndType(d.ending) for d in definitions)
+        self.names: tuple[str, ...] = tuple(d.description for d in definitions)
+        self.blocks: tuple[list[int], ...] = tuple(d.blocks for d in definitions)
+        self.sizes: tuple[int, ...] = tuple(d.size for d in definitions)
 
-    def object_type(self, domain: int, index: int) -> int:
+    @staticmethod
+    def object_type(domain: int, index: int) -> int:
         domain_offset = domain * 0x1F
 
         if index <= 0x0F:
@@ -29,8 +68,22 @@ class Tileset:
         return TILESET_ENDINGS[self.number]
 
     def get_object_byte_length(self, domain: int, object_id: int) -> int:
-        definition = self.get_definition_of(self.object_type(domain, object_id))
-        if definition.is_4byte:
-            return 4
-        else:
-            return 3
+        return 4 if self.sizes[self.object_type(domain, object_id)] == 4 else 3
+
+
+@cache
+def get_tileset(tileset: int) -> Tileset:
+    """
+    Provides the shared tileset of a given index.
+
+    Parameters
+    ----------
+    tileset : int
+        The index of the tileset.
+
+    Returns
+    -------
+    Tileset
+        The tileset, which is created only once for each index.
+    """
+    return Tileset(tileset)
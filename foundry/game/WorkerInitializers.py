@@ -0,0 +1,56 @@
+from functools import partial
+
+from foundry.core.tasks import WorkerInitializer
+from foundry.game.EnemyDefinitions import get_enemy_metadata
+from foundry.game.File import ROM
+from foundry.game.ObjectDefinitions import get_object_metadata
+
+
+def _load_rom(data: bytes, path: str) -> None:
+    ROM.rom_data = bytearray(data)
+    ROM.generation += 1
+    ROM.path = path
+
+
+def rom_snapshot() -> WorkerInitializer:
+    """
+    Provides an initializer which loads the current data of the ROM inside each worker, so tasks operate on the ROM
+    as it was when the task manager was configured.
+
+    Returns
+    -------
+    WorkerInitializer
+        The initializer containing a copy of the data of the ROM.
+    """
+    return partial(_load_rom, bytes(ROM.rom_data), ROM.path)
+
+
+def preload_definitions() -> None:
+    """
+    Loads the object and enemy definitions inside a worker.
+    """
+    get_object_metadata()
+    get_enemy_metadata()
+
+
+def preload_namespace() -> None:
+    """
+    Loads the images of the namespace used to draw levels inside a worker, leaving out the icons, which cannot be
+    created without a GUI application.
+    """
+    from foundry.gui.LevelDrawer import load_headless_namespace
+
+    load_headless_namespace()
+
+
+def default_initializers() -> list[WorkerInitializer]:
+    """
+    Provides the initializers which prepare a worker for tasks which operate on levels, such as drawing thumbnails or
+    finding the warnings of a level.
+
+    Returns
+    -------
+    list[WorkerInitializer]
+        The initializers for the ROM, definitions, and namespace.
+    """
+    return [rom_snapshot(), preload_definitions, preload_namespace]
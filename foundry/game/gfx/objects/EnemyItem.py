@@ -1,6 +1,10 @@
-from PySide6.QtCore import QPointF, QRect, QSize
-from PySide6.QtGui import QColor, QImage, QPainter, Qt
+from __future__ import annotations
 
+from functools import cache
+from typing import TYPE_CHECKING
+
+from foundry import data_dir
+from foundry.core import qt
 from foundry.core.drawable import (
     BLOCK_SIZE,
     MASK_COLOR,
@@ -20,16 +24,38 @@ from foundry.game.EnemyDefinitions import (
 from foundry.game.gfx.objects.Enemy import Enemy
 from foundry.game.gfx.objects.ObjectLike import ObjectLike
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QImage, QPainter
+
+
+@cache
+def get_enemy_graphics() -> QImage:
+    """
+    Provides the graphics of the enemies which are drawn from blocks, which are shared between every enemy.
+
+    Returns
+    -------
+    QImage
+        The graphics of the enemies, which are only loaded once they are drawn.
+    """
+    png = qt.QImage(str(data_dir.joinpath("gfx.png")))
+
+    png.convertTo(qt.QImage.Format.Format_RGB888)
+
+    rows_per_tileset = 256 // 64
+
+    y_offset = 12 * rows_per_tileset * BLOCK_SIZE.height
+
+    return png.copy(qt.QRect(0, y_offset, png.width(), png.height() - y_offset))
+
 
 class EnemyObject(ObjectLike):
-    def __init__(self, data, png_data, palette_group: PaletteGroup):
+    def __init__(self, data, palette_group: PaletteGroup):
         super().__init__()
         self.enemy = Enemy.from_bytes(data)
 
         self.palette_group = palette_group
 
-        self.png_data = png_data
-
         self.selected = False
 
         self._render()
@@ -81,15 +107,21 @@ class EnemyObject(ObjectLike):
         self.sprites = self.definition.sprites
 
     def _render_blocks(self):
-        self.blocks = []
+        # The blocks are only copied from the graphics once they are drawn.
+        self._blocks: list[QImage] | None = None
 
-        block_ids = self.definition.blocks
+    @property
+    def blocks(self) -> list[QImage]:
+        if self._blocks is None:
+            png_data = get_enemy_graphics()
+            self._blocks = []
 
-        for block_id in block_ids:
-            x = (block_id % 64) * BLOCK_SIZE.width
-            y = (block_id // 64) * BLOCK_SIZE.height
+            for block_id in self.definition.blocks:
+                x = (block_id % 64) * BLOCK_SIZE.width
+                y = (block_id // 64) * BLOCK_SIZE.height
 
-            self.blocks.append(self.png_data.copy(QRect(x, y, BLOCK_SIZE.width, BLOCK_SIZE.height)))
+                self._blocks.append(png_data.copy(qt.QRect(x, y, BLOCK_SIZE.width, BLOCK_SIZE.height)))
+        return self._blocks
 
     def render(self):
         # nothing to re-render since enemies are just copied over
@@ -133,10 +165,10 @@ class EnemyObject(ObjectLike):
             )
             if transparency:
                 image = image.copy()
-                mask: QImage = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
+                mask: QImage = image.createMaskFromColor(qt.QColor(*MASK_COLOR).rgb(), qt.Qt.MaskMode.MaskOutColor)
                 image.setAlphaChannel(mask)
 
-            painter.drawImage(QPointF(x * scale_factor, y * scale_factor * 2), image)
+            painter.drawImage(qt.QPointF(x * scale_factor, y * scale_factor * 2), image)
 
     def draw_blocks(self, painter: QPainter, block_length, is_icon):
         for i, image in enumerate(self.blocks):
@@ -153,7 +185,7 @@ class EnemyObject(ObjectLike):
 
             block = image.copy()
 
-            mask = block.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
+            mask = block.createMaskFromColor(qt.QColor(*MASK_COLOR).rgb(), qt.Qt.MaskMode.MaskOutColor)
             block.setAlphaChannel(mask)
 
             # todo better effect
@@ -200,10 +232,10 @@ class EnemyObject(ObjectLike):
         definition = get_enemy_metadata().__root__[self.obj_index]
         width, height = definition.suggested_icon_width * 16, definition.suggested_icon_height * 16
 
-        image = QImage(QSize(width, height), QImage.Format.Format_RGBA8888)
-        image.fill(QColor(0, 0, 0, 0))
+        image = qt.QImage(qt.QSize(width, height), qt.QImage.Format.Format_RGBA8888)
+        image.fill(qt.QColor(0, 0, 0, 0))
 
-        painter = QPainter(image)
+        painter = qt.QPainter(image)
 
         self.draw(painter, BLOCK_SIZE.width, True, is_icon=True)
 
@@ -1,8 +1,3 @@
-from PySide6.QtCore import QRect
-from PySide6.QtGui import QImage
-
-from foundry import data_dir
-from foundry.core.drawable import BLOCK_SIZE
 from foundry.core.geometry import Point
 from foundry.core.palette import PALETTE_GROUPS_PER_OBJECT_SET, PaletteGroup
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
@@ -15,20 +10,10 @@ class EnemyItemFactory:
     definitions: list = []
 
     def __init__(self, tileset: int, palette_index: int):
-        png = QImage(str(data_dir.joinpath("gfx.png")))
-
-        png.convertTo(QImage.Format.Format_RGB888)
-
-        rows_per_tileset = 256 // 64
-
-        y_offset = 12 * rows_per_tileset * BLOCK_SIZE.height
-
-        self.png_data = png.copy(QRect(0, y_offset, png.width(), png.height() - y_offset))
-
         self.palette_group = PaletteGroup.from_tileset(tileset, PALETTE_GROUPS_PER_OBJECT_SET + palette_index)
 
     def from_data(self, data, _):
-        return EnemyObject(data, self.png_data, self.palette_group)
+        return EnemyObject(data, self.palette_group)
 
     def from_properties(self, enemy_item_id: int, point: Point):
         data = bytearray(3)
@@ -1,10 +1,11 @@
-from time import time
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 from warnings import warn
 
 from attrs import evolve
-from PySide6.QtCore import QPoint, QSize
-from PySide6.QtGui import QColor, QImage, QPainter, Qt
 
+from foundry.core import qt
 from foundry.core.drawable import MASK_COLOR, Block, block_to_image
 from foundry.core.geometry import Point, Rect, Size
 from foundry.core.graphics_set.GraphicsSet import GraphicsSet
@@ -18,9 +19,12 @@ from foundry.game.gfx.objects.ObjectLike import (
     EXPANDS_VERT,
 )
 from foundry.game.ObjectDefinitions import EndType, GeneratorType, TilesetDefinition
-from foundry.game.Tileset import Tileset
+from foundry.game.Tileset import get_tileset
 from foundry.smb3parse.objects.tileset import PLAINS_OBJECT_SET
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QImage, QPainter
+
 SKY = 0
 GROUND = 27
 
@@ -71,16 +75,12 @@ class LevelObject(GeneratorObject):
         index: int,
         size_minimal: bool = False,
     ):
-        self.tileset = Tileset(tileset)
+        self.tileset = get_tileset(tileset)
 
         self.graphics_set = graphics_set
         self._position = Point(0, 0)
         self._ignore_rendered_position = False
 
-        # Lag some vars behind
-        self._type_time = 0
-        self._orientation_time = 0
-
         self.palette_group = palette_group
 
         self._index_in_level = index
@@ -106,27 +106,23 @@ class LevelObject(GeneratorObject):
 
     @property
     def orientation(self) -> GeneratorType:
-        t = time()
-        if self._orientation_time == 0 or t - self._type_time > 10000:
-            self._orientation = GeneratorType(self.definition.orientation)
-            self._orientation_time = t
-        return self._orientation
+        return self.tileset.orientations[self.type]
 
     @property
     def ending(self) -> EndType:
-        return EndType(self.definition.ending)
+        return self.tileset.endings[self.type]
 
     @property
     def name(self) -> str:
-        return self.definition.description
+        return self.tileset.names[self.type]
 
     @property
     def blocks(self) -> list[int]:
-        return self.definition.blocks
+        return self.tileset.blocks[self.type]
 
     @property
     def size(self) -> int:
-        return self.definition.size
+        return self.tileset.sizes[self.type]
 
     @property
     def is_4byte(self) -> bool:
@@ -142,18 +138,7 @@ class LevelObject(GeneratorObject):
 
     @property
     def type(self) -> int:
-        # Dirty trick to make type lag a bit for better speed
-        t = time()
-        if self._type_time == 0 or t - self._type_time > 10000:
-            domain_offset = self.domain * 0x1F
-
-            if self.is_single_block:
-                result = self.obj_index + domain_offset
-            else:
-                result = (self.obj_index >> 4) + domain_offset + 16 - 1
-            self._type = result
-            self._type_time = t
-        return self._type
+        return self.tileset.object_type(self.domain, self.obj_index)
 
     @property
     def definition(self) -> TilesetDefinition:
@@ -580,19 +565,15 @@ class LevelObject(GeneratorObject):
         self, painter: QPainter, block_index, x, y, block_length, transparent, blocks: list[Block] | None = None
     ):
         normalized_index: int = block_index if block_index <= 0xFF else ROM().get_byte(block_index)
-        block: Block = (
-            blocks[normalized_index]
-            if blocks is not None
-            else Block.from_tsa(Point(0, 0), normalized_index, self.tsa_data)
-        )
+        block: Block = (blocks if blocks is not None else Block.tsa_table(self.tileset.number))[normalized_index]
 
         image: QImage = block_to_image(block, self.palette_group, self.graphics_set, block_length)
         if transparent:
             image = image.copy()
-            mask: QImage = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
+            mask: QImage = image.createMaskFromColor(qt.QColor(*MASK_COLOR).rgb(), qt.Qt.MaskMode.MaskOutColor)
             image.setAlphaChannel(mask)
 
-        painter.drawImage(QPoint(x * block_length, y * block_length), image)
+        painter.drawImage(qt.QPoint(x * block_length, y * block_length), image)
 
     def move_by(self, point: Point) -> None:
         self.point = self.point + point
@@ -847,25 +828,25 @@ class LevelObject(GeneratorObject):
 
     def display_size(self, zoom_factor: int = 1):
         return (
-            QSize(self.rendered_size.width * Block.size.width, self.rendered_size.height * Block.size.height)
+            qt.QSize(self.rendered_size.width * Block.size.width, self.rendered_size.height * Block.size.height)
             * zoom_factor
         )
 
     def as_image(self) -> QImage:
         self._ignore_rendered_position = True
 
-        image = QImage(
-            QSize(self.rendered_size.width * Block.size.width, self.rendered_size.height * Block.size.height),
-            QImage.Format.Format_RGB888,
+        image = qt.QImage(
+            qt.QSize(self.rendered_size.width * Block.size.width, self.rendered_size.height * Block.size.height),
+            qt.QImage.Format.Format_RGB888,
         )
 
-        bg_color = QColor(*MASK_COLOR).rgb()
+        bg_color = qt.QColor(*MASK_COLOR).rgb()
 
         image.fill(bg_color)
-        mask = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
+        mask = image.createMaskFromColor(qt.QColor(*MASK_COLOR).rgb(), qt.Qt.MaskMode.MaskOutColor)
         image.setAlphaChannel(mask)
 
-        painter = QPainter(image)
+        painter = qt.QPainter(image)
 
         self.draw(painter, Block.size.width, True)
 
@@ -1,7 +1,8 @@
-from functools import reduce
-from typing import overload
-
-from PySide6.QtCore import QObject, Signal, SignalInstance
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from difflib import SequenceMatcher
+from sys import modules
+from typing import Any, ClassVar, overload
 
 from foundry.core.geometry import Point, Rect, Size
 from foundry.game.File import ROM
@@ -12,8 +13,9 @@ from foundry.game.gfx.objects.LevelObject import LevelObject
 from foundry.game.gfx.objects.LevelObjectFactory import LevelObjectFactory
 from foundry.game.level import LevelByteData
 from foundry.game.level.LevelLike import LevelLike
-from foundry.game.level.util import get_worlds, load_level_offsets
-from foundry.game.Tileset import Tileset
+from foundry.game.level.util import get_level_catalog
+from foundry.game.ObjectDefinitions import GeneratorType
+from foundry.game.Tileset import get_tileset
 from foundry.smb3parse.constants import (
     BASE_OFFSET,
     TILESET_LEVEL_OFFSET,
@@ -30,43 +32,103 @@ TIME_INF = -1
 LEVEL_DEFAULT_HEIGHT = 27
 LEVEL_DEFAULT_WIDTH = 16
 
+GROUND_DEPENDENT_ORIENTATIONS = (
+    GeneratorType.HORIZ_TO_GROUND,
+    GeneratorType.PYRAMID_TO_GROUND,
+    GeneratorType.PYRAMID_2,
+)
+
 
 def get_level_name_suggestion(level_address: int) -> str:
-    for level in Level.offsets:
-        if level.generator_pointer == level_address:
-            name = level.display_information.name
-            if name is not None:
-                return name
-            return "Unspecified"
-    else:
+    level = get_level_catalog().by_generator_pointer.get(level_address)
+    if level is None:
         return "Unknown"
+    name = level.display_information.name
+    if name is not None:
+        return name
+    return "Unspecified"
+
+
+class _HeadlessSignal:
+    """
+    A signal of a :class:`HeadlessLevelSignaller`, which calls its slots directly.
+    """
+
+    def __init__(self, signaller: "HeadlessLevelSignaller"):
+        self._signaller = signaller
+        self._slots: list[Callable] = []
+
+    def connect(self, slot: Callable):
+        self._slots.append(slot)
+
+    def disconnect(self, slot: Callable | None = None):
+        if slot is None:
+            self._slots.clear()
+        else:
+            self._slots.remove(slot)
+
+    def emit(self, *args):
+        if not self._signaller.signalsBlocked():
+            for slot in list(self._slots):
+                slot(*args)
+
+
+class HeadlessLevelSignaller:
+    """
+    A signaller for levels with the same interface as the Qt signaller, which does not require Qt.
+
+    Scripts and task workers only parse levels, so they should not pay for importing Qt.
+    """
+
+    def __init__(self):
+        self._blocked = False
+        self.data_changed = _HeadlessSignal(self)
+        self.jumps_changed = _HeadlessSignal(self)
+
+    def blockSignals(self, block: bool) -> bool:
+        blocked, self._blocked = self._blocked, block
+        return blocked
+
+    def signalsBlocked(self) -> bool:
+        return self._blocked
 
 
-class LevelSignaller(QObject):
-    data_changed: SignalInstance = Signal()
-    jumps_changed: SignalInstance = Signal()
+def create_level_signaller():
+    """
+    Creates the signaller of a level.
+
+    Qt signals are used once Qt is imported, so a level can be connected to widgets.  Otherwise, the level does not
+    import Qt and uses a :class:`HeadlessLevelSignaller`.
+
+    :return: The signaller for a level.
+    """
+    if "PySide6.QtCore" not in modules:
+        return HeadlessLevelSignaller()
+
+    from foundry.game.level.LevelSignaller import LevelSignaller
+
+    return LevelSignaller()
 
 
 class Level(LevelLike):
     MIN_LENGTH = 0x10
 
-    offsets = load_level_offsets()
-    sorted_offsets = sorted(offsets, key=lambda level: level.generator_pointer)
-    size: Size
+    signaller_factory: ClassVar[Callable[[], Any]] = staticmethod(create_level_signaller)
+    """Creates the signaller of each level, which can be replaced to force a specific signal backend."""
 
-    WORLDS = get_worlds(offsets)
+    size: Size
 
     HEADER_LENGTH = 9  # bytes
 
     def __init__(self, level_name: str = "", layout_address: int = 0, enemy_data_offset: int = 0, tileset: int = 1):
         super().__init__(tileset, layout_address)
 
-        self._signal_emitter = LevelSignaller()
+        self._signal_emitter = self.signaller_factory()
 
         self.changed = False
         """Whether the current level was modified since it was loaded/last saved."""
 
-        self.tileset = Tileset(tileset)
+        self.tileset = get_tileset(tileset)
 
         self.name = level_name
 
@@ -79,6 +141,11 @@ class Level(LevelLike):
         self.jumps: list[Jump] = []
         self.enemies: list[EnemyObject] = []
 
+        self._object_size = 0
+        self._enemy_size = 0
+
+        self._batch_depth = 0
+
         if self.layout_address == self.enemy_offset == 0:
             # probably loaded to become an m3l
             return
@@ -150,13 +217,70 @@ class Level(LevelLike):
 
         self.data_changed.emit()
 
+    @property
+    def in_batch(self) -> bool:
+        """Whether edits are currently being grouped together by :meth:`batch`."""
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self) -> Iterator["Level"]:
+        """
+        Groups several edits to the level together. While inside the batch no signals are sent out, once the
+        outermost batch is left, data_changed is emitted exactly once.
+
+        Batches can be nested, only the outermost one will notify the listeners.
+
+        :return: The level itself, to be edited.
+        """
+        self._batch_depth += 1
+        blocked = self._signal_emitter.blockSignals(True)
+
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            self._signal_emitter.blockSignals(blocked)
+
+            if not self.in_batch:
+                self.data_changed.emit()
+
+    @property
+    def object_size(self) -> int:
+        """
+        The amount of bytes the level objects and jumps currently take up, without the delimiter.
+
+        This is a running count, which is kept up to date by every method that adds, removes or changes the size of
+        an object, so it is cheap to query after every edit.
+        """
+        return self._object_size
+
+    @property
+    def enemies_size(self) -> int:
+        """
+        The amount of bytes the enemies and items currently take up, without the delimiter.
+        """
+        return self._enemy_size
+
     def current_object_size(self):
-        return reduce(
-            lambda count, element: count + len(element), [obj.to_bytes() for obj in self.objects + self.jumps], 0
-        )
+        return self.object_size
 
     def current_enemies_size(self):
-        return reduce(lambda count, element: count + len(element), [obj.to_bytes() for obj in self.enemies], 0)
+        return self.enemies_size
+
+    @staticmethod
+    def _generator_size(obj: LevelObject | Jump) -> int:
+        if isinstance(obj, LevelObject):
+            return 4 if obj.is_4byte else 3
+        return len(obj.to_bytes())
+
+    def object_size_changed(self, obj: LevelObject | Jump, previous_size: int):
+        """
+        Updates the running object size, after an object was changed in place to a type with a different byte length.
+
+        :param obj: The object, which was changed.
+        :param previous_size: The amount of bytes the object took up before it was changed.
+        """
+        self._object_size += self._generator_size(obj) - previous_size
 
     def _parse_header(self):
         self.header = LevelHeader(self.header_bytes, self.tileset_number)
@@ -174,8 +298,14 @@ class Level(LevelLike):
 
         self.data_changed.emit()
 
-    def _load_enemies(self, data: bytearray):
-        self.enemies.clear()
+    @staticmethod
+    def _split_enemy_data(data: bytearray) -> list[bytearray]:
+        """
+        Splits the enemy data of a level into the data of the individual enemies and items.
+
+        :param data: The enemy data of the level, ending with the delimiter.
+        :return: The 3 bytes of every enemy, in the order they appear in.
+        """
 
         def data_left(_data: bytearray):
             # the commented out code seems to hold for the stock ROM, but if the ROM was already edited with another
@@ -183,24 +313,45 @@ class Level(LevelLike):
 
             return _data and not _data[0] == 0xFF  # and _data[1] in [0x00, 0x01]
 
-        enemy_data, data = data[0:ENEMY_SIZE], data[ENEMY_SIZE:]
+        enemies_data = []
 
-        while data_left(enemy_data):
+        for position in range(0, len(data), ENEMY_SIZE):
+            enemy_data = data[position : position + ENEMY_SIZE]
+
+            if not data_left(enemy_data):
+                break
+
+            enemies_data.append(enemy_data)
+
+        return enemies_data
+
+    def _load_enemies(self, data: bytearray):
+        self.enemies.clear()
+        self._enemy_size = 0
+
+        for enemy_data in self._split_enemy_data(data):
             enemy = self.enemy_item_factory.from_data(enemy_data, 0)
 
             self.enemies.append(enemy)
+            self._enemy_size += ENEMY_SIZE
 
-            enemy_data, data = data[0:ENEMY_SIZE], data[ENEMY_SIZE:]
+    def _split_object_data(self, data: bytearray) -> list[bytearray]:
+        """
+        Splits the object data of a level into the data of the individual level objects and jumps.
 
-    def _load_objects(self, data: bytearray):
-        self.objects.clear()
-        self.jumps.clear()
+        :param data: The object data of the level, without the header, ending with the delimiter.
+        :return: The 3 or 4 bytes of every object, in the order they appear in.
+        """
+        objects_data = []
 
         if not data or data[0] == 0xFF:
-            return
+            return objects_data
+
+        position = 0
 
         while True:
-            obj_data, data = data[0:3], data[3:]
+            obj_data = data[position : position + 3]
+            position += 3
 
             domain = (obj_data[0] & 0b1110_0000) >> 5
 
@@ -208,9 +359,22 @@ class Level(LevelLike):
             has_length_byte = self.tileset.get_object_byte_length(domain, obj_id) == 4
 
             if has_length_byte:
-                fourth_byte, data = data[0], data[1:]
-                obj_data.append(fourth_byte)
+                obj_data.append(data[position])
+                position += 1
+
+            objects_data.append(obj_data)
+
+            if data[position] == 0xFF:
+                break
+
+        return objects_data
+
+    def _load_objects(self, data: bytearray):
+        self.objects.clear()
+        self.jumps.clear()
+        self._object_size = 0
 
+        for obj_data in self._split_object_data(data):
             level_object = self.object_factory.from_data(obj_data, len(self.objects))
 
             if isinstance(level_object, LevelObject):
@@ -218,12 +382,11 @@ class Level(LevelLike):
             elif isinstance(level_object, Jump):
                 self.jumps.append(level_object)
 
-            if data[0] == 0xFF:
-                break
+            self._object_size += len(obj_data)
 
     def _update_level_size(self):
-        self.object_size_on_disk = self.current_object_size()
-        self.enemy_size_on_disk = self.current_enemies_size()
+        self.object_size_on_disk = self.object_size
+        self.enemy_size_on_disk = self.enemies_size
 
     @property
     def size_on_disk(self):
@@ -245,11 +408,11 @@ class Level(LevelLike):
 
     @property
     def objects_end(self):
-        return self.header_offset + Level.HEADER_LENGTH + self.current_object_size() + len(b"\xFF")  # the delimiter
+        return self.header_offset + Level.HEADER_LENGTH + self.object_size + len(b"\xFF")  # the delimiter
 
     @property
     def enemies_end(self):
-        return self.enemy_offset + self.current_enemies_size() + len(b"\xFF\x00")  # the delimiter
+        return self.enemy_offset + self.enemies_size + len(b"\xFF\x00")  # the delimiter
 
     @property
     def next_area_objects(self):
@@ -491,10 +654,10 @@ class Level(LevelLike):
         return self.too_many_level_objects() or self.too_many_enemies_or_items()
 
     def too_many_level_objects(self):
-        return self.current_object_size() > self.object_size_on_disk
+        return self.object_size > self.object_size_on_disk
 
     def too_many_enemies_or_items(self):
-        return self.current_enemies_size() > self.enemy_size_on_disk
+        return self.enemies_size > self.enemy_size_on_disk
 
     def get_all_objects(self) -> list[LevelObject | EnemyObject]:
         return self.objects + self.enemies
@@ -622,6 +785,7 @@ class Level(LevelLike):
 
         obj = self.object_factory.from_properties(domain, object_index, point, length, index)
         self.objects.insert(index, obj)
+        self._object_size += self._generator_size(obj)
 
         return obj
 
@@ -633,17 +797,25 @@ class Level(LevelLike):
 
         enemy = self.enemy_item_factory.from_data([object_index, point.x, point.y], -1)
 
-        self.enemies.insert(index, enemy)
+        self.insert_enemy(index, enemy)
 
         return enemy
 
+    def insert_enemy(self, index: int, enemy: EnemyObject) -> None:
+        self.enemies.insert(index, enemy)
+        self._enemy_size += ENEMY_SIZE
+
     def add_jump(self):
-        self.jumps.append(Jump.from_properties(0, 0, 0, 0))
+        jump = Jump.from_properties(0, 0, 0, 0)
+
+        self.jumps.append(jump)
+        self._object_size += self._generator_size(jump)
 
         self.data_changed.emit()
 
     def remove_jump(self, jump: Jump):
         self.jumps.remove(jump)
+        self._object_size -= self._generator_size(jump)
 
         self.data_changed.emit()
 
@@ -667,8 +839,51 @@ class Level(LevelLike):
 
         if isinstance(obj, LevelObject):
             self.objects.remove(obj)
+            self._object_size -= self._generator_size(obj)
         elif isinstance(obj, EnemyObject):
             self.enemies.remove(obj)
+            self._enemy_size -= ENEMY_SIZE
+
+    def remove_objects(self, objects: Iterable[EnemyObject | LevelObject]):
+        """
+        Removes all the given objects from the level in a single pass over the object and enemy lists.
+
+        Objects are compared by identity, so that equal copies of an object, that are not part of the selection,
+        stay in the level.
+
+        :param objects: The level objects and enemies to remove.
+        """
+        to_remove = {id(obj) for obj in objects if obj is not None}
+
+        if not to_remove:
+            return
+
+        with self.batch():
+            remaining_objects = []
+
+            for obj in self.objects:
+                if id(obj) in to_remove:
+                    self._object_size -= self._generator_size(obj)
+                else:
+                    remaining_objects.append(obj)
+
+            remaining_enemies = [enemy for enemy in self.enemies if id(enemy) not in to_remove]
+            self._enemy_size -= (len(self.enemies) - len(remaining_enemies)) * ENEMY_SIZE
+
+            # change the lists in place, since the objects keep a reference to them
+            self.objects[:] = remaining_objects
+            self.enemies[:] = remaining_enemies
+
+    def move_objects(self, objects: Iterable[EnemyObject | LevelObject], offset: Point):
+        """
+        Moves all the given objects by the same offset, rendering each of them once.
+
+        :param objects: The level objects and enemies to move.
+        :param offset: The amount of blocks to move the objects by.
+        """
+        with self.batch():
+            for obj in objects:
+                obj.move_by(offset)
 
     def to_m3l(self) -> bytearray:
         world_number = level_number = 1
@@ -698,7 +913,7 @@ class Level(LevelLike):
 
     def from_m3l(self, m3l_bytes: bytearray):
         world_number, level_number, self.tileset_number = m3l_bytes[:3]
-        self.tileset = Tileset(self.tileset_number)
+        self.tileset = get_tileset(self.tileset_number)
 
         self.header_offset = self.enemy_offset = 0
 
@@ -717,7 +932,7 @@ class Level(LevelLike):
 
         # figure out how many bytes are the objects
         self._load_objects(m3l_bytes)
-        object_size = self.current_object_size() + len(b"\xFF")  # delimiter
+        object_size = self.object_size + len(b"\xFF")  # delimiter
 
         object_bytes = m3l_bytes[:object_size]
         enemy_bytes = m3l_bytes[object_size:]
@@ -745,18 +960,102 @@ class Level(LevelLike):
 
         enemies = bytearray()
 
-        if self.is_vertical:
-            enemies_objects = sorted(self.enemies, key=lambda _enemy: _enemy.point.y)
-        else:
-            enemies_objects = sorted(self.enemies, key=lambda _enemy: _enemy.point.x)
-
-        for enemy in enemies_objects:
+        for enemy in self._enemies_in_save_order():
             enemies.extend(enemy.to_bytes())
 
         enemies.append(0xFF)
 
         return (self.header_offset, data), (self.enemy_offset, enemies)
 
+    def patch_from_bytes(self, object_data: tuple[int, bytearray], enemy_data: tuple[int, bytearray]):
+        """
+        Brings the level into the state described by the given data, like :meth:`from_bytes`, but only creates
+        the objects, enemies and jumps, which differ from the current ones. Objects, which stay the same, are kept
+        together with their rendered blocks and selection.
+
+        If the header differs, the level is reloaded completely instead.
+
+        :param object_data: The offset and the bytes of the header and level objects.
+        :param enemy_data: The offset and the bytes of the enemies and items.
+        """
+        self.header_offset, object_bytes = object_data
+        self.enemy_offset, enemy_bytes = enemy_data
+
+        if object_bytes[: Level.HEADER_LENGTH] != self.header_bytes:
+            self.from_bytes(object_data, enemy_data, new_level=False)
+            return
+
+        self.object_offset = self.header_offset + Level.HEADER_LENGTH
+
+        target_objects, target_jumps = [], []
+        for obj_data in self._split_object_data(object_bytes[Level.HEADER_LENGTH :]):
+            (target_jumps if Jump.is_jump(obj_data) else target_objects).append(bytes(obj_data))
+
+        target_enemies = [bytes(data) for data in self._split_enemy_data(enemy_bytes)]
+
+        self._patch_objects(
+            self.objects,
+            list(self.objects),
+            target_objects,
+            lambda data: self.object_factory.from_data(data, len(self.objects)),
+            render_dependents=True,
+        )
+        self._patch_objects(self.jumps, list(self.jumps), target_jumps, Jump)
+        self._patch_objects(
+            self.enemies,
+            self._enemies_in_save_order(),
+            target_enemies,
+            lambda data: self.enemy_item_factory.from_data(data, 0),
+        )
+
+        self._object_size = sum(len(data) for data in target_objects + target_jumps)
+        self._enemy_size = len(target_enemies) * ENEMY_SIZE
+
+    @staticmethod
+    def _patch_objects(
+        objects: list,
+        current_objects: list,
+        target_data: list[bytes],
+        create: Callable[[bytearray], Any],
+        render_dependents: bool = False,
+    ):
+        """
+        Changes the objects in place, so that they serialize to the target data, keeping every current object,
+        which is still part of it.
+
+        :param objects: The list of objects to change.
+        :param current_objects: The objects of the list, in the order they are saved in.
+        :param target_data: The bytes of every object, the list should end up with.
+        :param create: Creates a new object from its bytes.
+        :param render_dependents: Whether objects, which depend on the objects in front of them, should be
+            rendered again, after something in front of them changed.
+        """
+        current_data = [bytes(obj.to_bytes()) for obj in current_objects]
+
+        # objects need to see the objects in front of them, when they are created, to render correctly
+        objects.clear()
+        changed = False
+
+        matcher = SequenceMatcher(None, current_data, target_data, autojunk=False)  # type: ignore
+        for tag, current_start, current_end, target_start, target_end in matcher.get_opcodes():
+            if tag != "equal":
+                changed = True
+                for data in target_data[target_start:target_end]:
+                    objects.append(create(bytearray(data)))
+                continue
+
+            for obj in current_objects[current_start:current_end]:
+                objects.append(obj)
+
+                if changed and render_dependents and obj.orientation in GROUND_DEPENDENT_ORIENTATIONS:
+                    obj.render()
+
+    def _enemies_in_save_order(self) -> list[EnemyObject]:
+        if self.is_vertical:
+            return sorted(self.enemies, key=lambda _enemy: _enemy.point.y)
+        else:
+            return sorted(self.enemies, key=lambda _enemy: _enemy.point.x)
+
     def from_bytes(self, object_data: tuple[int, bytearray], enemy_data: tuple[int, bytearray], new_level=True):
 
         self.header_offset, object_bytes = object_data
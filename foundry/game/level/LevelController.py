@@ -17,11 +17,6 @@ from foundry.game.level.LevelRef import LevelRef
 from foundry.game.level.util import get_level_index
 from foundry.gui.AutoScrollEditor import AutoScrollEditor
 from foundry.gui.BlockViewer import BlockViewerController as BlockViewer
-from foundry.gui.HeaderEditor import (
-    HeaderEditor,
-    header_state_to_level_header,
-    level_to_header_state,
-)
 from foundry.gui.JumpEditor import JumpEditor
 from foundry.gui.LevelSelector import LevelSelector
 from foundry.gui.LevelView import undoable
@@ -219,7 +214,9 @@ class LevelController:
         assert index >= 0
 
         if isinstance(self.level_ref.level, Level):
+            previous_size = len(self.level_ref.level.jumps[index].to_bytes())
             self.level_ref.level.jumps[index] = jump
+            self.level_ref.level.object_size_changed(jump, previous_size)
             self.parent.jump_list.item(index).setText(str(jump))
 
     @undoable
@@ -295,6 +292,12 @@ class LevelController:
         self.parent.level_view.update()
 
     def display_header_editor(self):
+        from foundry.gui.HeaderEditor import (
+            HeaderEditor,
+            header_state_to_level_header,
+            level_to_header_state,
+        )
+
         header_editor = HeaderEditor(
             self.parent, level_to_header_state(self.level_ref.level, ROM().settings), ROM().settings  # type: ignore
         )
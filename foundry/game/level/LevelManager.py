@@ -25,7 +25,6 @@ from foundry.gui.ObjectStatusBar import ObjectStatusBar
 from foundry.gui.ObjectToolBar import ObjectToolBar
 from foundry.gui.ObjectViewer import ObjectViewer
 from foundry.gui.PaletteGroupController import PaletteGroupController
-from foundry.gui.PlayerViewer import PlayerViewerController as PlayerViewer
 from foundry.gui.settings import FileSettings, UserSettings
 from foundry.gui.SpinnerPanel import SpinnerPanel
 from foundry.gui.Toolbar import create_toolbar
@@ -81,6 +80,8 @@ class LevelManager:
         self.parent.warning_action.setEnabled(value)
 
     def display_player_viewer(self):
+        from foundry.gui.PlayerViewer import PlayerViewerController as PlayerViewer
+
         player_viewer = PlayerViewer(self.parent)
         player_viewer.show()
 
@@ -106,7 +107,7 @@ class LevelManager:
     def on_enable(self):
         self._enabled = True
 
-        level_ref = LevelRef()
+        level_ref = LevelRef(self.user_settings.undo_memory_budget)
 
         self.controller = LevelController(self.parent, level_ref)
 
@@ -133,7 +134,7 @@ class LevelManager:
         self.parent.level_size_bar = LevelSizeBar(self.parent, "Generators", 0, 0)
 
         def update_level_size_bar(*args, **kwargs):
-            self.parent.level_size_bar.current_value = level_ref.level.current_object_size()
+            self.parent.level_size_bar.current_value = level_ref.level.object_size
             self.parent.level_size_bar.maximum_value = level_ref.level.object_size_on_disk
 
         level_ref.data_changed.connect(update_level_size_bar)
@@ -141,7 +142,7 @@ class LevelManager:
         self.parent.enemy_size_bar = LevelSizeBar(self.parent, "Enemies/Items", 0, 0)
 
         def update_enemy_size_bar(*args, **kwargs):
-            self.parent.enemy_size_bar.current_value = level_ref.level.current_enemies_size()
+            self.parent.enemy_size_bar.current_value = level_ref.level.enemies_size
             self.parent.enemy_size_bar.maximum_value = level_ref.level.enemy_size_on_disk
 
         level_ref.data_changed.connect(update_enemy_size_bar)
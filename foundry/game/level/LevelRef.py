@@ -1,19 +1,63 @@
-from PySide6.QtCore import QObject, Signal, SignalInstance
+from collections.abc import Iterator
+from contextlib import contextmanager
 
-from foundry.core.UndoController import UndoController
+from PySide6.QtCore import QObject, QTimer, Signal, SignalInstance
+
+from foundry.core.UndoController import ByteDelta, DeltaUndoController
 from foundry.game.level import LevelByteData
 from foundry.game.level.Level import Level
 
+LevelDelta = tuple[tuple[int, ByteDelta], tuple[int, ByteDelta]]
+
+DEFAULT_UNDO_MEMORY_BUDGET = 4 * 1024 * 1024  # bytes
+
+LEVEL_DELTA_OVERHEAD = 512  # bytes, roughly the tuples, deltas and integers stored alongside the changed bytes
+
+FRAME_DURATION = 16  # milliseconds, listeners are notified at most once per frame during a gesture
+
+
+def level_difference(source: LevelByteData, target: LevelByteData) -> LevelDelta:
+    (_, source_objects), (_, source_enemies) = source
+    (object_offset, target_objects), (enemy_offset, target_enemies) = target
+
+    return (
+        (object_offset, ByteDelta.from_bytes(source_objects, target_objects)),
+        (enemy_offset, ByteDelta.from_bytes(source_enemies, target_enemies)),
+    )
+
+
+def apply_level_difference(source: LevelByteData, delta: LevelDelta) -> LevelByteData:
+    (_, source_objects), (_, source_enemies) = source
+    (object_offset, object_delta), (enemy_offset, enemy_delta) = delta
+
+    return (object_offset, object_delta.apply(source_objects)), (enemy_offset, enemy_delta.apply(source_enemies))
+
+
+def level_difference_size(delta: LevelDelta) -> int:
+    (_, object_delta), (_, enemy_delta) = delta
+
+    return len(object_delta) + len(enemy_delta) + LEVEL_DELTA_OVERHEAD
+
 
 class LevelRef(QObject):
     data_changed: SignalInstance = Signal()  # type: ignore
     jumps_changed: SignalInstance = Signal()  # type: ignore
+    gestures_interrupted: SignalInstance = Signal()  # type: ignore
 
-    def __init__(self):
+    def __init__(self, undo_memory_budget: int | None = DEFAULT_UNDO_MEMORY_BUDGET):
         super().__init__()
         self._internal_level = None
-        self._undo_controller = None
+        self._undo_controller: DeltaUndoController[LevelByteData, LevelDelta] | None = None
+        self.undo_memory_budget = undo_memory_budget
         self._is_loaded = False
+        self._batch_depth = 0
+
+        self._gesture_depth = 0
+        self._gesture_changed = False
+        self._notification_timer = QTimer(self)
+        self._notification_timer.setSingleShot(True)
+        self._notification_timer.setInterval(FRAME_DURATION)
+        self._notification_timer.timeout.connect(self.data_changed.emit)
 
     @property
     def is_loaded(self) -> bool:
@@ -30,6 +74,9 @@ class LevelRef(QObject):
         self._internal_level = None
         self._undo_controller = None
         self._is_loaded = False
+        self._gesture_depth = 0
+        self._gesture_changed = False
+        self._notification_timer.stop()
 
     @property
     def level(self) -> Level:
@@ -41,9 +88,15 @@ class LevelRef(QObject):
     def level(self, level: Level):
         self._internal_level = level
 
-        self._undo_controller = UndoController(self._internal_level.to_bytes())
+        self._undo_controller = DeltaUndoController(
+            self._internal_level.to_bytes(),
+            level_difference,
+            apply_level_difference,
+            level_difference_size,
+            self.undo_memory_budget,
+        )
 
-        self._internal_level.data_changed.connect(self.data_changed.emit)
+        self._internal_level.data_changed.connect(self.notify_data_changed)
         self._internal_level.jumps_changed.connect(self.jumps_changed.emit)
 
     @property
@@ -56,13 +109,17 @@ class LevelRef(QObject):
     def selected_objects(self, selected_objects):
         assert self._internal_level is not None
 
-        if selected_objects == self.selected_objects:
+        # compare by identity, equality of level objects requires them to be serialized
+        selected_ids = {id(obj) for obj in selected_objects}
+        all_objects = self._internal_level.get_all_objects()
+
+        if all(obj.selected == (id(obj) in selected_ids) for obj in all_objects):
             return
 
-        for obj in self._internal_level.get_all_objects():
-            obj.selected = obj in selected_objects
+        for obj in all_objects:
+            obj.selected = id(obj) in selected_ids
 
-        self.data_changed.emit()
+        self.notify_data_changed()
 
     @property
     def state(self) -> LevelByteData:
@@ -70,6 +127,14 @@ class LevelRef(QObject):
 
         return self._undo_controller.state
 
+    @property
+    def history_size(self) -> int:
+        """The amount of bytes used to store the undo and redo history of the current level."""
+        if self._undo_controller is None:
+            return 0
+
+        return self._undo_controller.history_size
+
     def do(self, level_data: LevelByteData | None = None) -> LevelByteData:
         assert self._undo_controller is not None
 
@@ -86,6 +151,7 @@ class LevelRef(QObject):
     def undo(self) -> LevelByteData:
         assert self._undo_controller is not None
 
+        self.interrupt_gestures()
         new_state = self._undo_controller.undo()
         self.set_level_state(*new_state)
         return new_state
@@ -99,24 +165,142 @@ class LevelRef(QObject):
     def redo(self) -> LevelByteData:
         assert self._undo_controller is not None
 
+        self.interrupt_gestures()
         new_state = self._undo_controller.redo()
         self.set_level_state(*new_state)
         return new_state
 
     def set_level_state(self, object_data, enemy_data):
-        self.level.from_bytes(object_data, enemy_data, new_level=False)
+        self.level.patch_from_bytes(object_data, enemy_data)
         self.level.changed = True
 
         self.data_changed.emit()
 
+    @contextmanager
+    def batch(self) -> Iterator[Level]:
+        """
+        Groups several edits to the level into a single undo entry. Listeners are notified once, after the outermost
+        batch was left and the state of the level was saved.
+
+        Batches can be nested, so undoable actions calling each other only result in one undo entry. If a batch raises
+        an exception, the level is restored to its state before the outermost batch and nothing is saved.
+        """
+        assert self._internal_level is not None
+        assert self._undo_controller is not None
+
+        if self._batch_depth:
+            previous_state = None
+        elif self._gesture_changed:
+            # the level differs from the saved state, until the gesture is done
+            previous_state = self._internal_level.to_bytes()
+        else:
+            previous_state = self._undo_controller.state
+        completed = False
+
+        self._batch_depth += 1
+        blocked = self.blockSignals(True)
+
+        try:
+            with self._internal_level.batch():
+                yield self._internal_level
+            completed = True
+        finally:
+            self._batch_depth -= 1
+            self.blockSignals(blocked)
+
+            if previous_state is None:
+                pass
+            elif completed:
+                self.save_level_state()
+            else:
+                self.set_level_state(*previous_state)
+
+    @property
+    def in_gesture(self) -> bool:
+        """Whether a continuous gesture, like dragging or resizing objects, is currently taking place."""
+        return self._gesture_depth > 0
+
+    def begin_gesture(self):
+        """
+        Starts a continuous gesture, like dragging objects with the mouse. Every state saved until the gesture ends is
+        merged into a single undo entry and listeners are notified at most once per frame in the meantime.
+        """
+        self._gesture_depth += 1
+
+    def end_gesture(self):
+        """
+        Ends the current gesture. If any state was saved during it, the final state is saved as a single undo entry.
+        """
+        if not self.in_gesture:
+            return
+
+        self._gesture_depth -= 1
+
+        if self.in_gesture:
+            return
+
+        notification_pending = self._notification_timer.isActive()
+        self._notification_timer.stop()
+
+        if self._gesture_changed:
+            self._gesture_changed = False
+            self.save_level_state()
+        elif notification_pending:
+            self.data_changed.emit()
+
+    def interrupt_gestures(self):
+        """
+        Ends every open gesture at once and saves its changes, so the history is not changed while a gesture is
+        open. Listeners of :attr:`gestures_interrupted` are notified first, so they can forget their gestures.
+        """
+        if not self.in_gesture:
+            return
+
+        self.gestures_interrupted.emit()
+
+        self._gesture_depth = 1
+        self.end_gesture()
+
+    @contextmanager
+    def gesture(self) -> Iterator[Level]:
+        """
+        A gesture as a context, see :meth:`begin_gesture` and :meth:`end_gesture`.
+        """
+        self.begin_gesture()
+
+        try:
+            yield self.level
+        finally:
+            self.end_gesture()
+
+    def notify_data_changed(self):
+        """
+        Notifies the listeners, that the level changed. During a gesture, notifications are throttled to one per
+        frame.
+        """
+        if self.in_gesture:
+            if not self._notification_timer.isActive():
+                self._notification_timer.start()
+        else:
+            self.data_changed.emit()
+
     def save_level_state(self):
         assert self._internal_level is not None
         assert self._undo_controller is not None
 
-        self.do(self._internal_level.to_bytes())
-        self.level.changed = True
+        if self._batch_depth:
+            # the state will be saved, once the batch is done
+            return
 
-        self.data_changed.emit()
+        if self.in_gesture:
+            # the state will be saved, once the gesture is done
+            self._gesture_changed = True
+            self.level.changed = True
+            self.notify_data_changed()
+            return
+
+        self.level.changed = True
+        self.do(self._internal_level.to_bytes())
 
     def __bool__(self):
         return self.is_loaded
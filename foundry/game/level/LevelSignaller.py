@@ -0,0 +1,6 @@
+from PySide6.QtCore import QObject, Signal, SignalInstance
+
+
+class LevelSignaller(QObject):
+    data_changed: SignalInstance = Signal()
+    jumps_changed: SignalInstance = Signal()
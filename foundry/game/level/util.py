@@ -1,9 +1,13 @@
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from functools import cache
 from json import loads
+from operator import is_
 
 from attr import attrs
 from pydantic import BaseModel
 
-from foundry import data_dir, default_levels_path
+from foundry import default_levels_path
 
 
 @attrs(auto_attribs=True, slots=True, frozen=True)
@@ -326,27 +330,110 @@ def get_level_index(levels: list[Level], generator_pointer: int, enemy_pointer:
             return index
 
 
-def get_worlds(levels: list[PydanticLevel]) -> int:
+class LevelCatalog:
     """
-    Determines the amount of worlds there are inside the game.
+    An index of levels, to find a level by its pointers or location without scanning every level.
 
-    Parameters
+    Attributes
     ----------
-    levels : list[PydanticLevel]
-        The levels to find worlds from.
-
-    Returns
-    -------
-    int
+    levels: tuple[Level, ...]
+        The levels inside the catalog, in their original order.
+    by_generator_pointer: dict[int, Level]
+        The first level for each generator pointer.
+    by_enemy_pointer: dict[int, Level]
+        The first level for each enemy pointer.
+    by_location: dict[tuple[int, int], Level]
+        The level at each world and index, where later levels replace earlier ones like `get_world_levels`.
+    generator_pointers: tuple[int, ...]
+        The generator pointers of `sorted_by_generator_pointer`.
+    sorted_by_generator_pointer: tuple[Level, ...]
+        The levels sorted by their generator pointer.
+    enemy_pointers: tuple[int, ...]
+        The enemy pointers of `sorted_by_enemy_pointer`.
+    sorted_by_enemy_pointer: tuple[Level, ...]
+        The levels sorted by their enemy pointer.
+    worlds: int
         The amount of worlds there are.
     """
-    worlds = 0
-    for level in levels:
-        if level.tileset == 0:
-            worlds += 1
-    return worlds
 
+    def __init__(self, levels: Iterable[Level]):
+        self.levels = tuple(levels)
+
+        self.by_generator_pointer: dict[int, Level] = {}
+        self.by_enemy_pointer: dict[int, Level] = {}
+        self.by_location: dict[tuple[int, int], Level] = {}
+        for level in self.levels:
+            self.by_generator_pointer.setdefault(level.generator_pointer, level)
+            self.by_enemy_pointer.setdefault(level.enemy_pointer, level)
+            for location in level.display_information.locations:
+                self.by_location[location.world, location.index] = level
+
+        self.sorted_by_generator_pointer = tuple(sorted(self.levels, key=lambda level: level.generator_pointer))
+        self.generator_pointers = tuple(level.generator_pointer for level in self.sorted_by_generator_pointer)
+        self.sorted_by_enemy_pointer = tuple(sorted(self.levels, key=lambda level: level.enemy_pointer))
+        self.enemy_pointers = tuple(level.enemy_pointer for level in self.sorted_by_enemy_pointer)
+
+        self.worlds = sum(1 for level in self.levels if level.tileset == 0)
+
+    def is_catalog_of(self, levels: Sequence[Level]) -> bool:
+        """
+        Determines if the catalog was made from exactly the levels provided, so it does not need to be remade.
+
+        Parameters
+        ----------
+        levels : Sequence[Level]
+            The levels which may have been changed since the catalog was made.
+
+        Returns
+        -------
+        bool
+            If the catalog contains the same levels, in the same order.
+        """
+        return len(levels) == len(self.levels) and all(map(is_, levels, self.levels))
+
+    def level_before_generator_address(self, address: int) -> Level | None:
+        """
+        Finds the level with the greatest generator pointer that is not after an address.
+
+        Parameters
+        ----------
+        address : int
+            The address to find the level of.
+
+        Returns
+        -------
+        Optional[Level]
+            The level, if any level starts at or before the address.
+        """
+        index = bisect_right(self.generator_pointers, address) - 1
+        return self.sorted_by_generator_pointer[index] if index >= 0 else None
+
+    def level_before_enemy_address(self, address: int) -> Level | None:
+        """
+        Finds the level with the greatest enemy pointer that is not after an address.
 
-def load_level_offsets() -> list[PydanticLevel]:
-    with open(data_dir.joinpath("levels.json")) as f:
-        return [PydanticLevel(**level) for level in loads(f.read())]
+        Parameters
+        ----------
+        address : int
+            The address to find the level of.
+
+        Returns
+        -------
+        Optional[Level]
+            The level, if any level's enemies start at or before the address.
+        """
+        index = bisect_right(self.enemy_pointers, address) - 1
+        return self.sorted_by_enemy_pointer[index] if index >= 0 else None
+
+
+@cache
+def get_level_catalog() -> LevelCatalog:
+    """
+    Provides the catalog of the levels that the base game contains, which is only loaded once it is first needed.
+
+    Returns
+    -------
+    LevelCatalog
+        The catalog of the default levels.
+    """
+    return LevelCatalog(generate_default_level_information())
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from enum import Enum
-from json import loads
 
 from PySide6.QtGui import QIcon
 
-from foundry import namespace_path
+from foundry import definitions_cache_path, namespace_path
 from foundry.core.drawable import Drawable
 from foundry.core.icon import Icon
-from foundry.core.namespace import Namespace, TypeHandlerManager, generate_namespace
+from foundry.core.namespace import (
+    Namespace,
+    TypeHandlerManager,
+    generate_cached_namespace,
+)
 
 _icons: Namespace[Icon]
 
@@ -16,10 +19,12 @@ _icons: Namespace[Icon]
 def load_namespace() -> Namespace:
     global _namespace
     global _icons
-    with open(str(namespace_path)) as f:
-        _namespace = generate_namespace(
-            loads(f.read()), validators=TypeHandlerManager.from_managers(Drawable.type_manager, Icon.type_manager)
-        )
+    _namespace = generate_cached_namespace(
+        namespace_path,
+        definitions_cache_path / "namespaces.bin",
+        validators=TypeHandlerManager.from_managers(Drawable.type_manager, Icon.type_manager),
+        compile_validators=True,
+    )
     _icons = _namespace.children["graphics"].children["common_icons"]
     return _namespace
 
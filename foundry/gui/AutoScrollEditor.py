@@ -1,5 +1,6 @@
 from PySide6.QtWidgets import QCheckBox, QLabel, QVBoxLayout
 
+from foundry.core.geometry import Point
 from foundry.game.gfx.objects.EnemyItem import EnemyObject
 from foundry.game.level.LevelRef import LevelRef
 from foundry.gui.CustomDialog import CustomDialog
@@ -66,10 +67,10 @@ class AutoScrollEditor(CustomDialog):
         autoscroll_item = _get_autoscroll(self.level_ref.level.enemies)
 
         if autoscroll_item is not None:
-            self.level_ref.level.enemies.remove(autoscroll_item)
+            self.level_ref.level.remove_object(autoscroll_item)
 
         if should_insert:
-            self.level_ref.level.enemies.insert(0, self._create_autoscroll_object())
+            self.level_ref.level.insert_enemy(0, self._create_autoscroll_object())
 
         self.level_ref.data_changed.emit()
 
@@ -77,7 +78,7 @@ class AutoScrollEditor(CustomDialog):
 
     def _create_autoscroll_object(self):
         return self.level_ref.level.enemy_item_factory.from_properties(
-            OBJ_AUTOSCROLL, 0, self.y_position_spinner.value()
+            OBJ_AUTOSCROLL, Point(0, self.y_position_spinner.value())
         )
 
     def closeEvent(self, event):
@@ -239,10 +239,10 @@ class BlockViewerView(QWidget):
         painter.setBrush(QBrush(palette_group.background_color))
         painter.drawRect(QRect(QPoint(0, 0), self.size()))
         graphics_set: GraphicsSet = GraphicsSet.from_tileset(self.tileset)
-        tsa_data: bytearray = ROM.get_tsa_data(self.tileset)
+        blocks: tuple[Block, ...] = Block.tsa_table(self.tileset)
 
         for i in range(self.BLOCKS):
-            block: Block = Block.from_tsa(Point(0, 0), i, tsa_data)
+            block: Block = blocks[i]
             image = block_to_image(block, palette_group, graphics_set, self.block_scale, True)
             x = (i % self.BLOCKS_PER_ROW) * self.block_scale
             y = (i // self.BLOCKS_PER_ROW) * self.block_scale
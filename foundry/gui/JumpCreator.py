@@ -3,7 +3,6 @@ from json import loads
 from PySide6.QtWidgets import QWidget
 
 from foundry import jump_creator_flags_path
-from foundry.gui.HeaderEditor import HeaderEditor
 from foundry.gui.LevelView import LevelView, undoable
 from foundry.gui.util import setup_layout
 
@@ -27,6 +26,8 @@ class JumpCreator(QWidget):
         self.level_view.add_jump()
 
     def show_jump_dest(self):
+        from foundry.gui.HeaderEditor import HeaderEditor
+
         header_editor = HeaderEditor(self, self.level_ref)
         header_editor.tab_widget.setCurrentIndex(3)
         header_editor.exec()
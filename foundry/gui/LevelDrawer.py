@@ -1,20 +1,25 @@
+from functools import cache, lru_cache
 from itertools import product
 from json import loads
 
 from PySide6.QtCore import QPoint, QRect
 from PySide6.QtGui import QBrush, QColor, QImage, QPainter, QPen, Qt
 
-from foundry import data_dir, namespace_path
+from foundry import data_dir, definitions_cache_path, namespace_path
 from foundry.core.drawable import BLOCK_SIZE, MASK_COLOR, Block
 from foundry.core.drawable import Drawable as DrawableValidator
 from foundry.core.drawable import apply_selection_overlay, block_to_image
 from foundry.core.geometry import Point
 from foundry.core.graphics_set.GraphicsSet import GraphicsSet
 from foundry.core.icon import Icon
-from foundry.core.namespace import Namespace, TypeHandlerManager, generate_namespace
+from foundry.core.namespace import (
+    Namespace,
+    TypeHandlerManager,
+    generate_cached_namespace,
+    generate_namespace,
+)
 from foundry.core.palette import ColorPalette, PaletteGroup
-from foundry.game.File import ROM
-from foundry.game.gfx.objects.EnemyItem import EnemyObject
+from foundry.game.Definitions import OverlayItem, OverlayType
 from foundry.game.gfx.objects.LevelObject import (
     GROUND,
     SCREEN_HEIGHT,
@@ -45,18 +50,55 @@ level_images: Namespace[DrawableValidator] = None  # type: ignore
 def load_namespace() -> Namespace:
     global namespace
     global level_images
-    with open(str(namespace_path)) as f:
-        namespace = generate_namespace(
-            loads(f.read()),
-            validators=TypeHandlerManager.from_managers(DrawableValidator.type_manager, Icon.type_manager),
-        )
+    namespace = generate_cached_namespace(
+        namespace_path,
+        definitions_cache_path / "namespaces.bin",
+        validators=TypeHandlerManager.from_managers(DrawableValidator.type_manager, Icon.type_manager),
+        compile_validators=True,
+    )
+
+    level_images = namespace.children["graphics"].children["level_images"]
+    _overlay_image.cache_clear()
+    _selected_overlay_image.cache_clear()
+    return namespace
+
+
+def _without_icons(node: dict) -> dict:
+    children: dict = {
+        name: _without_icons(child)
+        for name, child in node.get("children", {}).items()
+        if child.get("type") not in Icon.__names__
+    }
+    return node | {"children": children}
+
+
+def load_headless_namespace() -> Namespace:
+    """
+    Loads the namespace used to draw levels without its icons, as icons can only be created once a GUI application
+    exists.  This allows processes without an application, such as workers, to draw levels.
+
+    Returns
+    -------
+    Namespace
+        The namespace of the images used to draw levels.
+    """
+    global namespace
+    global level_images
+    namespace = generate_namespace(
+        _without_icons(loads(namespace_path.read_bytes())), DrawableValidator.type_manager, compile_validators=True
+    )
 
     level_images = namespace.children["graphics"].children["level_images"]
+    _overlay_image.cache_clear()
+    _selected_overlay_image.cache_clear()
     return namespace
 
 
-png = QImage(str(data_dir / "gfx.png"))
-png.convertTo(QImage.Format.Format_RGB888)
+@cache
+def _get_png() -> QImage:
+    png = QImage(str(data_dir / "gfx.png"))
+    png.convertTo(QImage.Format.Format_RGB888)
+    return png
 
 
 def _make_image_selected(image: QImage) -> QImage:
@@ -71,35 +113,48 @@ def _make_image_selected(image: QImage) -> QImage:
 
 
 def _load_from_png(point: Point):
-    image = png.copy(QRect(point.x * 16, point.y * 16, 16, 16))
+    image = _get_png().copy(QRect(point.x * 16, point.y * 16, 16, 16))
     mask = image.createMaskFromColor(QColor(*MASK_COLOR).rgb(), Qt.MaskMode.MaskOutColor)
     image.setAlphaChannel(mask)
 
     return image
 
 
-FIRE_FLOWER = lambda: level_images["fire_flower"].image()  # noqa: E731
-LEAF = lambda: level_images["leaf"].image()  # noqa: E731
-NORMAL_STAR = lambda: level_images["star"].image()  # noqa: E731
-CONTINUOUS_STAR = lambda: level_images["star_continuous"].image()  # noqa: E731
-MULTI_COIN = lambda: level_images["coins_multiple"].image()  # noqa: E731
-ONE_UP = lambda: level_images["extra_life"].image()  # noqa: E731
-COIN = lambda: level_images["coin"].image()  # noqa: E731
-VINE = lambda: level_images["vine"].image()  # noqa: E731
-P_SWITCH = lambda: level_images["p_switch"].image()  # noqa: E731
-SILVER_COIN = lambda: level_images["coin_silver"].image()  # noqa: E731
-INVISIBLE_COIN = lambda: level_images["coin_invisible"].image()  # noqa: E731
-INVISIBLE_1_UP = lambda: level_images["coin_extra_life"].image()  # noqa: E731
-
-NO_JUMP = lambda: level_images["no_jump"].image()  # noqa: E731
-UP_ARROW = lambda: level_images["up_arrow"].image()  # noqa: E731
-DOWN_ARROW = lambda: level_images["down_arrow"].image()  # noqa: E731
-LEFT_ARROW = lambda: level_images["left_arrow"].image()  # noqa: E731
-RIGHT_ARROW = lambda: level_images["right_arrow"].image()  # noqa: E731
+PIPE_IMAGES: dict[OverlayType, str] = {
+    OverlayType.PIPE_UP: "up_arrow",
+    OverlayType.PIPE_DOWN: "down_arrow",
+    OverlayType.PIPE_LEFT: "left_arrow",
+    OverlayType.PIPE_RIGHT: "right_arrow",
+}
+ITEM_BLOCK_IMAGES: dict[OverlayItem, str] = {
+    OverlayItem.NONE: "empty",
+    OverlayItem.FIRE_FLOWER: "fire_flower",
+    OverlayItem.LEAF: "leaf",
+    OverlayItem.CONTINUOUS_STAR: "star_continuous",
+    OverlayItem.STAR: "star",
+    OverlayItem.MULTI_COIN: "coins_multiple",
+    OverlayItem.COIN: "coin",
+    OverlayItem.ONE_UP: "extra_life",
+    OverlayItem.VINE: "vine",
+    OverlayItem.P_SWITCH: "p_switch",
+}
+INVISIBLE_ITEM_IMAGES: dict[OverlayItem, str] = {
+    OverlayItem.COIN: "coin_invisible",
+    OverlayItem.ONE_UP: "coin_extra_life",
+}
+
+
+@lru_cache(2**8)
+def _overlay_image(name: str, block_length: int) -> QImage:
+    """
+    Provides an image of the level images scaled to a block, which is cached for each zoom level.
+    """
+    return level_images[name].image().scaled(block_length, block_length)
 
-ITEM_ARROW = lambda: level_images["item_arrow"].image()  # noqa: E731
 
-EMPTY_IMAGE = lambda: level_images["empty"].image()  # noqa: E731
+@lru_cache(2**8)
+def _selected_overlay_image(name: str, block_length: int) -> QImage:
+    return _make_image_selected(_overlay_image(name, block_length))
 
 
 SPECIAL_BACKGROUND_OBJECTS = [
@@ -117,8 +172,7 @@ def _block_from_index(block_index: int, scale_factor: int, level: Level, transpa
 
     palette_group: PaletteGroup = PaletteGroup.from_tileset(level.tileset_number, level.header.object_palette_index)
     graphics_set: GraphicsSet = GraphicsSet.from_tileset(level.header.graphic_set_index)
-    tsa_data: bytearray = ROM().get_tsa_data(level.tileset_number)
-    block: Block = Block.from_tsa(Point(0, 0), block_index, tsa_data)
+    block: Block = Block.tsa_table(level.tileset_number)[block_index]
 
     if transparent:
         image: QImage = block_to_image(block, palette_group, graphics_set, scale_factor).copy()
@@ -286,10 +340,11 @@ class LevelDrawer:
         painter.save()
 
         for level_object in level.get_all_objects():
-            point = level_object.get_rect(self.block_length).upper_left_point
             rect = level_object.get_rect(self.block_length)
+            point = rect.upper_left_point
+            definition = level_object.definition
 
-            for overlay in level_object.definition.get_overlays():
+            for overlay in definition.overlays:
                 drawable = overlay.drawable
                 painter.drawImage(
                     drawable.point_offset.x + point.x * self.block_length,
@@ -297,130 +352,89 @@ class LevelDrawer:
                     drawable.image(self.block_length),
                 )
 
-            name = level_object.name.lower()
-
-            # only handle this specific enemy item for now
-            if isinstance(level_object, EnemyObject) and "invisible door" not in name:
+            overlay_type = definition.overlay_type
+            if overlay_type == OverlayType.NONE:
                 continue
 
             # invisible coins, for example, expand and need to have multiple overlays drawn onto them
             # set true by default, since for most overlays it doesn't matter
             fill_object = True
 
-            # pipe entries
-            if "pipe" in name and "can go" in name:
+            if overlay_type in PIPE_IMAGES:
                 if not self.user_settings.draw_jump_on_objects:
                     continue
 
                 fill_object = False
 
+                image = PIPE_IMAGES[overlay_type]
                 point: Point = rect.mid_point
                 trigger_position: Point = level_object.point
 
-                if "left" in name:
-                    image = LEFT_ARROW()
+                if overlay_type == OverlayType.PIPE_LEFT:
                     point = point.evolve(x=rect.right, y=point.y - self.block_length // 2)
 
                     # leftward pipes trigger on the column to the left of the opening
                     trigger_position = level_object.rect.lower_right_point - Point(1, 0)
-                elif "right" in name:
-                    image = RIGHT_ARROW()
+                elif overlay_type == OverlayType.PIPE_RIGHT:
                     point = point.evolve(x=rect.left - self.block_length, y=point.y - self.block_length // 2)
-                elif "down" in name:
-                    image = DOWN_ARROW()
+                elif overlay_type == OverlayType.PIPE_DOWN:
                     point = point.evolve(x=point.x - self.block_length // 2, y=rect.top - self.block_length)
                 else:
-                    # upwards pipe
-                    image = UP_ARROW()
                     point = point.evolve(x=point.x - self.block_length // 2, y=rect.bottom)
 
                     # upwards pipes trigger on the second to last row
                     trigger_position = level_object.rect.lower_left_point - Point(0, 1)
 
                 if not self._object_in_jump_area(level, trigger_position):
-                    image = NO_JUMP()
+                    image = "no_jump"
 
-            elif "door" == name or "door (can go" in name or "invisible door" in name or "red invisible note" in name:
+            elif overlay_type == OverlayType.DOOR or overlay_type == OverlayType.NOTE:
                 fill_object = False
 
-                if "note" in name:
-                    image = UP_ARROW()
-                else:
-                    # door
-                    image = DOWN_ARROW()
-
+                image = "up_arrow" if overlay_type == OverlayType.NOTE else "down_arrow"
                 point = point.evolve(y=rect.top - self.block_length)
 
                 # jumps seemingly trigger on the bottom block
                 if not self._object_in_jump_area(level, level_object.point + Point(0, 1)):
-                    image = NO_JUMP()
+                    image = "no_jump"
 
             # "?" - blocks, note blocks, wooden blocks and bricks
-            elif "'?' with" in name or "brick with" in name or "bricks with" in name or "block with" in name:
+            elif overlay_type == OverlayType.ITEM_BLOCK:
                 if not self.user_settings.draw_items_in_blocks:
                     continue
 
                 point = point.evolve(y=point.y - (2 * self.block_length))
-
-                if "flower" in name:
-                    image = FIRE_FLOWER()
-                elif "leaf" in name:
-                    image = LEAF()
-                elif "continuous star" in name:
-                    image = CONTINUOUS_STAR()
-                elif "star" in name:
-                    image = NORMAL_STAR()
-                elif "multi-coin" in name:
-                    image = MULTI_COIN()
-                elif "coin" in name:
-                    image = COIN()
-                elif "1-up" in name:
-                    image = ONE_UP()
-                elif "vine" in name:
-                    image = VINE()
-                elif "p-switch" in name:
-                    image = P_SWITCH()
-                else:
-                    image = EMPTY_IMAGE()
+                image = ITEM_BLOCK_IMAGES[definition.overlay_item]
 
                 # draw little arrow for the offset item overlay
                 arrow_pos = point.to_qt()
                 arrow_pos.setY(arrow_pos.y() + self.block_length / 4)
-                painter.drawImage(arrow_pos, ITEM_ARROW().scaled(self.block_length, self.block_length))
+                painter.drawImage(arrow_pos, _overlay_image("item_arrow", self.block_length))
 
-            elif "invisible" in name:
+            elif overlay_type == OverlayType.INVISIBLE_ITEM:
                 if not self.user_settings.draw_invisible_items:
                     continue
 
-                if "coin" in name:
-                    image = INVISIBLE_COIN()
-                elif "1-up" in name:
-                    image = INVISIBLE_1_UP()
-                else:
-                    image = EMPTY_IMAGE()
+                image = INVISIBLE_ITEM_IMAGES.get(definition.overlay_item, "empty")
 
-            elif "silver coins" in name:
+            else:
                 if not self.user_settings.draw_invisible_items:
                     continue
 
-                image = SILVER_COIN()
-            else:
-                continue
+                image = "coin_silver"
 
             if fill_object:
                 for x in range(level_object.rendered_size.width):
                     adapted_pos = point.to_qt()
                     adapted_pos.setX(point.x + x * self.block_length)
 
-                    image = image.scaled(self.block_length, self.block_length)
-                    painter.drawImage(adapted_pos, image)
+                    painter.drawImage(adapted_pos, _overlay_image(image, self.block_length))
 
                     if level_object.selected:
-                        painter.drawImage(adapted_pos, _make_image_selected(image))
+                        painter.drawImage(adapted_pos, _selected_overlay_image(image, self.block_length))
 
             else:
-                image = image.scaled(self.block_length, self.block_length)
-                painter.drawImage(point.to_qt(), image)
+                painter.drawImage(point.to_qt(), _overlay_image(image, self.block_length))
 
         painter.restore()
 
@@ -1,8 +1,7 @@
-from bisect import bisect_right
 from warnings import warn
 
 from attr import evolve
-from PySide6.QtCore import QMimeData, QSize, Signal, SignalInstance
+from PySide6.QtCore import QMimeData, QSize, QTimer, Signal, SignalInstance
 from PySide6.QtGui import (
     QDragEnterEvent,
     QDragMoveEvent,
@@ -33,6 +32,7 @@ from foundry.game.gfx.objects.util import (
 )
 from foundry.game.level.Level import Level
 from foundry.game.level.LevelRef import LevelRef
+from foundry.game.level.util import LevelCatalog, get_level_catalog
 from foundry.game.level.WorldMap import WorldMap
 from foundry.gui.ContextMenu import ContextMenu
 from foundry.gui.LevelDrawer import LevelDrawer
@@ -51,11 +51,14 @@ MODE_RESIZE_VERT = 4
 MODE_RESIZE_DIAG = MODE_RESIZE_HORIZ | MODE_RESIZE_VERT
 RESIZE_MODES = [MODE_RESIZE_HORIZ, MODE_RESIZE_VERT, MODE_RESIZE_DIAG]
 
+# scrolling through object types is merged into one undo entry, until the wheel is idle for this long
+WHEEL_GESTURE_TIMEOUT = 500  # milliseconds
+
 
 def undoable(func):
     def wrapped(self, *args):
-        func(self, *args)
-        self.level_ref.save_level_state()
+        with self.level_ref.batch():
+            func(self, *args)
 
     return wrapped
 
@@ -88,6 +91,7 @@ class LevelView(QWidget):
 
         self.file_settings = file_settings
         self.user_settings = user_settings
+        self._level_catalog: LevelCatalog | None = None
 
         self.level_ref: LevelRef = level
         self.level_ref.data_changed.connect(self.update)
@@ -119,6 +123,14 @@ class LevelView(QWidget):
         # dragged in from the object toolbar
         self.currently_dragged_object: LevelObject | EnemyObject | None = None
 
+        self._mouse_gesture_active = False
+
+        self._wheel_gesture_timer = QTimer(self)
+        self._wheel_gesture_timer.setSingleShot(True)
+        self._wheel_gesture_timer.setInterval(WHEEL_GESTURE_TIMEOUT)
+        self._wheel_gesture_timer.timeout.connect(self.level_ref.end_gesture)
+        self.level_ref.gestures_interrupted.connect(self._forget_gestures)
+
         self.setWhatsThis(
             "<b>PydanticLevel View</b><br/>"
             "This renders the level as it would appear in game plus additional information, that can be "
@@ -237,6 +249,10 @@ class LevelView(QWidget):
             if obj_under_cursor not in self.level_ref.selected_objects:
                 return False
 
+            if not self._wheel_gesture_timer.isActive():
+                self.level_ref.begin_gesture()
+            self._wheel_gesture_timer.start()
+
             self._change_object_on_mouse_wheel(wheel_event.local_point, wheel_event.delta)
 
         return self.user_settings.object_scroll_enabled
@@ -247,12 +263,18 @@ class LevelView(QWidget):
 
         if obj is None:
             return
+
+        previous_size = len(obj.to_bytes())
+
         if y_delta > 0:
             increment_type(obj)
         else:
             decrement_type(obj)
         obj.selected = True
 
+        if isinstance(obj, LevelObject):
+            self.level_ref.level.object_size_changed(obj, previous_size)
+
     def sizeHint(self) -> QSize:
         if not self.level_ref:
             return super().sizeHint()
@@ -285,13 +307,34 @@ class LevelView(QWidget):
         if obj is not None:
             self.resize_obj_start_point = obj.point
 
+    def _start_mouse_gesture(self):
+        if not self._mouse_gesture_active:
+            self._mouse_gesture_active = True
+            self.level_ref.begin_gesture()
+
+    def _stop_mouse_gesture(self):
+        if self._mouse_gesture_active:
+            self._mouse_gesture_active = False
+            self.level_ref.end_gesture()
+
+    def _forget_gestures(self):
+        # the level ref ended the gestures itself, e.g. to undo while scrolling
+        self._mouse_gesture_active = False
+        self._wheel_gesture_timer.stop()
+
     def _resizing(self, event: MouseEvent) -> None:
         self.resizing_happened = True
+        self._start_mouse_gesture()
 
         if isinstance(self.level_ref.level, WorldMap):
             return
 
         point: Point = self._to_level_point(event.local_point)
+
+        if point == self.last_mouse_position:
+            # the mouse moved inside the same block, so the objects keep their size
+            return
+
         point_difference: Point = Point(0, 0)
 
         if self.mouse_mode & MODE_RESIZE_HORIZ:
@@ -326,6 +369,7 @@ class LevelView(QWidget):
         self.resizing_happened = False
         self.mouse_mode = MODE_FREE
         self.setCursor(Qt.CursorShape.ArrowCursor)
+        self._stop_mouse_gesture()
 
     def _stop_resize(self):
         self.level_ref.save_level_state()
@@ -367,15 +411,19 @@ class LevelView(QWidget):
 
     def _dragging(self, event: MouseEvent):
         self.dragging_happened = True
+        self._start_mouse_gesture()
 
         point: Point = self._to_level_point(event.local_point)
         point_difference: Point = point - self.last_mouse_position
 
         self.last_mouse_position = point
 
-        for obj in self.get_selected_objects():
-            obj.move_by(point_difference)
+        if point_difference == Point(0, 0):
+            # the mouse moved inside the same block, so nothing needs to be moved or drawn again
+            return
 
+        if selected_objects := self.get_selected_objects():
+            self.level_ref.level.move_objects(selected_objects, point_difference)
             self.level_ref.level.changed = True
 
         self.update()
@@ -396,6 +444,7 @@ class LevelView(QWidget):
 
         self.mouse_mode = MODE_FREE
         self.setCursor(Qt.CursorShape.ArrowCursor)
+        self._stop_mouse_gesture()
 
     def _stop_drag(self):
         if self.dragging_happened:
@@ -488,8 +537,7 @@ class LevelView(QWidget):
         return self.level_ref.selected_objects
 
     def remove_selected_objects(self):
-        for obj in self.level_ref.selected_objects:
-            self.level_ref.level.remove_object(obj)
+        self.level_ref.level.remove_objects(self.level_ref.selected_objects)
 
     def scroll_to_objects(self, objects: list[LevelObject]):
         if not objects:
@@ -534,19 +582,23 @@ class LevelView(QWidget):
 
         return is_safe, reason, additional_info
 
+    @property
+    def level_catalog(self) -> LevelCatalog:
+        """The catalog of the levels of the file, which is only remade once the levels are changed."""
+        if self._level_catalog is None or not self._level_catalog.is_catalog_of(self.file_settings.levels):
+            self._level_catalog = LevelCatalog(self.file_settings.levels)
+
+        return self._level_catalog
+
     def _cuts_into_other_enemies(self) -> str:
         if self.level_ref is None:
             raise ValueError("PydanticLevel is None")
 
         enemies_end = self.level_ref.level.enemies_end
 
-        levels_by_enemy_offset = sorted(self.file_settings.levels, key=lambda level: level.enemy_pointer)
+        found_level = self.level_catalog.level_before_enemy_address(enemies_end)
 
-        level_index = bisect_right([level.enemy_pointer for level in levels_by_enemy_offset], enemies_end) - 1
-
-        found_level = levels_by_enemy_offset[level_index]
-
-        if found_level.enemy_pointer == self.level_ref.level.enemy_offset:
+        if found_level is None or found_level.enemy_pointer == self.level_ref.level.enemy_offset:
             return ""
         else:
             return (
@@ -559,16 +611,9 @@ class LevelView(QWidget):
 
         end_of_level_objects = self.level_ref.level.objects_end
 
-        level_index = (
-            bisect_right(
-                [level.generator_pointer - Level.HEADER_LENGTH for level in Level.sorted_offsets], end_of_level_objects
-            )
-            - 1
-        )
-
-        found_level = Level.sorted_offsets[level_index]
+        found_level = get_level_catalog().level_before_generator_address(end_of_level_objects + Level.HEADER_LENGTH)
 
-        if found_level.generator_pointer == self.level_ref.level.object_offset:
+        if found_level is None or found_level.generator_pointer == self.level_ref.level.object_offset:
             return ""
         else:
             return (
@@ -630,7 +675,7 @@ class LevelView(QWidget):
         self.level_ref.level.remove_object(obj)
 
     def remove_jump(self, index: int):
-        del self.level_ref.level.jumps[index]
+        self.level_ref.level.remove_jump(self.level_ref.level.jumps[index])
 
         self.update()
 
@@ -642,15 +687,16 @@ class LevelView(QWidget):
 
         pasted_objects = []
 
-        for obj in objects:
-            offset_point = obj.point - origin
+        with self.level_ref.batch() as level:
+            for obj in objects:
+                offset_point = obj.point - origin
 
-            try:
-                pasted_objects.append(self.level_ref.level.paste_object_at(point + offset_point, obj))
-            except ValueError:
-                warn("Tried pasting outside of level.", RuntimeWarning)
+                try:
+                    pasted_objects.append(level.paste_object_at(point + offset_point, obj))
+                except ValueError:
+                    warn("Tried pasting outside of level.", RuntimeWarning)
 
-        self.select_objects(pasted_objects)
+            self.select_objects(pasted_objects)
 
     def get_object_names(self):
         return self.level_ref.level.get_object_names()
@@ -35,8 +35,6 @@ from foundry.game.level.LevelManager import LevelManager
 from foundry.gui.AboutWindow import AboutDialog
 from foundry.gui.ContextMenu import CMAction
 from foundry.gui.LevelSelector import LevelSelector
-from foundry.gui.orb import Orb
-from foundry.gui.player_lives import PlayerLives
 from foundry.gui.settings import GUILoader, UserSettings, load_gui_loader, save_settings
 from foundry.gui.SettingsDialog import POWERUPS, SettingsDialog
 from foundry.gui.util import setup_window
@@ -701,10 +699,14 @@ class MainWindow(QMainWindow):
 
     def on_player_lives(self, _):
         """Shows the Player Lives UI"""
+        from foundry.gui.player_lives import PlayerLives
+
         PlayerLives(self)
 
     def on_orb_options(self, _):
         """Shows the Orb Options UI"""
+        from foundry.gui.orb import Orb
+
         Orb(self)
 
     def on_palette_viewer(self, _):
@@ -11,7 +11,6 @@ from PySide6.QtWidgets import (
 )
 
 from foundry.core.drawable import BLOCK_SIZE, MASK_COLOR, Block, block_to_image
-from foundry.core.geometry import Point
 from foundry.core.graphics_set.util import GRAPHIC_SET_NAMES
 from foundry.game.File import ROM
 from foundry.game.gfx.objects.Jump import Jump
@@ -219,7 +218,7 @@ class BlockArray(QWidget):
         for block_index in self.level_object.blocks:
             normalized_index: int = block_index if block_index <= 0xFF else ROM().get_byte(block_index)
             image = block_to_image(
-                Block.from_tsa(Point(0, 0), normalized_index, self.level_object.tsa_data),
+                Block.tsa_table(self.level_object.tileset.number)[normalized_index],
                 self.level_object.palette_group,
                 self.level_object.graphics_set,
                 BLOCK_SIZE.width,
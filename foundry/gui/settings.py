@@ -5,7 +5,6 @@ from pathlib import Path
 
 from attr import attrs, field
 from pydantic import BaseModel, ValidationError
-from qt_material import build_stylesheet
 
 from foundry import default_settings_path, default_styles_path, file_settings_path
 from foundry.game.level.util import (
@@ -18,6 +17,8 @@ from foundry.game.level.util import (
 
 def set_style(theme):
     def wrapped(app):
+        from qt_material import build_stylesheet
+
         app.setStyleSheet(build_stylesheet(theme))
 
     return wrapped
@@ -125,6 +126,8 @@ class UserSettings:
         Enables the editing of generators through the use of the scroll wheel.
     object_tooltip_enabled: bool
         Enables tooltips for generators.
+    undo_memory_budget: int
+        The amount of bytes the undo history of a level may take up, before the oldest edits are forgotten.
     """
 
     gui_style: GUIStyle = GUIStyle.LIGHT_BLUE
@@ -145,6 +148,7 @@ class UserSettings:
     block_transparency: bool = True
     object_scroll_enabled: bool = False
     object_tooltip_enabled: bool = True
+    undo_memory_budget: int = 4 * 1024 * 1024
 
 
 class PydanticFileSettings(BaseModel):
@@ -170,6 +174,7 @@ class PydanticUserSettings(BaseModel):
     block_transparency: bool = True
     object_scroll_enabled: bool = False
     object_tooltip_enabled: bool = True
+    undo_memory_budget: int = 4 * 1024 * 1024
 
     def to_user_settings(self) -> UserSettings:
         """
@@ -199,6 +204,7 @@ class PydanticUserSettings(BaseModel):
             block_transparency=self.block_transparency,
             object_scroll_enabled=self.object_scroll_enabled,
             object_tooltip_enabled=self.object_tooltip_enabled,
+            undo_memory_budget=self.undo_memory_budget,
         )
 
     class Config:
@@ -226,6 +232,7 @@ def user_setting_to_json(user_setting: UserSettings, path: str):
         block_transparency=user_setting.block_transparency,
         object_scroll_enabled=user_setting.object_scroll_enabled,
         object_tooltip_enabled=user_setting.object_tooltip_enabled,
+        undo_memory_budget=user_setting.undo_memory_budget,
     )
 
     with open(path, "w") as settings_file:
@@ -4,12 +4,10 @@ import os
 import sys
 import traceback
 from argparse import ArgumentParser, BooleanOptionalAction
-
-from PySide6.QtWidgets import QApplication, QMessageBox
+from contextlib import AbstractContextManager, nullcontext
 
 from foundry import auto_save_rom_path, github_issue_link
-from foundry.gui.AutoSaveDialog import AutoSaveDialog
-from foundry.gui.settings import load_gui_loader, load_settings, save_settings
+from foundry.core.profiler import StartupProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +16,6 @@ if hasattr(sys, "_MEIPASS"):
     logger.info(f"Changing current dir to {getattr(sys, '_MEIPASS')}")
     os.chdir(getattr(sys, "_MEIPASS"))
 
-from foundry.gui.MainWindow import MainWindow  # noqa: E402
-
 
 def start():
     parser = ArgumentParser(description="The future of editing SMB3!")
@@ -29,6 +25,12 @@ def start():
     )
     parser.add_argument("--level", type=int, help="PydanticLevel index", default=None)
     parser.add_argument("--world", type=int, help="World Index", default=None)
+    parser.add_argument(
+        "--profile-startup",
+        default=False,
+        action="store_true",
+        help="Print how long each import and step takes until the first window is shown",
+    )
 
     args = parser.parse_args()
     path: str = args.path
@@ -36,16 +38,33 @@ def start():
         dev_path = os.getenv("SMB3_TEST_ROM")
         if dev_path is not None:
             path = dev_path
-    main(path, args.world, args.level)
 
+    profiler = None
+    if args.profile_startup:
+        profiler = StartupProfiler()
+        profiler.install()
+    main(path, args.world, args.level, profiler=profiler)
+
+
+def main(path_to_rom: str = "", world=None, level=None, profiler: StartupProfiler | None = None):
+    def phase(name: str) -> AbstractContextManager:
+        return nullcontext() if profiler is None else profiler.phase(name)
+
+    with phase("import Qt"):
+        from PySide6.QtWidgets import QApplication, QMessageBox
 
-def main(path_to_rom: str = "", world=None, level=None):
-    user_settings = load_settings()
-    gui_loader = load_gui_loader()
+    with phase("load settings"):
+        from foundry.gui.settings import load_gui_loader, load_settings, save_settings
 
-    app = QApplication()
+        user_settings = load_settings()
+        gui_loader = load_gui_loader()
+
+    with phase("create application"):
+        app = QApplication()
 
     if auto_save_rom_path.exists():
+        from foundry.gui.AutoSaveDialog import AutoSaveDialog
+
         result = AutoSaveDialog().exec()
 
         if result == QMessageBox.ButtonRole.AcceptRole:
@@ -55,7 +74,18 @@ def main(path_to_rom: str = "", world=None, level=None):
                 None, "Auto Save recovered", "Don't forget to save the loaded ROM under a new name!"
             )
 
-    window = MainWindow(path_to_rom, world, level, user_settings=user_settings, gui_loader=gui_loader)
+    with phase("import main window"):
+        from foundry.gui.MainWindow import MainWindow
+
+    with phase("create main window"):
+        window = MainWindow(path_to_rom, world, level, user_settings=user_settings, gui_loader=gui_loader)
+
+    if profiler is not None:
+        with phase("show main window"):
+            app.processEvents()
+        profiler.finish()
+        print(profiler.report(), file=sys.stderr)
+
     if window.loaded:
         del window.loaded
         app.exec()
@@ -71,6 +101,8 @@ if __name__ == "__main__":
     try:
         main(path)
     except Exception as e:
+        from PySide6.QtWidgets import QMessageBox
+
         box = QMessageBox()
         box.setWindowTitle("Crash report")
         box.setText(
@@ -1,3 +1,5 @@
+from json import dumps
+
 from pytest import raises
 
 from foundry.core.namespace import (
@@ -5,6 +7,7 @@ from foundry.core.namespace import (
     CircularImportException,
     Namespace,
     Path,
+    generate_cached_namespace,
     generate_namespace,
     get_namespace_dict_from_path,
     primitive_manager,
@@ -436,3 +439,87 @@ def test_generate_namespace_generate_drawable():
         },
         Drawable.type_manager,
     )
+
+
+NAMESPACE_WITH_DEPENDENCIES = {
+    "type": "INTEGER",
+    "elements": {"a": 1},
+    "children": {
+        "foo": {"type": "INTEGER", "elements": {"b": 2}},
+        "bar": {"type": "INTEGER", "dependencies": ["foo"], "elements": {"c": 3}},
+    },
+}
+
+
+def test_generate_cached_namespace_matches_generated_namespace(tmp_path):
+    source = tmp_path / "namespace.json"
+    source.write_text(dumps(NAMESPACE_WITH_DEPENDENCIES))
+    cache_path = tmp_path / "namespace.bin"
+
+    namespace = generate_cached_namespace(source, cache_path, primitive_manager)
+    cached_namespace = generate_cached_namespace(source, cache_path, primitive_manager)
+
+    assert cache_path.exists()
+    assert generate_namespace(NAMESPACE_WITH_DEPENDENCIES, primitive_manager) == namespace == cached_namespace
+    assert cached_namespace.children["bar"]["b"] == 2
+
+
+def test_generate_cached_namespace_is_rebuilt_when_source_changes(tmp_path):
+    source = tmp_path / "namespace.json"
+    source.write_text(dumps({"type": "INTEGER", "elements": {"a": 1}}))
+    cache_path = tmp_path / "namespace.bin"
+    generate_cached_namespace(source, cache_path, primitive_manager)
+
+    source.write_text(dumps({"type": "INTEGER", "elements": {"a": 2}}))
+
+    assert generate_cached_namespace(source, cache_path, primitive_manager)["a"] == 2
+
+
+RECT_NAMESPACE = {
+    "type": "rect",
+    "elements": {
+        "a": {"point": {"x": 1, "y": 2}, "size": {"width": 3, "height": 4}},
+        "b": {"type": "DEFAULT", "point": {"x": 5, "y": 6}, "size": {"width": 7, "height": 8}},
+    },
+}
+
+
+def test_generate_namespace_compiled_validators_matches_generated_namespace():
+    from foundry.core.geometry import Rect
+
+    assert generate_namespace(RECT_NAMESPACE, Rect.type_manager, compile_validators=True) == generate_namespace(
+        RECT_NAMESPACE, Rect.type_manager
+    )
+
+
+def test_generate_namespace_compiled_validators_raises_same_error():
+    from foundry.core.geometry import Rect
+
+    invalid_namespace = {"type": "rect", "elements": {"a": {"point": {"x": 1}, "size": {"width": 3, "height": 4}}}}
+
+    with raises(ValueError) as generic_error:
+        generate_namespace(invalid_namespace, Rect.type_manager)
+    with raises(ValueError) as compiled_error:
+        generate_namespace(invalid_namespace, Rect.type_manager, compile_validators=True)
+
+    assert type(generic_error.value).__name__ == type(compiled_error.value).__name__
+    assert str(generic_error.value) == str(compiled_error.value)
+
+
+def test_namespace_public_elements_sees_changes_to_dependencies():
+    dependency = Namespace(elements={"a": 1})
+    namespace = Namespace(dependencies={"foo": dependency}, elements={"b": 2})
+
+    assert namespace.public_elements is namespace.public_elements
+    dependency.elements["c"] = 3  # type: ignore
+    assert namespace["c"] == 3
+
+
+def test_namespace_from_path_is_cached_by_root():
+    namespace = Namespace(children={"foo": Namespace(children={"bar": Namespace()})})
+    child = namespace.children["foo"].children["bar"]
+
+    assert child.root is namespace
+    assert child.from_path(Path(("foo", "bar"))) is child
+    assert namespace.from_path(Path(("foo", "bar"))) is child
+    assert not child.namespace_exists_at_path(Path(("foo", "foo")))
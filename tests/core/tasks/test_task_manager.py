@@ -1,15 +1,43 @@
-from pytest import fixture
+from asyncio import Event, gather, get_running_loop, run, sleep
+from functools import partial
+from multiprocessing import Pipe
+from os import getpid, kill
+from pathlib import Path
+from signal import SIGKILL
+from threading import Event as ThreadEvent
+from time import sleep as sleep_for
+from time import time
+
+from pytest import fixture, raises
 
 from foundry.core.gui import Signal, SignalInstance, SignalTester
+from foundry.core.serialization import PickledCallable
+from foundry.core.shared_buffers import SHARED_MEMORY_THRESHOLD, _sent_blocks
 from foundry.core.tasks import (
+    MAXIMUM_WORKER_TASKS,
+    TASK_COST_SMOOTHING,
+    AssignedTask,
+    KeepAlivePolicy,
+    Priority,
+    RequestPipe,
     Requests,
     Status,
+    Task,
     TaskCallback,
+    TaskCancellation,
+    TaskManager,
     TaskManagerProxy,
+    TaskWorker,
+    TaskWorkerProxy,
+    WorkerDiedException,
+    WorkerTask,
+    dill_connection,
     exit_after,
+    is_task_cancelled,
     start_task_manager,
     synchronize,
     task,
+    wait_for_connections,
     wait_until,
 )
 
@@ -43,6 +71,420 @@ def test_exit_after_failure():
     exit_after(forever, 0.0001)(0)
 
 
+def test_wait_for_connections_timeout():
+    receiver, _ = dill_connection(*Pipe(duplex=False))
+
+    start = time()
+    assert not run(wait_for_connections([receiver], 0.05))
+    assert time() - start >= 0.05
+
+
+def test_wait_for_connections_readable():
+    receiver, sender = dill_connection(*Pipe(duplex=False))
+
+    async def send():
+        await sleep(0.01)
+        sender.send(1)
+
+    async def wait():
+        return await gather(wait_for_connections([receiver], 10), wait_for_connections([receiver], 10), send())
+
+    assert run(wait())[:2] == [True, True]
+    assert receiver.recv() == 1
+
+
+def test_wait_for_connections_wakeup():
+    receiver, _ = dill_connection(*Pipe(duplex=False))
+
+    async def wait():
+        wakeup = Event()
+
+        async def wake():
+            await sleep(0.01)
+            wakeup.set()
+
+        return await gather(wait_for_connections([receiver], 10, wakeup), wake())
+
+    assert run(wait())[0]
+
+
+def costly() -> int:
+    return 1
+
+
+def cheap() -> int:
+    return 0
+
+
+class Scheduler(TaskManager):
+    def __init__(self, workers: int, policy: KeepAlivePolicy):
+        # Each worker sends its tasks to itself, so the tasks sent can be inspected without any processes.
+        self.name = "scheduler"
+        self.initialize_state(policy)
+        for _ in range(workers):
+            synchronize(self.add_worker)()
+
+    async def add_worker(self) -> TaskWorkerProxy:
+        receiver, sender = dill_connection(*Pipe(duplex=False))
+        worker = TaskWorkerProxy(None, sender, receiver, RequestPipe.generate().requester, f"{self.started_workers}")
+        self.started_workers += 1
+        self.workers.append(worker)
+        return worker
+
+
+def scheduler(workers: int, policy: KeepAlivePolicy | None = None) -> TaskManager:
+    return Scheduler(workers, policy or KeepAlivePolicy(minimum_workers=workers, maximum_workers=workers))
+
+
+def test_scheduler_least_loaded():
+    manager = scheduler(2)
+    manager.record_cost(Task(costly, 0), 1)
+    manager.record_cost(Task(cheap, 0), 0.01)
+
+    synchronize(manager.send_task_to_worker)(Task(costly, 1))
+    for identity in range(2, MAXIMUM_WORKER_TASKS + 3):
+        synchronize(manager.send_task_to_worker)(Task(cheap, identity))
+
+    first, second = manager.workers
+    assert list(first.active_tasks) == [1]
+    assert list(second.active_tasks) == list(range(2, MAXIMUM_WORKER_TASKS + 2))
+    assert [task.identity for task in second.queued_tasks] == [MAXIMUM_WORKER_TASKS + 2]
+    assert first.incoming_pipe.recv().identity == 1
+
+
+def test_scheduler_steals_queued_tasks():
+    manager = scheduler(2)
+    first, second = manager.workers
+    first.queued_tasks.extend(
+        AssignedTask(WorkerTask(Task(cheap, identity)), 0.01) for identity in range(MAXIMUM_WORKER_TASKS + 1)
+    )
+
+    synchronize(manager.feed_worker)(second)
+
+    assert list(second.active_tasks) == list(range(MAXIMUM_WORKER_TASKS, 0, -1))
+    remaining_task = first.queued_tasks[0]
+    assert remaining_task.identity == 0
+    assert manager.take_task(second) is remaining_task
+    assert manager.take_task(second) is None
+
+
+def test_scheduler_estimated_cost():
+    manager = scheduler(1)
+    assert manager.estimate_cost(Task(costly, 0)) == manager.estimate_cost(Task(cheap, 0))
+    manager.record_cost(Task(costly, 0), 1)
+    manager.record_cost(Task(costly, 0), 0)
+    assert manager.estimate_cost(Task(costly, 0)) == 1 - TASK_COST_SMOOTHING
+
+
+def test_scheduler_starts_tasks_once_required_tasks_finish():
+    manager = scheduler(1)
+    worker = manager.workers[0]
+    for new_task in (Task(cheap, 1), Task(cheap, 2), Task(cheap, 3, [1, 2]), Task(cheap, 4, [1])):
+        if new_task.required_tasks:
+            synchronize(manager.queue_task)(new_task)
+        else:
+            synchronize(manager.send_task_to_worker)(new_task)
+    worker.active_tasks.clear()
+    assert manager.remaining_dependencies == {3: 2, 4: 1}
+    assert manager.consumers == {1: 2, 2: 1}
+
+    synchronize(manager.poll_queued_tasks)(1, "a")
+    assert list(worker.active_tasks) == [4]
+    assert manager.recent_returned_values == {1: "a"}
+    assert manager.consumers == {1: 1, 2: 1}
+
+    synchronize(manager.poll_queued_tasks)(2, "b")
+    assert list(worker.active_tasks) == [4, 3]
+    assert manager.recent_returned_values == {}
+    assert manager.consumers == manager.queued_tasks == manager.dependents == manager.remaining_dependencies == {}
+
+    tasks = [worker.incoming_pipe.recv() for _ in range(4)]
+    assert [(sent.identity, list(sent.arguments)) for sent in tasks] == [(1, []), (2, []), (4, ["a"]), (3, ["a", "b"])]
+
+
+def test_scheduler_discards_unrequired_return_values():
+    manager = scheduler(1)
+    synchronize(manager.poll_queued_tasks)(1, "a")
+    assert manager.recent_returned_values == manager.consumers == {}
+
+
+def test_scheduler_orders_tasks_by_priority():
+    manager = scheduler(1)
+    for identity in range(MAXIMUM_WORKER_TASKS):
+        synchronize(manager.send_task_to_worker)(Task(cheap, identity, priority=Priority.BATCH))
+    priorities = (Priority.BATCH, Priority.PREFETCH, Priority.INTERACTIVE, Priority.BATCH)
+    for identity, priority in zip(range(10, 14), priorities):
+        synchronize(manager.send_task_to_worker)(Task(cheap, identity, priority=priority))
+
+    worker = manager.workers[0]
+    assert [task.identity for task in worker.queued_tasks] == [12, 11, 10, 13]
+    assert worker.load_before(Priority.INTERACTIVE) < worker.load_before(Priority.BATCH)
+
+
+def test_scheduler_steals_most_urgent_task():
+    manager = scheduler(2)
+    first, second = manager.workers
+    first.queued_tasks.extend(
+        AssignedTask(WorkerTask(Task(cheap, identity, priority=priority)), 0.01)
+        for identity, priority in enumerate((Priority.INTERACTIVE, Priority.BATCH, Priority.BATCH))
+    )
+
+    assert manager.take_task(second).identity == 0
+    assert manager.take_task(second).identity == 2
+
+
+def test_scheduler_cancels_tasks():
+    manager = scheduler(1)
+    worker = manager.workers[0]
+    for identity in range(MAXIMUM_WORKER_TASKS + 1):
+        synchronize(manager.send_task_to_worker)(Task(cheap, identity, is_required=True))
+    synchronize(manager.queue_task)(Task(cheap, 10, [0, MAXIMUM_WORKER_TASKS]))
+    synchronize(manager.queue_task)(Task(cheap, 11, [10]))
+    synchronize(manager.queue_task)(Task(cheap, 12, [0]))
+
+    synchronize(manager.cancel_task)(MAXIMUM_WORKER_TASKS)
+    assert not worker.queued_tasks
+    assert list(manager.queued_tasks) == [12]
+    assert manager.consumers == {0: 1}
+
+    synchronize(manager.cancel_task)(0)
+    assert manager.queued_tasks == manager.remaining_dependencies == manager.consumers == {}
+    sent = [worker.incoming_pipe.recv() for _ in range(MAXIMUM_WORKER_TASKS + 1)]
+    assert sent[-1] == TaskCancellation(0)
+
+
+def test_scheduler_releases_shared_buffers_of_cancelled_tasks():
+    manager = scheduler(1)
+    for identity in range(MAXIMUM_WORKER_TASKS):
+        synchronize(manager.send_task_to_worker)(Task(cheap, identity))
+    function = PickledCallable.from_callable(partial(len, bytes(SHARED_MEMORY_THRESHOLD)))
+    block = _sent_blocks[-1]
+    synchronize(manager.send_task_to_worker)(Task(function, 10))
+
+    synchronize(manager.cancel_task)(10)
+    assert not manager.workers[0].queued_tasks
+    assert block.buf[0]
+
+
+def test_scheduler_supersedes_tasks():
+    manager = scheduler(1)
+    worker = manager.workers[0]
+    for identity in range(MAXIMUM_WORKER_TASKS):
+        synchronize(manager.send_task_to_worker)(Task(cheap, identity))
+    manager.incoming_pipe, sender = dill_connection(*Pipe(duplex=False))
+    for identity in range(10, 13):
+        sender.send(Task(cheap, identity, key="level"))
+        synchronize(manager.poll_tasks)()
+
+    assert [task.identity for task in worker.queued_tasks] == [12]
+    assert manager.keyed_tasks == {"level": 12}
+
+
+def test_keep_alive_policy_invalid():
+    with raises(ValueError):
+        KeepAlivePolicy(minimum_workers=2, maximum_workers=1)
+    with raises(ValueError):
+        KeepAlivePolicy(minimum_workers=0, maximum_workers=0)
+
+
+def test_scheduler_starts_workers_while_busy():
+    manager = scheduler(0, KeepAlivePolicy(minimum_workers=0, maximum_workers=2))
+
+    for identity in range(3):
+        synchronize(manager.send_task_to_worker)(Task(cheap, identity))
+
+    first, second = manager.workers
+    assert list(first.active_tasks) == [0, 2]
+    assert list(second.active_tasks) == [1]
+
+
+def test_scheduler_removes_idle_workers(monkeypatch):
+    async def terminate(self) -> None:
+        pass
+
+    monkeypatch.setattr(TaskWorkerProxy, "terminate", terminate)
+    manager = scheduler(3, KeepAlivePolicy(manager_duration=None, worker_duration=10, minimum_workers=1))
+    first, second, third = manager.workers
+    first.last_active = second.last_active = time() - 20
+    second.active_tasks[0] = AssignedTask(WorkerTask(Task(cheap, 0)), 0.01)
+
+    assert manager.next_deadline() == first.last_active + 10
+    synchronize(manager.check_time)()
+    assert manager.workers == [second, third]
+
+    second.active_tasks.clear()
+    synchronize(manager.check_time)()
+    assert manager.workers == [third]
+    assert manager.next_deadline() is None
+
+
+def test_scheduler_replaces_dead_workers(monkeypatch):
+    dead_workers = []
+
+    async def is_alive(self) -> bool:
+        return self not in dead_workers
+
+    monkeypatch.setattr(TaskWorkerProxy, "is_alive", is_alive)
+    manager = scheduler(1)
+    receiver, manager.outgoing_pipe = dill_connection(*Pipe(duplex=False))
+    for identity in range(MAXIMUM_WORKER_TASKS + 1):
+        synchronize(manager.send_task_to_worker)(Task(cheap, identity))
+
+    dead_workers.extend(manager.workers)
+    synchronize(manager.replace_dead_workers)()
+    worker = manager.workers[0]
+    assert worker not in dead_workers
+    assert list(worker.active_tasks) == list(range(MAXIMUM_WORKER_TASKS))
+    assert [task.identity for task in worker.queued_tasks] == [MAXIMUM_WORKER_TASKS]
+    assert manager.lost_tasks == set(range(MAXIMUM_WORKER_TASKS))
+
+    dead_workers.extend(manager.workers)
+    synchronize(manager.replace_dead_workers)()
+    assert list(manager.workers[0].active_tasks) == [MAXIMUM_WORKER_TASKS]
+    assert not manager.lost_tasks
+    failed = [receiver.recv() for _ in range(MAXIMUM_WORKER_TASKS)]
+    assert [finished.identity for finished in failed] == list(range(MAXIMUM_WORKER_TASKS))
+    assert all(isinstance(finished.exception, WorkerDiedException) for finished in failed)
+    assert not receiver.poll()
+
+
+_initialized: bool = False
+
+
+def initialize() -> None:
+    global _initialized
+    _initialized = True
+
+
+def is_initialized() -> bool:
+    return _initialized
+
+
+def test_worker_initializers():
+    policy = KeepAlivePolicy(minimum_workers=1, maximum_workers=1)
+    manager = start_task_manager(policy=policy, initializers=[initialize])
+    results = []
+    try:
+        manager.schedule_task(TaskCallback(is_initialized, results.append))
+        assert wait_until(manager.wait_for_tasks, 1, 10)(1)
+    finally:
+        manager.terminate()
+    assert results == [True]
+    assert not _initialized
+
+
+def test_worker_sends_results_to_main_process():
+    notice_receiver, notice_sender = dill_connection(*Pipe(duplex=False))
+    result_receiver, result_sender = dill_connection(*Pipe(duplex=False))
+    worker = TaskWorker("worker", notice_sender, notice_receiver, RequestPipe.generate().replier, result_sender)
+
+    async def execute():
+        worker.task_count = 2
+        await worker.execute_task(WorkerTask(Task(costly, 0)))
+        await worker.execute_task(WorkerTask(Task(costly, 1, is_required=True)))
+
+    run(execute())
+    assert [result_receiver.recv().result, result_receiver.recv().result] == [1, 1]
+    assert [notice_receiver.recv().result, notice_receiver.recv().result] == [None, 1]
+    worker.executor.shutdown()
+
+
+def test_worker_overlaps_tasks():
+    notice_receiver, notice_sender = dill_connection(*Pipe(duplex=False))
+    receiver, sender = dill_connection(*Pipe(duplex=False))
+    worker = TaskWorker("worker", notice_sender, notice_receiver, RequestPipe.generate().replier, sender)
+    released = ThreadEvent()
+
+    def wait() -> bool:
+        return released.wait(10)
+
+    def release() -> bool:
+        released.set()
+        return True
+
+    async def execute():
+        worker.task_count = 2
+        await gather(worker.execute_task(WorkerTask(Task(wait, 0))), worker.execute_task(WorkerTask(Task(release, 1))))
+
+    start = time()
+    run(execute())
+    assert time() - start < 10
+    assert {receiver.recv().result, receiver.recv().result} == {True}
+    assert worker.idle.is_set()
+    worker.executor.shutdown()
+
+
+def test_worker_cancels_tasks():
+    notice_receiver, notice_sender = dill_connection(*Pipe(duplex=False))
+    receiver, sender = dill_connection(*Pipe(duplex=False))
+    worker = TaskWorker("worker", notice_sender, notice_receiver, RequestPipe.generate().replier, sender, threads=1)
+    started = ThreadEvent()
+
+    def wait() -> bool:
+        started.set()
+        while not is_task_cancelled():
+            sleep_for(0.001)
+        return True
+
+    async def cancel():
+        await get_running_loop().run_in_executor(None, started.wait, 10)
+        worker.cancel_task(0)
+        worker.cancel_task(1)
+
+    async def execute():
+        worker.task_count = 2
+        await gather(
+            worker.execute_task(WorkerTask(Task(wait, 0))), worker.execute_task(WorkerTask(Task(cheap, 1))), cancel()
+        )
+
+    run(execute())
+    notices = [notice_receiver.recv(), notice_receiver.recv()]
+    assert {notice.identity for notice in notices} == {0, 1}
+    assert all(notice.is_cancelled for notice in notices)
+    assert not receiver.poll()
+    worker.executor.shutdown()
+
+
+def test_task_manager_supersedes_tasks():
+    manager = start_task_manager(policy=KeepAlivePolicy(minimum_workers=1, maximum_workers=1))
+    results = []
+    try:
+        for start_task in (costly, costly, cheap):
+            manager.schedule_task(TaskCallback(start_task, results.append, key="level"))
+        manager.schedule_task(TaskCallback(costly, results.append)).cancel()
+        start = time()
+        while not results and time() - start < 10:
+            manager.wait_for_tasks(0.1)
+        sleep_for(0.1)
+        manager.poll_tasks()
+    finally:
+        manager.terminate()
+    assert results == [0]
+
+
+def test_task_manager_replaces_killed_worker(tmp_path):
+    flag: Path = tmp_path / "exited"
+
+    def exit_once() -> int:
+        if not flag.exists():
+            flag.touch()
+            kill(getpid(), SIGKILL)
+        return 1
+
+    manager = start_task_manager(policy=KeepAlivePolicy(minimum_workers=1, maximum_workers=1))
+    results = []
+    try:
+        manager.schedule_task(TaskCallback(exit_once, results.append))
+        start = time()
+        while not results and time() - start < 10:
+            manager.wait_for_tasks(0.1)
+        assert len(manager.result_pipes) == 1  # The pipe of the killed worker is closed.
+    finally:
+        manager.terminate()
+    assert results == [1]
+    assert not manager.result_pipes
+
+
 def test_task_manager_kill():
     task_manager: TaskManagerProxy = start_task_manager()
     assert task_manager.is_alive()
@@ -148,6 +590,14 @@ class TestTaskManager:
         assert obj.return_times == 1
         assert obj.exception_times == 0
 
+    def test_wait_for_tasks(self):
+        obj = self.Obj()
+        manager: TaskManagerProxy = self.manager
+        manager.schedule_task(obj.callback(0))
+        assert wait_until(manager.wait_for_tasks, 1, 10)(1)
+        assert obj.value == 1
+        assert obj.return_times == 1
+
     def test_schedule_task_complex(self):
         obj1, obj2 = self.Obj(), self.Obj()
         tasks_completed = 0
@@ -2,10 +2,11 @@
 Credit to Python as I just copied most of their tests and changed them to use pytest.
 """
 from collections import OrderedDict, UserDict
+from pickle import dumps, loads
 
 from pytest import raises
 
-from foundry.core import ChainMap, ChainMapView
+from foundry.core import ChainMap, ChainMapView, VersionedDict
 
 
 class DefaultChainMap(ChainMap):
@@ -558,3 +559,103 @@ def test_chain_map_view_dict_coercion():
     d = ChainMapView(ChainMap(dict(a=1, b=2), dict(b=20, c=30)))
     assert dict(d) == dict(a=1, b=2, c=30)
     assert dict(d.items()) == dict(a=1, b=2, c=30)
+
+
+def test_chain_map_nested_lookup_is_flattened():
+    inner = ChainMap({"a": 1}, {"b": 2})
+    c = ChainMap({"c": 3}, ChainMap({"b": 20}, inner))
+    assert (c["a"], c["b"], c["c"]) == (1, 20, 3)
+    assert list(c) == ["b", "a", "c"]
+
+
+def test_chain_map_lookup_sees_changes_to_maps():
+    first, second = {"a": 1}, {"a": 10, "b": 20}
+    c = ChainMap(first, ChainMap(second))
+    assert c["b"] == 20
+    second["c"] = 30
+    assert c["c"] == 30
+    del first["a"]
+    assert c["a"] == 10
+    first["a"] = 100
+    assert c["a"] == 100
+    second["b"] = 200
+    assert c["b"] == 200
+    del second["c"]
+    with raises(KeyError):
+        c["c"]
+    assert len(c) == 2
+
+
+def test_chain_map_view_version_changes_with_chain_map():
+    d = {"a": 1}
+    view = ChainMapView(ChainMap(d), "a", "b")
+    c = ChainMap({}, view)
+    with raises(KeyError):
+        c["b"]
+    d["b"] = 2
+    assert c["b"] == 2
+
+
+def test_chain_map_lookup_sees_keys_being_replaced():
+    a = {"x": 1}
+    c = ChainMap(a, {"y": 2})
+    assert list(c) == ["y", "x"]
+    del a["x"]
+    a["z"] = 3
+    assert "x" not in c
+    assert "z" in c
+    assert c["z"] == 3
+    assert dict(c) == {"z": 3, "y": 2}
+
+
+def test_chain_map_lookup_sees_keys_being_replaced_in_versioned_dict():
+    a = VersionedDict(x=1)
+    c = ChainMap(a, {"y": 2})
+    assert list(c) == ["y", "x"]
+    del a["x"]
+    a["z"] = 3
+    assert "x" not in c
+    assert dict(c) == {"z": 3, "y": 2}
+    a.update(x=4)
+    a.pop("z")
+    assert dict(c) == {"x": 4, "y": 2}
+
+
+def test_chain_map_of_versioned_dicts_is_invalidated_by_changes():
+    first, second = VersionedDict(a=1), VersionedDict(b=2)
+    c = ChainMap(first, ChainMap(second))
+    assert dict(c) == {"a": 1, "b": 2}
+    second["a"] = 10
+    assert c["a"] == 1
+    del first["a"]
+    assert c["a"] == 10
+    second.pop("b")
+    assert "b" not in c
+    assert len(c) == 1
+
+
+def test_chain_map_of_plain_dicts_is_not_indexed():
+    c = ChainMap({"a": 1}, VersionedDict(b=2))
+    assert c._index is None
+    assert dict(c) == {"a": 1, "b": 2}
+    assert c._index is None
+
+
+def test_versioned_dict_is_pickled_without_observers():
+    d = VersionedDict(a=1)
+    c = ChainMap(d)
+    assert loads(dumps(d)) == {"a": 1}
+    assert c["a"] == 1
+
+
+def test_versioned_dict_counts_changes():
+    d = VersionedDict(a=1)
+    assert d.version == 0
+    d["b"] = 2
+    del d["a"]
+    d |= {"c": 3}
+    d.setdefault("d", 4)
+    d.popitem()
+    d.clear()
+    assert d.version == 6
+    assert d == {}
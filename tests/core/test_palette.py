@@ -0,0 +1,30 @@
+from hypothesis import given
+from hypothesis.strategies import integers, tuples
+
+from foundry.core.palette import Color, ColorPalette, Palette
+
+
+def test_color_palette_lut():
+    color_palette = ColorPalette.from_default()
+
+    assert color_palette.lut.shape == (len(color_palette.colors), 4)
+    for index, color in enumerate(color_palette.colors):
+        assert tuple(color_palette.lut[index]) == (color.red, color.green, color.blue, color.alpha)
+
+
+def test_color_palette_lut_is_not_compared():
+    color_palette = ColorPalette.from_default()
+    color_palette.lut
+    other = ColorPalette(color_palette.colors)
+
+    assert color_palette == other
+    assert hash(color_palette) == hash(other)
+
+
+@given(tuples(*(integers(min_value=0, max_value=0xFF) for _ in range(4))))
+def test_palette_lut(color_indexes: tuple[int, int, int, int]):
+    palette = Palette(color_indexes)
+
+    for index in range(len(color_indexes)):
+        color = palette[index, Color]
+        assert tuple(palette.lut[index]) == (color.red, color.green, color.blue, color.alpha)
@@ -0,0 +1,50 @@
+import builtins
+import sys
+
+from foundry.core.profiler import StartupProfiler
+
+
+def test_phase_nesting():
+    profiler = StartupProfiler()
+    with profiler.phase("outer"):
+        with profiler.phase("inner"):
+            pass
+    root = profiler.finish()
+
+    assert [child.name for child in root.children] == ["outer"]
+    assert [child.name for child in root.children[0].children] == ["inner"]
+    assert root.children[0].duration >= root.children[0].children[0].duration
+
+
+def test_records_new_imports(tmp_path, monkeypatch):
+    (tmp_path / "profiled_module.py").write_text("import profiled_dependency\n")
+    (tmp_path / "profiled_dependency.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    original_import = builtins.__import__
+    profiler = StartupProfiler()
+    profiler.install()
+    try:
+        import profiled_module  # noqa: F401
+    finally:
+        profiler.finish()
+        sys.modules.pop("profiled_module", None)
+        sys.modules.pop("profiled_dependency", None)
+
+    assert builtins.__import__ is original_import
+    assert not profiler.is_installed
+    assert [child.name for child in profiler.root.children] == ["profiled_module"]
+    assert [child.name for child in profiler.root.children[0].children] == ["profiled_dependency"]
+
+
+def test_report_hides_small_steps():
+    profiler = StartupProfiler()
+    with profiler.phase("fast"):
+        pass
+    profiler.finish()
+
+    report = profiler.report(threshold=0)
+    assert "fast" in report
+    report = profiler.report(threshold=60)
+    assert "fast" not in report
+    assert "(1 smaller steps)" in report
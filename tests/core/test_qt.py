@@ -0,0 +1,16 @@
+from PySide6.QtCore import QPoint
+from PySide6.QtGui import QColor
+from pytest import raises
+
+from foundry.core import qt
+
+
+def test_qt_classes_are_cached():
+    assert qt.QPoint is QPoint
+    assert qt.QColor is QColor
+    assert vars(qt)["QPoint"] is QPoint
+
+
+def test_qt_unknown_class():
+    with raises(AttributeError):
+        qt.QWidget
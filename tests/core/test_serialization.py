@@ -0,0 +1,190 @@
+from functools import partial
+from multiprocessing import Pipe, Process
+
+from dill import dumps as dumps_dill
+from numpy import arange, array_equal, uint8, zeros
+from pytest import mark, raises
+
+from foundry.core import serialization
+from foundry.core.serialization import (
+    _DILLED,
+    PickledCallable,
+    _load_function,
+    _loaded_functions,
+    _pickled_functions,
+    dumps,
+    loads,
+)
+from foundry.core.shared_buffers import SHARED_MEMORY_THRESHOLD, _sent_blocks
+
+
+def _is_shared(data: bytes) -> bool:
+    return len(data) < SHARED_MEMORY_THRESHOLD
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+def test_round_trip():
+    value = {"a": [1, 2.0, "3"], "b": (None, True), "c": {4, 5}}
+    data = dumps(value)
+    assert not data[0] & _DILLED
+    assert loads(data) == value
+
+
+@mark.parametrize(
+    "value",
+    [bytes(SHARED_MEMORY_THRESHOLD), bytearray(range(256)) * (SHARED_MEMORY_THRESHOLD // 256)],
+    ids=["bytes", "bytearray"],
+)
+def test_round_trip_buffer(value):
+    data = dumps({"value": value})
+    assert _is_shared(data)
+    result = loads(data)["value"]
+    assert type(result) is type(value)
+    assert result == value
+
+
+def test_small_buffers_are_not_shared():
+    assert len(dumps(bytes(SHARED_MEMORY_THRESHOLD - 64))) > SHARED_MEMORY_THRESHOLD - 64
+    assert array_equal(loads(dumps(zeros(16, uint8))), zeros(16, uint8))
+
+
+def test_round_trip_array():
+    value = arange(SHARED_MEMORY_THRESHOLD, dtype=">i4").reshape((-1, 16))
+    data = dumps(value)
+    assert _is_shared(data)
+    result = loads(data)
+    assert result.dtype == value.dtype
+    assert array_equal(result, value)
+
+
+def test_round_trip_non_contiguous_array():
+    value = arange(SHARED_MEMORY_THRESHOLD, dtype="u4").reshape((-1, 16))[:, ::2]
+    assert array_equal(loads(dumps(value)), value)
+
+
+def test_round_trip_image(qtbot):
+    from PySide6.QtGui import QColor, QImage
+
+    image = QImage(512, 256, QImage.Format.Format_RGB32)
+    image.fill(QColor(12, 34, 56))
+    data = dumps(image)
+    assert _is_shared(data)
+    assert loads(data) == image
+
+
+def test_function_by_reference():
+    data = dumps(add)
+    assert _pickled_functions[add] is None
+    assert loads(data) is add
+
+
+def test_closure_is_pickled_once():
+    offset = 3
+
+    def add_offset(value: int) -> int:
+        return value + offset
+
+    data = dumps(add_offset)
+    assert not data[0] & _DILLED
+    assert _pickled_functions[add_offset] is not None
+    assert dumps(add_offset) == data
+
+    result = loads(data)
+    assert result(1) == 4
+    assert loads(dumps(add_offset)) is result
+    _loaded_functions.clear()
+
+
+def test_large_closure_is_not_kept():
+    captured = bytes(SHARED_MEMORY_THRESHOLD)
+
+    def count() -> int:
+        return len(captured)
+
+    assert loads(dumps(count))() == SHARED_MEMORY_THRESHOLD
+    assert not _loaded_functions.functions
+
+
+def test_loaded_functions_are_bounded_by_size(monkeypatch):
+    pickled = [dumps_dill(partial(add, value)) for value in range(4)]
+    monkeypatch.setattr(serialization, "FUNCTION_CACHE_SIZE", sum(map(len, pickled[:2])))
+    try:
+        functions = [_load_function(data) for data in pickled]
+        assert _load_function(pickled[3]) is functions[3]
+        assert _load_function(pickled[0]) is not functions[0]
+        assert _loaded_functions.size <= serialization.FUNCTION_CACHE_SIZE
+        assert len(_loaded_functions.functions) == 2
+    finally:
+        _loaded_functions.clear()
+
+
+def test_main_module_is_pickled_by_value():
+    namespace: dict = {"__name__": "__main__"}
+    exec("def main_function(value):\n    return value * 2", namespace)
+    main_function = namespace["main_function"]
+    data = dumps(main_function)
+    assert _pickled_functions[main_function] is not None
+    assert loads(data)(2) == 4
+    _loaded_functions.clear()
+
+    main_class = type("MainClass", (), {"__module__": "__main__"})
+    assert dumps(main_class())[0] & _DILLED
+
+
+def test_dill_fallback():
+    class Local:
+        def __init__(self, value: int):
+            self.value = value
+
+    data = dumps(Local(5))
+    assert data[0] & _DILLED
+    assert loads(data).value == 5
+
+
+def test_not_a_pickle():
+    from pickle import PicklingError
+
+    def generator():
+        yield 1
+
+    with raises(PicklingError):
+        dumps(generator())
+
+
+def _send_array(connection):
+    connection.send_bytes(dumps(arange(SHARED_MEMORY_THRESHOLD, dtype="u2")))
+    connection.recv_bytes()
+
+
+def test_send_between_processes():
+    receiver, sender = Pipe()
+    process = Process(target=_send_array, args=(sender,))
+    process.start()
+    try:
+        result = loads(receiver.recv_bytes())
+        assert array_equal(result, arange(SHARED_MEMORY_THRESHOLD, dtype="u2"))
+    finally:
+        receiver.send_bytes(b"")
+        process.join()
+    assert process.exitcode == 0
+
+
+def test_pickled_callable_is_forwarded_untouched():
+    function = PickledCallable.from_callable(partial(add, arange(SHARED_MEMORY_THRESHOLD, dtype="u2")))
+    assert function.__name__ == "partial"
+    sent_blocks = len(_sent_blocks)
+
+    forwarded = loads(dumps(function))
+    data = dumps(forwarded)
+    assert forwarded.data == function.data
+    assert len(_sent_blocks) == sent_blocks
+    assert array_equal(loads(data)(1), arange(SHARED_MEMORY_THRESHOLD, dtype="u2") + 1)
+
+
+def test_pickled_callable_keeps_name():
+    function = PickledCallable.from_callable(add)
+    assert (function.__module__, function.__name__, function.__qualname__) == (__name__, "add", "add")
+    assert loads(dumps(function))(1, 2) == 3
@@ -0,0 +1,94 @@
+from gc import collect
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from subprocess import run
+from sys import executable
+from time import sleep, time
+
+from pytest import mark, raises
+
+from foundry.core.shared_buffers import (
+    SHARED_MEMORY_THRESHOLD,
+    SharedBuffer,
+    _received_blocks,
+    _sent_blocks,
+    discard,
+    receive,
+    release_shared_buffers,
+    share,
+)
+
+
+def test_small_buffers_are_not_shared():
+    assert share(memoryview(bytes(SHARED_MEMORY_THRESHOLD - 1))) is None
+
+
+def test_receive():
+    value = bytes(range(256)) * (SHARED_MEMORY_THRESHOLD // 256)
+    buffer = share(memoryview(value))
+    assert buffer == SharedBuffer(buffer.name, len(value))
+    assert receive(buffer).tobytes() == value
+
+
+def test_received_buffer_is_released():
+    result = receive(share(memoryview(bytes(SHARED_MEMORY_THRESHOLD))))
+    block = _received_blocks[-1][1]
+    del result
+    collect()
+    release_shared_buffers()
+    assert all(received is not block for _, received in _received_blocks)
+
+
+def test_sent_block_is_released_once_received():
+    buffer = share(memoryview(bytes(SHARED_MEMORY_THRESHOLD)))
+    block = _sent_blocks[-1]
+
+    release_shared_buffers()
+    assert block in _sent_blocks
+
+    receive(buffer)
+    release_shared_buffers()
+    assert block not in _sent_blocks
+    with raises(FileNotFoundError):
+        SharedMemory(buffer.name)
+
+
+def test_discard():
+    buffer = share(memoryview(bytes(SHARED_MEMORY_THRESHOLD)))
+    discard(buffer)
+    assert all(block.name != buffer.name for block in _sent_blocks)
+    with raises(FileNotFoundError):
+        receive(buffer)
+
+
+_LEAKED_BLOCK = """
+from multiprocessing import Pipe, Process
+from os import _exit
+
+from foundry.core.shared_buffers import SHARED_MEMORY_THRESHOLD, share, start_resource_tracker
+
+
+def send(connection):
+    connection.send(share(memoryview(bytes(SHARED_MEMORY_THRESHOLD))).name)
+    _exit(0)  # Like every forked process, the exit handlers are not ran.
+
+
+start_resource_tracker()
+receiver, sender = Pipe()
+process = Process(target=send, args=(sender,))
+process.start()
+print(receiver.recv())
+process.join()
+"""
+
+
+@mark.skipif(not Path("/dev/shm").is_dir(), reason="Shared memory blocks are not files")
+def test_unreceived_block_of_forked_process_is_removed():
+    result = run([executable, "-c", _LEAKED_BLOCK], capture_output=True, text=True, check=True)
+    name = result.stdout.strip()
+    # The resource tracker removes the block shortly after every process which shares it exits.
+    deadline = time() + 10
+    while Path("/dev/shm", name).exists() and time() < deadline:
+        sleep(0.05)
+    with raises(FileNotFoundError):
+        SharedMemory(name)
@@ -1,7 +1,7 @@
 from hypothesis import given
-from hypothesis.strategies import composite, integers, lists
+from hypothesis.strategies import binary, composite, integers, lists
 
-from foundry.core.UndoController import UndoController
+from foundry.core.UndoController import ByteDelta, DeltaUndoController, UndoController
 
 
 @composite
@@ -114,3 +114,59 @@ def test_undo_redo_same_result(controller: UndoController):
     controller.undo()
     controller.redo()
     assert initial_state == controller.state
+
+
+def delta_undo_controller(initial_state: bytes = b"", memory_budget: int | None = None) -> DeltaUndoController:
+    return DeltaUndoController(
+        initial_state, ByteDelta.from_bytes, lambda source, delta: delta.apply(source), memory_budget=memory_budget
+    )
+
+
+@given(binary(), binary())
+def test_byte_delta_round_trip(source: bytes, target: bytes):
+    assert target == ByteDelta.from_bytes(source, target).apply(source)
+
+
+def test_byte_delta_only_stores_difference():
+    source = bytes(range(100))
+    target = bytearray(source)
+    target[50] = 0xFF
+
+    assert 1 == len(ByteDelta.from_bytes(source, target))
+
+
+@given(lists(binary(), min_size=1))
+def test_delta_undo_redo_all_states(states: list[bytes]):
+    controller = delta_undo_controller()
+    for state in states:
+        controller.do(state)
+
+    for state in reversed([b""] + states[:-1]):
+        assert state == controller.undo()
+    assert not controller.can_undo
+
+    for state in states:
+        assert state == controller.redo()
+    assert not controller.can_redo
+
+
+def test_delta_do_clears_redo():
+    controller = delta_undo_controller(b"0")
+    controller.do(b"1")
+    controller.undo()
+    controller.do(b"2")
+
+    assert not controller.can_redo
+    assert 1 == controller.history_size
+
+
+def test_delta_memory_budget_forgets_oldest():
+    controller = delta_undo_controller(b"0", memory_budget=2)
+    controller.do(b"a")
+    controller.do(b"b")
+    controller.do(b"c")
+
+    assert controller.history_size <= 2
+    assert b"b" == controller.undo()
+    assert b"a" == controller.undo()
+    assert not controller.can_undo
@@ -99,3 +99,99 @@ def test_level_insert_in_vertical_level(level: Level) -> None:
     assert added_object.domain == 0
     assert added_object.obj_index == 0
     assert added_object.rendered_position == Point(0, LEVEL_DEFAULT_HEIGHT * 2)
+
+
+def _serialized_sizes(level: Level) -> tuple[int, int]:
+    (_, object_data), (_, enemy_data) = level.to_bytes()
+
+    # without the header and the delimiters
+    return len(object_data) - Level.HEADER_LENGTH - 1, len(enemy_data) - 1
+
+
+@pytest.mark.parametrize(
+    "method, params",
+    [("add_object", (0, 0, Point(0, 0), None)), ("add_enemy", (0, Point(0, 0))), ("add_jump", tuple())],
+)
+def test_size_follows_additions(level: Level, method, params) -> None:
+    # GIVEN a level
+    pass
+
+    # WHEN you add an object
+    getattr(level, method)(*params)
+
+    # THEN the running sizes match the serialized level
+    assert (level.object_size, level.enemies_size) == _serialized_sizes(level)
+
+
+def test_size_follows_removals(level: Level) -> None:
+    # GIVEN a level
+    pass
+
+    # WHEN you remove an object, an enemy and a jump
+    level.remove_object(level.objects[0])
+    level.remove_object(level.enemies[0])
+    level.remove_jump(level.jumps[0])
+
+    # THEN the running sizes match the serialized level
+    assert (level.object_size, level.enemies_size) == _serialized_sizes(level)
+
+
+def test_size_follows_inserted_enemy(level: Level) -> None:
+    # GIVEN a level
+    enemy = level.enemy_item_factory.from_properties(0, Point(0, 0))
+
+    # WHEN an enemy is inserted at the start and removed again
+    level.insert_enemy(0, enemy)
+    inserted_sizes = (level.object_size, level.enemies_size) == _serialized_sizes(level)
+    level.remove_object(enemy)
+
+    # THEN the running sizes match the serialized level each time
+    assert inserted_sizes
+    assert all(other is not enemy for other in level.enemies)
+    assert (level.object_size, level.enemies_size) == _serialized_sizes(level)
+
+
+def test_batch_notifies_once(level: Level) -> None:
+    # GIVEN a level and a listener
+    notifications = []
+    level.data_changed.connect(lambda: notifications.append(True))
+
+    # WHEN several edits are made inside a batch
+    with level.batch():
+        level.add_object(0, 0, Point(0, 0), None)
+        level.add_jump()
+        level.remove_jump(level.jumps[0])
+
+    # THEN the listener is only notified once, after the batch
+    assert len(notifications) == 1
+
+
+def test_remove_objects(level: Level) -> None:
+    # GIVEN a level
+    removed = [level.objects[0], level.objects[1], level.enemies[0]]
+    object_count, enemy_count = len(level.objects), len(level.enemies)
+
+    # WHEN several objects are removed at once
+    level.remove_objects(removed)
+
+    # THEN exactly those objects are gone and the sizes are still correct
+    assert {id(obj) for obj in removed}.isdisjoint(id(obj) for obj in level.get_all_objects())
+    assert (len(level.objects), len(level.enemies)) == (object_count - 2, enemy_count - 1)
+    assert (level.object_size, level.enemies_size) == _serialized_sizes(level)
+
+
+def test_patch_from_bytes_keeps_unchanged_objects(level: Level) -> None:
+    # GIVEN a level and its state
+    state = level.to_bytes()
+    kept_object, removed_object = level.objects[1], level.objects[0]
+    kept_object.selected = True
+
+    # WHEN an object is removed and the state is restored
+    level.remove_object(removed_object)
+    level.patch_from_bytes(*state)
+
+    # THEN the level is back in its old state, without recreating the untouched objects
+    assert state == level.to_bytes()
+    assert level.objects[1] is kept_object
+    assert level.objects[1].selected
+    assert (level.object_size, level.enemies_size) == _serialized_sizes(level)
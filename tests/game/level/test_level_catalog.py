@@ -0,0 +1,58 @@
+from foundry.game.level.util import (
+    DisplayInformation,
+    Level,
+    LevelCatalog,
+    Location,
+    find_level_by_pointers,
+    get_world_levels,
+)
+
+
+def _level(name: str, generator_pointer: int, enemy_pointer: int, *locations: Location, tileset: int = 1) -> Level:
+    return Level(DisplayInformation(name, None, list(locations)), generator_pointer, enemy_pointer, tileset, 0, 0)
+
+
+LEVELS = [
+    _level("World 1", 0x100, 0x10, Location(1, 0), tileset=0),
+    _level("1-1", 0x300, 0x30, Location(1, 1)),
+    _level("1-2", 0x200, 0x20, Location(1, 2)),
+    _level("1-1 copy", 0x300, 0x40, Location(1, 1)),
+]
+
+
+def test_pointer_indexes_match_linear_search():
+    catalog = LevelCatalog(LEVELS)
+
+    for level in LEVELS:
+        assert catalog.by_generator_pointer[level.generator_pointer] is next(
+            other for other in LEVELS if other.generator_pointer == level.generator_pointer
+        )
+        assert catalog.by_enemy_pointer[level.enemy_pointer] is find_level_by_pointers(
+            LEVELS, level.generator_pointer, level.enemy_pointer
+        )
+
+
+def test_location_index_matches_world_levels():
+    catalog = LevelCatalog(LEVELS)
+
+    assert [catalog.by_location[1, index] for index in range(3)] == get_world_levels(1, LEVELS)
+    assert catalog.worlds == 1
+
+
+def test_level_before_address():
+    catalog = LevelCatalog(LEVELS)
+
+    assert catalog.level_before_generator_address(0xFF) is None
+    assert catalog.level_before_generator_address(0x100) is LEVELS[0]
+    assert catalog.level_before_generator_address(0x2FF) is LEVELS[2]
+    assert catalog.level_before_enemy_address(0x35) is LEVELS[1]
+    assert catalog.level_before_enemy_address(0x1000) is LEVELS[3]
+
+
+def test_is_catalog_of_compares_levels_by_identity():
+    catalog = LevelCatalog(LEVELS)
+
+    assert catalog.is_catalog_of(LEVELS)
+    assert catalog.is_catalog_of(list(LEVELS))
+    assert not catalog.is_catalog_of(LEVELS[:-1])
+    assert not catalog.is_catalog_of([*LEVELS[:-1], _level("1-1 copy", 0x300, 0x40, Location(1, 1))])
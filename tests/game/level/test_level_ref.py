@@ -0,0 +1,150 @@
+import pytest
+
+from foundry.core.geometry import Point
+from foundry.core.UndoController import DeltaUndoController
+from foundry.game.level.LevelRef import (
+    LEVEL_DELTA_OVERHEAD,
+    LevelRef,
+    apply_level_difference,
+    level_difference,
+    level_difference_size,
+)
+from foundry.smb3parse.objects.tileset import PLAINS_OBJECT_SET
+from tests.conftest import level_1_1_enemy_address, level_1_1_object_address
+
+
+@pytest.fixture
+def level_ref(rom_singleton, qtbot):
+    level_ref = LevelRef()
+    level_ref.load_level("Level 1-1", level_1_1_object_address, level_1_1_enemy_address, PLAINS_OBJECT_SET)
+    return level_ref
+
+
+def test_small_edits_are_evicted_from_history() -> None:
+    # GIVEN an undo history with a budget of a few undo entries
+    budget = 10 * LEVEL_DELTA_OVERHEAD
+    controller = DeltaUndoController(
+        ((0, bytes(100)), (0, bytes(100))), level_difference, apply_level_difference, level_difference_size, budget
+    )
+
+    # WHEN many edits changing a single byte are made
+    for value in range(1000):
+        controller.do(((0, bytes([value % 256]) + bytes(99)), (0, bytes(100))))
+
+    # THEN the oldest entries are forgotten to stay within the budget
+    assert controller.history_size <= budget
+    assert len(controller.undo_stack) < 10
+
+
+def test_batch_is_one_undo_entry(level_ref: LevelRef) -> None:
+    # GIVEN a level
+    state = level_ref.state
+
+    # WHEN several objects are added inside a batch
+    with level_ref.batch() as level:
+        level.add_object(0, 0, Point(0, 0), None)
+        level.add_enemy(0x72, Point(1, 1))
+
+    # THEN a single undo restores the original state
+    assert level_ref.undo() == state
+    assert not level_ref.can_undo
+
+
+def test_failed_batch_is_discarded(level_ref: LevelRef) -> None:
+    # GIVEN a level
+    state = level_ref.state
+
+    # WHEN a batch raises an exception after some edits
+    with pytest.raises(ValueError):
+        with level_ref.batch() as level:
+            level.add_object(0, 0, Point(0, 0), None)
+            raise ValueError
+
+    # THEN the edits are reverted and no undo entry is saved
+    assert level_ref.level.to_bytes() == state
+    assert not level_ref.can_undo
+
+
+def test_batch_serializes_level_once(level_ref: LevelRef, monkeypatch) -> None:
+    # GIVEN a level which counts how often it is serialized
+    level = level_ref.level
+    to_bytes = level.to_bytes
+    calls = []
+    monkeypatch.setattr(level, "to_bytes", lambda: calls.append(True) or to_bytes())
+
+    # WHEN an object is added inside a batch
+    with level_ref.batch():
+        level.add_object(0, 0, Point(0, 0), None)
+
+    # THEN the level is only serialized to save its new state
+    assert len(calls) == 1
+
+
+def test_failed_batch_during_gesture_keeps_earlier_edits(level_ref: LevelRef) -> None:
+    # GIVEN a level and an object moved during a gesture, which was not saved yet
+    level_object = level_ref.level.objects[0]
+    level_ref.begin_gesture()
+    level_ref.level.move_objects([level_object], Point(1, 0))
+    level_ref.save_level_state()
+    moved_state = level_ref.level.to_bytes()
+
+    # WHEN a batch raises an exception after moving the object again
+    with pytest.raises(ValueError):
+        with level_ref.batch() as level:
+            level.move_objects([level_object], Point(1, 0))
+            raise ValueError
+
+    # THEN only the edits of the batch are reverted
+    assert level_ref.level.to_bytes() == moved_state
+    level_ref.end_gesture()
+    assert level_ref.state == moved_state
+
+
+def test_gesture_is_one_undo_entry(level_ref: LevelRef) -> None:
+    # GIVEN a level and an object
+    state = level_ref.state
+    level_object = level_ref.level.objects[0]
+
+    # WHEN the object is moved several times during a gesture
+    with level_ref.gesture() as level:
+        for _ in range(3):
+            level.move_objects([level_object], Point(1, 0))
+            level_ref.save_level_state()
+
+    # THEN a single undo restores the original state
+    assert level_ref.state != state
+    assert level_ref.undo() == state
+    assert not level_ref.can_undo
+
+
+def test_undo_ends_open_gesture(level_ref: LevelRef) -> None:
+    # GIVEN a level and an object moved during a gesture, which was not ended yet
+    state = level_ref.state
+    interruptions = []
+    level_ref.gestures_interrupted.connect(lambda: interruptions.append(True))
+    level_ref.begin_gesture()
+    level_ref.level.move_objects([level_ref.level.objects[0]], Point(1, 0))
+    level_ref.save_level_state()
+
+    # WHEN the move is undone and the gesture is ended late
+    level_ref.undo()
+    level_ref.end_gesture()
+
+    # THEN the move was saved before it was undone and can be redone
+    assert interruptions == [True]
+    assert not level_ref.in_gesture
+    assert level_ref.level.to_bytes() == state
+    assert level_ref.can_redo
+
+
+def test_undo_keeps_unchanged_objects(level_ref: LevelRef) -> None:
+    # GIVEN a level
+    kept_object = level_ref.level.objects[1]
+
+    # WHEN an object is removed and the removal is undone
+    with level_ref.batch() as level:
+        level.remove_object(level.objects[0])
+    level_ref.undo()
+
+    # THEN the untouched object is still the same instance
+    assert level_ref.level.objects[1] is kept_object
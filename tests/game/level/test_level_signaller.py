@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+from foundry.game.level.Level import HeadlessLevelSignaller
+
+
+def test_headless_level_signaller_emits_to_slots():
+    signaller = HeadlessLevelSignaller()
+    calls = []
+    signaller.data_changed.connect(lambda: calls.append("data"))
+    signaller.jumps_changed.connect(lambda: calls.append("jumps"))
+
+    signaller.data_changed.emit()
+    signaller.jumps_changed.emit()
+
+    assert calls == ["data", "jumps"]
+
+
+def test_headless_level_signaller_blocks_signals():
+    signaller = HeadlessLevelSignaller()
+    calls = []
+    signaller.data_changed.connect(lambda: calls.append("data"))
+
+    assert not signaller.blockSignals(True)
+    signaller.data_changed.emit()
+    assert signaller.blockSignals(False)
+    signaller.data_changed.emit()
+
+    assert calls == ["data"]
+
+
+def test_level_model_does_not_import_qt():
+    script = (
+        "import sys\n"
+        "import foundry.game.level.Level\n"
+        "from foundry.game.level.Level import create_level_signaller\n"
+        "create_level_signaller()\n"
+        "print(any(name.startswith('PySide6') for name in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,110 @@
+from json import dumps
+
+from foundry import tileset_definitions
+from foundry.game.Definitions import (
+    DefinitionCache,
+    OverlayItem,
+    OverlayType,
+    classify_overlay,
+)
+from foundry.game.EnemyDefinitions import EnemyDefinition
+from foundry.game.ObjectDefinitions import (
+    Tileset,
+    TilesetDefinition,
+    get_object_metadata,
+    get_tileset_metadata,
+)
+
+
+def _definition(description: str) -> dict:
+    return {
+        "description": description,
+        "domain": 0,
+        "min_value": 0,
+        "max_value": 0,
+        "bmp_width": 1,
+        "bmp_height": 1,
+        "blocks": [1],
+        "orientation": 0,
+        "ending": 0,
+    }
+
+
+def test_cache_matches_json(tmp_path):
+    definitions = DefinitionCache(tileset_definitions, lambda data: Tileset(__root__=data), tmp_path)
+    cached_definitions = DefinitionCache(tileset_definitions, lambda data: Tileset(__root__=data), tmp_path)
+
+    assert definitions.cache_path.exists()
+    assert list(cached_definitions) == list(definitions)
+
+
+def test_cache_loads_lazily(tmp_path):
+    source = tmp_path / "definitions.json"
+    source.write_text(dumps([_definition("a"), _definition("b")]))
+    DefinitionCache(source, TilesetDefinition.parse_obj, tmp_path)
+
+    definitions = DefinitionCache(source, TilesetDefinition.parse_obj, tmp_path)
+
+    assert len(definitions) == 2
+    assert definitions._definitions == [None, None]
+    assert definitions[1].description == "b"
+    assert definitions._definitions[0] is None
+
+
+def test_cache_is_rebuilt_when_json_changes(tmp_path):
+    source = tmp_path / "definitions.json"
+    source.write_text(dumps([_definition("a")]))
+    DefinitionCache(source, TilesetDefinition.parse_obj, tmp_path)
+
+    source.write_text(dumps([_definition("b")]))
+    definitions = DefinitionCache(source, TilesetDefinition.parse_obj, tmp_path)
+
+    assert [definition.description for definition in definitions] == ["b"]
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    source = tmp_path / "definitions.json"
+    source.write_text(dumps([_definition("a")]))
+    definitions = DefinitionCache(source, TilesetDefinition.parse_obj, tmp_path)
+    definitions.cache_path.write_bytes(b"corrupt")
+
+    definitions = DefinitionCache(source, TilesetDefinition.parse_obj, tmp_path)
+
+    assert [definition.description for definition in definitions] == ["a"]
+
+
+def test_tileset_metadata_is_shared():
+    assert get_tileset_metadata(1) is get_object_metadata().__root__[1]
+
+
+def test_classify_overlay():
+    assert classify_overlay("Pipe (can go left)") == (OverlayType.PIPE_LEFT, OverlayItem.NONE)
+    assert classify_overlay("Pipe (can go up)") == (OverlayType.PIPE_UP, OverlayItem.NONE)
+    assert classify_overlay("Door") == (OverlayType.DOOR, OverlayItem.NONE)
+    assert classify_overlay("Red invisible note block") == (OverlayType.NOTE, OverlayItem.NONE)
+    assert classify_overlay("'?' with continuous star") == (OverlayType.ITEM_BLOCK, OverlayItem.CONTINUOUS_STAR)
+    assert classify_overlay("Brick with multi-coin") == (OverlayType.ITEM_BLOCK, OverlayItem.MULTI_COIN)
+    assert classify_overlay("Invisible 1-up") == (OverlayType.INVISIBLE_ITEM, OverlayItem.ONE_UP)
+    assert classify_overlay("Silver coins (appear when you hit a P-switch)") == (
+        OverlayType.SILVER_COINS,
+        OverlayItem.NONE,
+    )
+    assert classify_overlay("Goomba") == (OverlayType.NONE, OverlayItem.NONE)
+
+
+def test_definitions_are_classified():
+    definition = TilesetDefinition.parse_obj(_definition("'?' with leaf"))
+
+    assert definition.overlay_type == OverlayType.ITEM_BLOCK
+    assert definition.overlay_item == OverlayItem.LEAF
+
+
+def test_explicit_overlay_is_kept():
+    definition = TilesetDefinition.parse_obj(_definition("'?' with leaf") | {"overlay_type": OverlayType.NONE})
+
+    assert definition.overlay_type == OverlayType.NONE
+
+
+def test_only_invisible_doors_have_enemy_overlays():
+    assert EnemyDefinition(description="Invisible door").overlay_type == OverlayType.DOOR
+    assert EnemyDefinition(description="Silver coins").overlay_type == OverlayType.NONE
@@ -0,0 +1,29 @@
+from foundry.core.palette import (
+    COLORS_PER_PALETTE,
+    PALETTES_PER_PALETTES_GROUP,
+    PaletteGroup,
+    get_internal_palette_offset,
+)
+from foundry.game.File import ROM
+
+
+def test_from_tileset_is_cached():
+    assert PaletteGroup.from_tileset(1, 0) is PaletteGroup.from_tileset(1, 0)
+
+
+def test_from_tileset_is_refreshed_after_write():
+    rom = ROM()
+    palette_group = PaletteGroup.from_tileset(1, 0)
+    offset = get_internal_palette_offset(1)
+    original = rom.read(offset, PALETTES_PER_PALETTES_GROUP * COLORS_PER_PALETTE)
+
+    try:
+        rom.write(offset, bytes([(original[0] + 1) & 0x3F]))
+        updated_palette_group = PaletteGroup.from_tileset(1, 0)
+
+        assert updated_palette_group is not palette_group
+        assert updated_palette_group[0, 0] == (original[0] + 1) & 0x3F
+    finally:
+        rom.write(offset, bytes(original))
+
+    assert PaletteGroup.from_tileset(1, 0) == palette_group
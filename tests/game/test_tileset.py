@@ -0,0 +1,30 @@
+from foundry.game.ObjectDefinitions import EndType, GeneratorType
+from foundry.game.Tileset import Tileset, get_tileset
+from foundry.smb3parse.objects.tileset import PLAINS_OBJECT_SET, UNDERGROUND_OBJECT_SET
+
+
+def test_get_tileset_is_shared():
+    assert get_tileset(PLAINS_OBJECT_SET) is get_tileset(PLAINS_OBJECT_SET)
+    assert get_tileset(PLAINS_OBJECT_SET) is not get_tileset(UNDERGROUND_OBJECT_SET)
+
+
+def test_tables_match_definitions():
+    tileset = Tileset(PLAINS_OBJECT_SET)
+
+    for object_type, definition in enumerate(tileset.definitions.__root__):
+        assert tileset.orientations[object_type] == GeneratorType(definition.orientation)
+        assert tileset.endings[object_type] == EndType(definition.ending)
+        assert tileset.names[object_type] == definition.description
+        assert tileset.blocks[object_type] == definition.blocks
+        assert tileset.sizes[object_type] == definition.size
+
+
+def test_object_byte_length():
+    tileset = get_tileset(PLAINS_OBJECT_SET)
+
+    for domain in range(8):
+        for object_id in range(0x100):
+            object_type = tileset.object_type(domain, object_id)
+            if object_type < len(tileset.definitions.__root__):
+                expected = 4 if tileset.get_definition_of(object_type).is_4byte else 3
+                assert tileset.get_object_byte_length(domain, object_id) == expected
@@ -0,0 +1,32 @@
+from foundry.core.drawable import BLOCKS_PER_TSA_TABLE, Block
+from foundry.core.geometry import Point
+from foundry.game.File import ROM
+
+
+def test_tsa_table_matches_tsa_data():
+    tsa_data = ROM.get_tsa_data(1)
+    blocks = Block.tsa_table(1)
+
+    assert len(blocks) == BLOCKS_PER_TSA_TABLE
+    assert blocks == tuple(Block.from_tsa(Point(0, 0), index, tsa_data) for index in range(BLOCKS_PER_TSA_TABLE))
+
+
+def test_tsa_table_is_cached():
+    assert Block.tsa_table(1) is Block.tsa_table(1)
+
+
+def test_tsa_table_is_refreshed_after_write_tsa_data():
+    original = ROM.get_tsa_data(1)
+    blocks = Block.tsa_table(1)
+
+    try:
+        tsa_data = original.copy()
+        tsa_data[0] = (tsa_data[0] + 1) & 0xFF
+        ROM.write_tsa_data(1, tsa_data)
+
+        assert Block.tsa_table(1) is not blocks
+        assert Block.tsa_table(1)[0].patterns[0] == tsa_data[0]
+    finally:
+        ROM.write_tsa_data(1, original)
+
+    assert Block.tsa_table(1) == blocks
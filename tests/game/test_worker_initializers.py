@@ -0,0 +1,22 @@
+from multiprocessing import get_context
+
+from foundry.game.File import ROM
+from foundry.game.WorkerInitializers import default_initializers
+
+
+def _run_initializers(initializers, rom_data: bytes) -> None:
+    for initializer in initializers:
+        initializer()
+    assert ROM.rom_data == rom_data
+
+    from foundry.gui.LevelDrawer import level_images
+
+    assert level_images is not None
+
+
+def test_default_initializers_run_without_an_application(rom_singleton):
+    # A spawned process does not inherit the application of the tests, like a worker.
+    process = get_context("spawn").Process(target=_run_initializers, args=(default_initializers(), bytes(ROM.rom_data)))
+    process.start()
+    process.join(60)
+    assert process.exitcode == 0